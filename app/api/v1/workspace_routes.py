@@ -1,10 +1,16 @@
 import logging
 import math
 
+import orjson
 from fastapi import APIRouter, Depends, Query
+from fastapi.responses import StreamingResponse
 
 from app.core.dependencies import CurrentUserDep, WorkspaceDataServiceDep
-from app.dtos.workspace_dtos import PaginationParamsDTO
+from app.dtos.workspace_dtos import (
+    ConnectionSettingsDTO,
+    PaginationParamsDTO,
+    WorkspaceStatsDTO,
+)
 from app.schemas.common import (
     ApiResponse,
     PaginationResponse,
@@ -22,6 +28,7 @@ from app.schemas.workspace import (
     GroupMemberItemResponse,
     UserAppAuthorizationItemResponse,
     UserDetailResponse,
+    WorkspaceDashboardResponse,
     WorkspaceGroupListItemResponse,
     WorkspaceGroupsListResponse,
     WorkspaceStatsResponse,
@@ -34,18 +41,58 @@ logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/workspace", tags=["workspace"])
 
 
+def _to_stats_response(stats: WorkspaceStatsDTO) -> WorkspaceStatsResponse:
+    return WorkspaceStatsResponse(
+        total_users=stats.total_users,
+        total_groups=stats.total_groups,
+        total_apps=stats.total_apps,
+        active_authorizations=stats.active_authorizations,
+        last_sync_at=stats.last_sync_at,
+    )
+
+
+def _to_settings_response(
+    settings_dto: ConnectionSettingsDTO,
+) -> ConnectionSettingsResponse:
+    connection_info = None
+    if settings_dto.connection_id:
+        connection_info = ConnectionInfoResponse(
+            connection_id=settings_dto.connection_id,
+            status=settings_dto.status,
+            admin_email=settings_dto.admin_email,
+            workspace_domain=settings_dto.workspace_domain,
+            last_sync_completed_at=settings_dto.last_sync_completed_at,
+            last_sync_status=settings_dto.last_sync_status,
+        )
+
+    return ConnectionSettingsResponse(
+        connection=connection_info,
+        can_sync=settings_dto.can_sync,
+        is_syncing=settings_dto.is_syncing,
+    )
+
+
 @router.get("/stats", response_model=ApiResponse)
 async def get_workspace_stats(
     current_user: CurrentUserDep,
     service: WorkspaceDataServiceDep,
 ):
     stats = await service.get_workspace_stats(current_user.organization_id)
-    response = WorkspaceStatsResponse(
-        total_users=stats.total_users,
-        total_groups=stats.total_groups,
-        total_apps=stats.total_apps,
-        active_authorizations=stats.active_authorizations,
-        last_sync_at=stats.last_sync_at,
+    response = _to_stats_response(stats)
+    return create_success_response(data=response.model_dump(mode="json"))
+
+
+@router.get("/dashboard", response_model=ApiResponse)
+async def get_workspace_dashboard(
+    current_user: CurrentUserDep,
+    service: WorkspaceDataServiceDep,
+):
+    stats, settings_dto = await service.get_dashboard_bundle(
+        current_user.organization_id
+    )
+    response = WorkspaceDashboardResponse(
+        stats=_to_stats_response(stats),
+        settings=_to_settings_response(settings_dto),
     )
     return create_success_response(data=response.model_dump(mode="json"))
 
@@ -287,9 +334,10 @@ async def get_app_timeline(
     page: int = Query(1, ge=1),
     page_size: int = Query(25, ge=1, le=100),
     user_id: int | None = Query(None),
+    cursor: str | None = Query(None),
 ):
-    params = PaginationParamsDTO(page=page, page_size=page_size)
-    events, total = await service.get_app_timeline(
+    params = PaginationParamsDTO(page=page, page_size=page_size, cursor=cursor)
+    events, total, next_cursor = await service.get_app_timeline(
         current_user.organization_id, app_id, params, user_id
     )
     
@@ -303,34 +351,35 @@ async def get_app_timeline(
     return create_success_response(
         data={
             "items": [e.model_dump(mode="json") for e in events],
-            "pagination": pagination.model_dump(mode="json") 
+            "pagination": pagination.model_dump(mode="json"),
+            "next_cursor": next_cursor,
         }
     )
 
 
+@router.get("/apps/{app_id}/timeline/export")
+async def export_app_timeline(
+    app_id: int,
+    current_user: CurrentUserDep,
+    service: WorkspaceDataServiceDep,
+    user_id: int | None = Query(None),
+):
+    async def stream_ndjson():
+        async for event in service.stream_app_timeline(
+            current_user.organization_id, app_id, user_id
+        ):
+            yield orjson.dumps(event.model_dump()) + b"\n"
+
+    return StreamingResponse(stream_ndjson(), media_type="application/x-ndjson")
+
+
 @router.get("/settings", response_model=ApiResponse)
 async def get_connection_settings(
     current_user: CurrentUserDep,
     service: WorkspaceDataServiceDep,
 ):
     settings_dto = await service.get_connection_settings(current_user.organization_id)
-
-    connection_info = None
-    if settings_dto.connection_id:
-        connection_info = ConnectionInfoResponse(
-            connection_id=settings_dto.connection_id,
-            status=settings_dto.status,
-            admin_email=settings_dto.admin_email,
-            workspace_domain=settings_dto.workspace_domain,
-            last_sync_completed_at=settings_dto.last_sync_completed_at,
-            last_sync_status=settings_dto.last_sync_status,
-        )
-
-    response = ConnectionSettingsResponse(
-        connection=connection_info,
-        can_sync=settings_dto.can_sync,
-        is_syncing=settings_dto.is_syncing,
-    )
+    response = _to_settings_response(settings_dto)
     return create_success_response(data=response.model_dump(mode="json"))
 
 
@@ -14,6 +14,7 @@ class AuthErrorCode(str, Enum):
     ORGANIZATION_NOT_FOUND = "ORGANIZATION_NOT_FOUND"
     ORGANIZATION_SUSPENDED = "ORGANIZATION_SUSPENDED"
     ORGANIZATION_EXISTS = "ORGANIZATION_EXISTS"
+    ORGANIZATION_CREATION_FAILED = "ORGANIZATION_CREATION_FAILED"
     DOMAIN_MISMATCH = "DOMAIN_MISMATCH"
 
     PLAN_NOT_FOUND = "PLAN_NOT_FOUND"
@@ -44,6 +45,7 @@ AUTH_ERROR_MESSAGES: dict[AuthErrorCode, str] = {
     AuthErrorCode.ORGANIZATION_NOT_FOUND: "Organization not found.",
     AuthErrorCode.ORGANIZATION_SUSPENDED: "Your organization has been suspended.",
     AuthErrorCode.ORGANIZATION_EXISTS: "An organization already exists for this domain. Please contact your administrator for an invitation.",
+    AuthErrorCode.ORGANIZATION_CREATION_FAILED: "Failed to create organization.",
     AuthErrorCode.DOMAIN_MISMATCH: "Email domain does not match organization domain.",
     AuthErrorCode.PLAN_NOT_FOUND: "Subscription plan not found.",
     AuthErrorCode.ROLE_NOT_FOUND: "User role not found.",
@@ -1,4 +1,4 @@
-BLOCKED_EMAIL_DOMAINS: set[str] = {
+BLOCKED_EMAIL_DOMAINS: frozenset[str] = frozenset({
     "gmail.com",
     "googlemail.com",
     "outlook.com",
@@ -27,4 +27,4 @@ BLOCKED_EMAIL_DOMAINS: set[str] = {
     "fakeinbox.com",
     "sharklasers.com",
     "trashmail.com",
-}
+})
@@ -0,0 +1,61 @@
+from cachetools import TTLCache
+
+from app.models.identity_provider import IdentityProvider
+from app.models.plan import Plan
+from app.models.product_auth_config import ProductAuthConfig
+from app.models.role import Role
+from app.dtos.workspace_dtos import WorkspaceStatsDTO
+from app.schemas.user import UserResponse
+
+USER_RESPONSE_CACHE_TTL_SECONDS = 30
+USER_RESPONSE_CACHE_MAX_SIZE = 5000
+
+PROVIDER_CONFIG_CACHE_TTL_SECONDS = 300
+PROVIDER_CONFIG_CACHE_MAX_SIZE = 256
+
+WORKSPACE_STATS_CACHE_TTL_SECONDS = 30
+WORKSPACE_STATS_CACHE_MAX_SIZE = 1024
+
+user_response_cache: TTLCache[int, UserResponse] = TTLCache(
+    maxsize=USER_RESPONSE_CACHE_MAX_SIZE, ttl=USER_RESPONSE_CACHE_TTL_SECONDS
+)
+
+identity_provider_by_slug_cache: TTLCache[str, IdentityProvider] = TTLCache(
+    maxsize=PROVIDER_CONFIG_CACHE_MAX_SIZE, ttl=PROVIDER_CONFIG_CACHE_TTL_SECONDS
+)
+
+identity_provider_by_id_cache: TTLCache[int, IdentityProvider] = TTLCache(
+    maxsize=PROVIDER_CONFIG_CACHE_MAX_SIZE, ttl=PROVIDER_CONFIG_CACHE_TTL_SECONDS
+)
+
+auth_config_by_identity_provider_cache: TTLCache[int, ProductAuthConfig] = TTLCache(
+    maxsize=PROVIDER_CONFIG_CACHE_MAX_SIZE, ttl=PROVIDER_CONFIG_CACHE_TTL_SECONDS
+)
+
+plan_by_name_cache: TTLCache[str, Plan] = TTLCache(
+    maxsize=PROVIDER_CONFIG_CACHE_MAX_SIZE, ttl=PROVIDER_CONFIG_CACHE_TTL_SECONDS
+)
+
+role_by_name_cache: TTLCache[str, Role] = TTLCache(
+    maxsize=PROVIDER_CONFIG_CACHE_MAX_SIZE, ttl=PROVIDER_CONFIG_CACHE_TTL_SECONDS
+)
+
+plan_by_id_cache: TTLCache[int, Plan] = TTLCache(
+    maxsize=PROVIDER_CONFIG_CACHE_MAX_SIZE, ttl=PROVIDER_CONFIG_CACHE_TTL_SECONDS
+)
+
+role_by_id_cache: TTLCache[int, Role] = TTLCache(
+    maxsize=PROVIDER_CONFIG_CACHE_MAX_SIZE, ttl=PROVIDER_CONFIG_CACHE_TTL_SECONDS
+)
+
+workspace_stats_cache: TTLCache[int, WorkspaceStatsDTO] = TTLCache(
+    maxsize=WORKSPACE_STATS_CACHE_MAX_SIZE, ttl=WORKSPACE_STATS_CACHE_TTL_SECONDS
+)
+
+
+def invalidate_user_response(user_id: int) -> None:
+    user_response_cache.pop(user_id, None)
+
+
+def invalidate_workspace_stats(organization_id: int) -> None:
+    workspace_stats_cache.pop(organization_id, None)
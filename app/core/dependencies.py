@@ -1,10 +1,13 @@
 import logging
-from collections.abc import AsyncGenerator
-from typing import Annotated
+from collections.abc import AsyncGenerator, Callable
+from contextlib import AbstractAsyncContextManager, asynccontextmanager
+from functools import partial
+from typing import Annotated, Any
 
 import asyncpg
-from fastapi import Cookie, Depends, HTTPException, status
+from fastapi import Cookie, Depends, HTTPException, Request, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from rfernet import Fernet
 
 from app.core.security import token_service
 from app.core.settings import settings
@@ -26,8 +29,10 @@ from app.repositories.product_auth_config_repository import ProductAuthConfigRep
 from app.repositories.role_repository import RoleRepository
 from app.repositories.user_repository import UserRepository
 from app.repositories.workspace_group_repository import WorkspaceGroupRepository
+from app.repositories.workspace_stats_repository import WorkspaceStatsRepository
 from app.repositories.workspace_user_repository import WorkspaceUserRepository
 from app.services.auth_service import AuthService
+from app.services.crawl_history_writer import CrawlHistoryWriter
 from app.services.domain_validator_service import DomainValidatorService
 from app.services.integration_service import IntegrationService
 from app.services.snapshot_service import SnapshotService
@@ -36,6 +41,7 @@ from app.services.sync_manager import SyncManager
 from app.services.user_authentication_service import UserAuthenticationService
 from app.services.workspace_data_service import WorkspaceDataService
 from app.services.directory_service import DirectoryService
+from app.utils.crypto import get_fernet
 
 logger = logging.getLogger(__name__)
 
@@ -47,6 +53,13 @@ async def get_db_session() -> AsyncGenerator[asyncpg.Connection, None]:
         yield conn
 
 
+def get_db_transaction(
+    conn: asyncpg.Connection = Depends(get_db_session),
+) -> Callable[[], AbstractAsyncContextManager[Any]]:
+    # Repositories resolved in the same request share this connection
+    return conn.transaction
+
+
 def get_identity_provider_repository(
     conn: asyncpg.Connection = Depends(get_db_session),
 ) -> IdentityProviderRepository:
@@ -65,6 +78,14 @@ def get_identity_provider_connection_repository(
     return IdentityProviderConnectionRepository(conn)
 
 
+@asynccontextmanager
+async def pooled_identity_provider_connection_repository() -> AsyncGenerator[
+    IdentityProviderConnectionRepository, None
+]:
+    async with db_connection.get_connection() as conn:
+        yield IdentityProviderConnectionRepository(conn)
+
+
 def get_workspace_user_repository(
     conn: asyncpg.Connection = Depends(get_db_session),
 ) -> WorkspaceUserRepository:
@@ -77,6 +98,12 @@ def get_workspace_group_repository(
     return WorkspaceGroupRepository(conn)
 
 
+def get_workspace_stats_repository(
+    conn: asyncpg.Connection = Depends(get_db_session),
+) -> WorkspaceStatsRepository:
+    return WorkspaceStatsRepository(conn)
+
+
 def get_oauth_app_repository(
     conn: asyncpg.Connection = Depends(get_db_session),
 ) -> OAuthAppRepository:
@@ -95,12 +122,34 @@ def get_oauth_event_repository(
     return OAuthEventRepository(conn)
 
 
+@asynccontextmanager
+async def pooled_oauth_event_repository() -> AsyncGenerator[
+    OAuthEventRepository, None
+]:
+    # Cursor iteration needs an open transaction on its own connection
+    async with db_connection.get_connection() as conn:
+        async with conn.transaction():
+            yield OAuthEventRepository(conn)
+
+
 def get_crawl_history_repository(
     conn: asyncpg.Connection = Depends(get_db_session),
 ) -> CrawlHistoryRepository:
     return CrawlHistoryRepository(conn)
 
 
+@asynccontextmanager
+async def pooled_crawl_history_repository() -> AsyncGenerator[
+    CrawlHistoryRepository, None
+]:
+    async with db_connection.get_connection() as conn:
+        yield CrawlHistoryRepository(conn)
+
+
+def get_crawl_history_writer(request: Request) -> CrawlHistoryWriter:
+    return request.app.state.crawl_history_writer
+
+
 def get_user_repository(
     conn: asyncpg.Connection = Depends(get_db_session),
 ) -> UserRepository:
@@ -125,12 +174,19 @@ def get_role_repository(
     return RoleRepository(conn)
 
 
+def get_token_cipher() -> Fernet:
+    return get_fernet(settings.encryption_key)
+
+
 def get_credentials_manager(
     connection_repository: IdentityProviderConnectionRepository = Depends(
         get_identity_provider_connection_repository
     ),
+    fernet: Fernet = Depends(get_token_cipher),
 ) -> CredentialsManager:
-    return CredentialsManager(connection_repository, settings.encryption_key)
+    return CredentialsManager(
+        connection_repository, fernet, pooled_identity_provider_connection_repository
+    )
 
 
 def get_integration_service(
@@ -143,12 +199,13 @@ def get_integration_service(
     connection_repository: IdentityProviderConnectionRepository = Depends(
         get_identity_provider_connection_repository
     ),
+    fernet: Fernet = Depends(get_token_cipher),
 ) -> IntegrationService:
     return IntegrationService(
         identity_provider_repository=identity_provider_repository,
         product_auth_config_repository=product_auth_config_repository,
         connection_repository=connection_repository,
-        encryption_key=settings.encryption_key,
+        fernet=fernet,
     )
 
 
@@ -173,8 +230,13 @@ def get_stream_service(
     app_repo: OAuthAppRepository = Depends(get_oauth_app_repository),
     grant_repo: AppGrantRepository = Depends(get_app_grant_repository),
     event_repo: OAuthEventRepository = Depends(get_oauth_event_repository),
+    connection_repo: IdentityProviderConnectionRepository = Depends(
+        get_identity_provider_connection_repository
+    ),
 ) -> StreamService:
-    return StreamService(user_repository, app_repo, grant_repo, event_repo)
+    return StreamService(
+        user_repository, app_repo, grant_repo, event_repo, connection_repo
+    )
 
 
 def get_sync_manager(
@@ -192,6 +254,7 @@ def get_sync_manager(
     directory_service: DirectoryService = Depends(get_directory_service),
     snapshot_service: SnapshotService = Depends(get_snapshot_service),
     stream_service: StreamService = Depends(get_stream_service),
+    crawl_history_writer: CrawlHistoryWriter = Depends(get_crawl_history_writer),
 ) -> SyncManager:
     return SyncManager(
         connection_repo,
@@ -202,28 +265,69 @@ def get_sync_manager(
         directory_service,
         snapshot_service,
         stream_service,
+        crawl_history_writer,
+        partial(pooled_sync_manager, crawl_history_writer),
+    )
+
+
+def build_sync_manager(
+    conn: asyncpg.Connection, crawl_history_writer: CrawlHistoryWriter
+) -> SyncManager:
+    connection_repo = IdentityProviderConnectionRepository(conn)
+    user_repo = WorkspaceUserRepository(conn)
+    app_repo = OAuthAppRepository(conn)
+    grant_repo = AppGrantRepository(conn)
+    return SyncManager(
+        connection_repo,
+        IdentityProviderRepository(conn),
+        ProductAuthConfigRepository(conn),
+        CrawlHistoryRepository(conn),
+        CredentialsManager(
+            connection_repo,
+            get_token_cipher(),
+            pooled_identity_provider_connection_repository,
+        ),
+        DirectoryService(user_repo, WorkspaceGroupRepository(conn)),
+        SnapshotService(user_repo, app_repo, grant_repo),
+        StreamService(
+            user_repo,
+            app_repo,
+            grant_repo,
+            OAuthEventRepository(conn),
+            connection_repo,
+        ),
+        crawl_history_writer,
+        partial(pooled_sync_manager, crawl_history_writer),
     )
 
 
+@asynccontextmanager
+async def pooled_sync_manager(
+    crawl_history_writer: CrawlHistoryWriter,
+) -> AsyncGenerator[SyncManager, None]:
+    # Concurrent sync phases each need their own pooled connection
+    async with db_connection.get_connection() as conn:
+        yield build_sync_manager(conn, crawl_history_writer)
+
+
 def get_domain_validator_service() -> DomainValidatorService:
     return DomainValidatorService()
 
 
 def get_oauth_service(
-    identity_provider_repository: IdentityProviderRepository = Depends(
-        get_identity_provider_repository
-    ),
     product_auth_config_repository: ProductAuthConfigRepository = Depends(
         get_product_auth_config_repository
     ),
 ) -> OAuthService:
     return OAuthService(
-        identity_provider_repository=identity_provider_repository,
         product_auth_config_repository=product_auth_config_repository,
     )
 
 
 def get_user_authentication_service(
+    transaction: Callable[[], AbstractAsyncContextManager[Any]] = Depends(
+        get_db_transaction
+    ),
     user_repository: UserRepository = Depends(get_user_repository),
     organization_repository: OrganizationRepository = Depends(
         get_organization_repository
@@ -235,6 +339,7 @@ def get_user_authentication_service(
     ),
 ) -> UserAuthenticationService:
     return UserAuthenticationService(
+        transaction=transaction,
         user_repository=user_repository,
         organization_repository=organization_repository,
         plan_repository=plan_repository,
@@ -333,6 +438,9 @@ def get_workspace_data_service(
     app_grant_repo: AppGrantRepository = Depends(get_app_grant_repository),
     oauth_event_repo: OAuthEventRepository = Depends(get_oauth_event_repository),
     crawl_history_repo: CrawlHistoryRepository = Depends(get_crawl_history_repository),
+    workspace_stats_repo: WorkspaceStatsRepository = Depends(
+        get_workspace_stats_repository
+    ),
 ) -> WorkspaceDataService:
     return WorkspaceDataService(
         connection_repository=connection_repository,
@@ -342,6 +450,8 @@ def get_workspace_data_service(
         app_grant_repo=app_grant_repo,
         oauth_event_repo=oauth_event_repo,
         crawl_history_repo=crawl_history_repo,
+        workspace_stats_repo=workspace_stats_repo,
+        oauth_event_repo_scope=pooled_oauth_event_repository,
     )
 
 
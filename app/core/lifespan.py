@@ -4,9 +4,11 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 
+from app.core.dependencies import pooled_crawl_history_repository
 from app.core.logging import setup_logging
 from app.core.settings import settings
 from app.database import db_connection
+from app.services.crawl_history_writer import CrawlHistoryWriter
 
 logger = logging.getLogger(__name__)
 
@@ -16,6 +18,10 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     setup_logging(settings.log_level)
     logger.info("Application startup initiated")
     await db_connection.connect()
+    app.state.crawl_history_writer = CrawlHistoryWriter(
+        pooled_crawl_history_repository
+    )
     yield
     logger.info("Application shutdown initiated")
+    await app.state.crawl_history_writer.close()
     await db_connection.close()
@@ -1,6 +1,10 @@
-from datetime import datetime, timedelta, timezone
+import json
+import time
+from typing import Any
 
 import jwt
+from jwt.algorithms import get_default_algorithms
+from jwt.utils import base64url_encode
 from pydantic import ValidationError
 
 from app.constants.enums import TokenType
@@ -10,11 +14,20 @@ from app.dtos.token_dtos import AccessTokenPayload, RefreshTokenPayload
 
 class TokenService:
 
+    def __init__(self):
+        # Algorithm, key and header are fixed per process; resolve them once
+        self._algorithm = get_default_algorithms()[settings.jwt_algorithm]
+        self._signing_key = self._algorithm.prepare_key(settings.jwt_secret_key)
+        header = json.dumps(
+            {"alg": settings.jwt_algorithm, "typ": "JWT"}, separators=(",", ":")
+        )
+        self._header_segment = base64url_encode(header.encode())
+
     def create_access_token(
         self, user_id: int, org_id: int, role: str, email: str
     ) -> str:
-        now = datetime.now(timezone.utc)
-        expires = now + timedelta(seconds=settings.access_token_expire_seconds)
+        now = int(time.time())
+        expires = now + settings.access_token_expire_seconds
         payload = {
             "sub": str(user_id),
             "type": TokenType.ACCESS.value,
@@ -25,13 +38,11 @@ class TokenService:
             "iat": now,
             "exp": expires,
         }
-        return jwt.encode(
-            payload, settings.jwt_secret_key, algorithm=settings.jwt_algorithm
-        )
+        return self._encode(payload)
 
     def create_refresh_token(self, user_id: int, jti: str) -> str:
-        now = datetime.now(timezone.utc)
-        expires = now + timedelta(seconds=settings.refresh_token_expire_seconds)
+        now = int(time.time())
+        expires = now + settings.refresh_token_expire_seconds
         payload = {
             "sub": str(user_id),
             "type": TokenType.REFRESH.value,
@@ -40,9 +51,15 @@ class TokenService:
             "iat": now,
             "exp": expires,
         }
-        return jwt.encode(
-            payload, settings.jwt_secret_key, algorithm=settings.jwt_algorithm
+        return self._encode(payload)
+
+    def _encode(self, payload: dict[str, Any]) -> str:
+        payload_segment = base64url_encode(
+            json.dumps(payload, separators=(",", ":")).encode()
         )
+        signing_input = self._header_segment + b"." + payload_segment
+        signature = self._algorithm.sign(signing_input, self._signing_key)
+        return (signing_input + b"." + base64url_encode(signature)).decode()
 
     def verify_access_token(self, token: str) -> AccessTokenPayload | None:
         try:
@@ -1,3 +1,5 @@
+import functools
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -18,8 +20,10 @@ class Settings(BaseSettings):
     database_user: str = "postgres"
     database_password: str = ""
     database_name: str = "saas_risk_scanner"
-    database_pool_min_size: int = 1
-    database_pool_max_size: int = 10
+    database_pool_min_size: int = 10
+    database_pool_max_size: int = 50
+    database_pool_max_inactive_connection_lifetime: float = 300.0
+    database_statement_cache_size: int = 1024
 
     jwt_secret_key: str = ""
     jwt_algorithm: str = "HS256"
@@ -28,6 +32,8 @@ class Settings(BaseSettings):
 
     encryption_key: str = ""
 
+    snapshot_concurrency: int = 32
+
     # LLM Configuration - just use plain strings, factory handles the enums
     llm_provider: str = "google"
     llm_id: str = "gemini-2.5-flash"
@@ -49,5 +55,9 @@ class Settings(BaseSettings):
     def allowed_redirect_uri_list(self) -> list[str]:
         return [uri.strip() for uri in self.allowed_redirect_uris.split(",")]
 
+    @functools.cached_property
+    def allowed_redirect_uri_set(self) -> frozenset[str]:
+        return frozenset(self.allowed_redirect_uri_list)
+
 
 settings = Settings()
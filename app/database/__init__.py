@@ -19,8 +19,10 @@ class PostgreSQLConnection:
         user: str,
         password: str,
         database: str,
-        min_size: int = 1,
-        max_size: int = 10,
+        min_size: int = 10,
+        max_size: int = 50,
+        max_inactive_connection_lifetime: float = 300.0,
+        statement_cache_size: int = 1024,
     ):
         self.pool: Optional[asyncpg.Pool] = None
         self.database = database
@@ -32,6 +34,9 @@ class PostgreSQLConnection:
             "database": database,
             "min_size": min_size,
             "max_size": max_size,
+            "max_inactive_connection_lifetime": max_inactive_connection_lifetime,
+            "statement_cache_size": statement_cache_size,
+            "max_cacheable_statement_size": 0,
         }
         logger.debug(
             f"PostgreSQL connection config initialized for database: {self.database}"
@@ -115,6 +120,10 @@ db_connection = PostgreSQLConnection(
     database=settings.database_name,
     min_size=settings.database_pool_min_size,
     max_size=settings.database_pool_max_size,
+    max_inactive_connection_lifetime=(
+        settings.database_pool_max_inactive_connection_lifetime
+    ),
+    statement_cache_size=settings.database_statement_cache_size,
 )
 
 
@@ -10,6 +10,8 @@ class CreateIdentityProviderConnectionDTO(BaseModel):
     status: str
     access_token: str
     refresh_token: str | None = None
+    access_token_hash: bytes | None = None
+    refresh_token_hash: bytes | None = None
     token_expires_at: datetime | None = None
     scopes_granted: list[str] = Field(default_factory=list)
     admin_email: str | None = None
@@ -20,6 +22,8 @@ class UpdateIdentityProviderConnectionDTO(BaseModel):
     status: str | None = None
     access_token: str | None = None
     refresh_token: str | None = None
+    access_token_hash: bytes | None = None
+    refresh_token_hash: bytes | None = None
     token_expires_at: datetime | None = None
     scopes_granted: list[str] | None = None
 
@@ -32,6 +36,8 @@ class UpdateIdentityProviderConnectionDTO(BaseModel):
 class UpdateTokensDTO(BaseModel):
     access_token: str
     refresh_token: str | None = None
+    access_token_hash: bytes | None = None
+    refresh_token_hash: bytes | None = None
     token_expires_at: datetime | None = None
 
 
@@ -20,6 +20,11 @@ class CreateWorkspaceUserDTO(BaseModel):
     raw_data: dict[str, Any] = Field(default_factory=dict)
 
 
+class WorkspaceUserRefDTO(BaseModel):
+    id: int
+    provider_user_id: str
+
+
 class UpdateWorkspaceUserDTO(BaseModel):
     email: str | None = None
     full_name: str | None = None
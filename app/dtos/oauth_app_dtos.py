@@ -1,3 +1,4 @@
+from dataclasses import dataclass
 from datetime import datetime
 from typing import Any
 
@@ -32,6 +33,19 @@ class OAuthAppResponseDTO(BaseModel):
     updated_at: datetime
 
 
-class OAuthAppWithStatsDTO(OAuthAppResponseDTO):
+@dataclass(slots=True, frozen=True)
+class OAuthAppWithStatsDTO:
+    id: int
+    organization_id: int
+    connection_id: int
+    client_id: str
+    name: str
+    risk_score: int
+    is_system_app: bool
+    is_trusted: bool
+    scopes_summary: list[str]
+    image_url: str | None
+    created_at: datetime
+    updated_at: datetime
     active_grants_count: int = 0
     last_activity_at: datetime | None = None
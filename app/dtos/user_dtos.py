@@ -2,6 +2,11 @@ from datetime import datetime
 
 from pydantic import BaseModel, EmailStr, Field
 
+from app.models.organization import Organization
+from app.models.plan import Plan
+from app.models.role import Role
+from app.models.user import User
+
 
 class CreateUserDTO(BaseModel):
     organization_id: int = Field(..., gt=0)
@@ -24,3 +29,15 @@ class UpdateUserDTO(BaseModel):
     provider_id: str | None = None
     joined_at: datetime | None = None
     last_login_at: datetime | None = None
+
+
+class UserWithOrganizationDTO(BaseModel):
+    user: User
+    organization: Organization | None = None
+
+
+class UserAuthBundleDTO(BaseModel):
+    user: User
+    organization: Organization | None = None
+    role: Role | None = None
+    plan: Plan | None = None
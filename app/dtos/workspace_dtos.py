@@ -1,3 +1,4 @@
+from dataclasses import dataclass
 from datetime import datetime
 
 from pydantic import BaseModel
@@ -11,7 +12,8 @@ class WorkspaceStatsDTO(BaseModel):
     last_sync_at: datetime | None
 
 
-class WorkspaceUserWithAppCountDTO(BaseModel):
+@dataclass(slots=True, frozen=True)
+class WorkspaceUserWithAppCountDTO:
     id: int
     email: str
     full_name: str | None
@@ -22,7 +24,8 @@ class WorkspaceUserWithAppCountDTO(BaseModel):
     authorized_apps_count: int
 
 
-class WorkspaceGroupWithMemberCountDTO(BaseModel):
+@dataclass(slots=True, frozen=True)
+class WorkspaceGroupWithMemberCountDTO:
     id: int
     email: str
     name: str
@@ -118,3 +121,4 @@ class PaginationParamsDTO(BaseModel):
     page: int = 1
     page_size: int = 25
     search: str | None = None
+    cursor: str | None = None
@@ -36,6 +36,7 @@ from app.integrations.core.types import (
     SyncStatus,
     SyncStep,
     TokenResponse,
+    TokenState,
     UnifiedGroup,
     UnifiedGroupMembership,
     UnifiedTokenEvent,
@@ -75,6 +76,7 @@ __all__ = [
     "TokenExpiredError",
     "TokenRefreshError",
     "TokenResponse",
+    "TokenState",
     "UnifiedGroup",
     "UnifiedGroupMembership",
     "UnifiedTokenEvent",
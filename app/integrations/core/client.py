@@ -81,7 +81,9 @@ class ApiClient:
     ) -> AsyncGenerator[list[Any], None]:
         current_params = {**request.params}
         logger.info(
-            f"Starting paginated request to {request.url} with params {current_params}"
+            "Starting paginated request to %s with params %s",
+            request.url,
+            current_params,
         )
         if hasattr(paginator, "get_initial_params"):
             initial_params = paginator.get_initial_params()
@@ -131,14 +133,16 @@ class ApiClient:
         last_exception: Exception | None = None
         for attempt in range(self._max_retries):
             try:
-                logger.debug(f"Attempt {attempt + 1} for request to {request.url}")
+                logger.debug("Attempt %d for request to %s", attempt + 1, request.url)
                 response = await self._make_request(request, headers)
 
                 if response.is_rate_limited:
                     retry_after = self._parse_retry_after(response.headers)
                     if attempt < self._max_retries - 1 and self._rate_limiter:
                         logger.warning(
-                            f"Rate limited, waiting {retry_after}s before retry {attempt + 1}"
+                            "Rate limited, waiting %ss before retry %d",
+                            retry_after,
+                            attempt + 1,
                         )
                         await self._rate_limiter.wait_for_retry(retry_after)
                         continue
@@ -146,7 +150,7 @@ class ApiClient:
 
                 if response.status_code >= 500 and attempt < self._max_retries - 1:
                     logger.warning(
-                        f"Server error {response.status_code}, retry {attempt + 1}"
+                        "Server error %d, retry %d", response.status_code, attempt + 1
                     )
                     continue
 
@@ -154,7 +158,7 @@ class ApiClient:
 
             except aiohttp.ClientError as e:
                 last_exception = e
-                logger.warning(f"Request error: {e}, retry {attempt + 1}")
+                logger.warning("Request error: %s, retry %d", e, attempt + 1)
                 if attempt == self._max_retries - 1:
                     raise ApiRequestError(500, str(e)) from e
 
@@ -179,14 +183,20 @@ class ApiClient:
             kwargs["json"] = request.body
 
         logger.debug(
-            f"Making {request.method.value} request to {request.url} with params {request.params} and headers {len(request.headers)}"
+            "Making %s request to %s with params %s and headers %d",
+            request.method.value,
+            request.url,
+            request.params,
+            len(request.headers),
         )
         async with client.request(http_method, request.url, **kwargs) as response:
             try:
                 data = await response.json()
-                logger.debug(f"=" * 60)
-                logger.debug(f"Received response data: {data}")
-                logger.debug(f"=" * 60)
+                # Page payloads are large; only render them when DEBUG is on
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("=" * 60)
+                    logger.debug("Received response data: %s", data)
+                    logger.debug("=" * 60)
             except aiohttp.ContentTypeError:
                 data = {}
 
@@ -198,7 +208,7 @@ class ApiClient:
 
     def _parse_retry_after(self, headers: dict[str, str]) -> int | None:
         retry_after = headers.get("Retry-After") or headers.get("retry-after")
-        logger.debug(f"Parsing Retry-After header: {retry_after}")
+        logger.debug("Parsing Retry-After header: %s", retry_after)
         if retry_after:
             try:
                 return int(retry_after)
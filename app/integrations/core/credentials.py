@@ -1,7 +1,11 @@
+import asyncio
 import logging
+from collections.abc import Callable
+from contextlib import AbstractAsyncContextManager
 from datetime import datetime, timedelta, timezone
 
-from cryptography.fernet import Fernet
+from cachetools import TTLCache
+from rfernet import Fernet
 
 from app.dtos.integration.connection_dtos import MarkConnectionErrorDTO, UpdateTokensDTO
 from app.integrations.core.exceptions import (
@@ -10,24 +14,43 @@ from app.integrations.core.exceptions import (
     TokenRefreshError,
 )
 from app.integrations.core.interfaces import ICredentialsManager, IWorkspaceProvider
-from app.integrations.core.types import AuthContext
+from app.integrations.core.types import AuthContext, TokenState
 from app.repositories.identity_provider_connection_repository import (
     IdentityProviderConnectionRepository,
 )
+from app.utils.crypto import hash_token
 
 logger = logging.getLogger(__name__)
 
+AUTH_CONTEXT_CACHE_TTL_SECONDS = 300
+AUTH_CONTEXT_CACHE_MAX_SIZE = 1024
+
+_auth_context_cache: TTLCache[int, AuthContext] = TTLCache(
+    maxsize=AUTH_CONTEXT_CACHE_MAX_SIZE, ttl=AUTH_CONTEXT_CACHE_TTL_SECONDS
+)
+_refresh_locks: dict[int, asyncio.Lock] = {}
+_background_refreshes: dict[int, asyncio.Task] = {}
+
+
+def invalidate_auth_context(connection_id: int) -> None:
+    _auth_context_cache.pop(connection_id, None)
+
 
 class CredentialsManager(ICredentialsManager):
-    TOKEN_EXPIRY_BUFFER_SECONDS = 300
+    TOKEN_EXPIRY_BUFFER_SECONDS = 30
+    TOKEN_STALE_WINDOW_SECONDS = 300
 
     def __init__(
         self,
         connection_repository: IdentityProviderConnectionRepository,
-        encryption_key: str,
+        fernet: Fernet,
+        connection_repository_scope: Callable[
+            [], AbstractAsyncContextManager[IdentityProviderConnectionRepository]
+        ],
     ):
         self._connection_repository = connection_repository
-        self._fernet = Fernet(encryption_key.encode())
+        self._fernet = fernet
+        self._connection_repository_scope = connection_repository_scope
         self._provider: IWorkspaceProvider | None = None
 
     def set_provider(self, provider: IWorkspaceProvider) -> None:
@@ -39,32 +62,21 @@ class CredentialsManager(ICredentialsManager):
         client_id: str,
         client_secret: str,
     ) -> AuthContext:
-        connection = await self._connection_repository.find_by_id(connection_id)
-
-        if connection is None:
-            raise ConnectionNotFoundError(connection_id)
-
-        if connection.access_token is None:
-            raise TokenExpiredError(connection_id)
-
-        access_token = self._decrypt(connection.access_token)
-        token_expires_at = connection.token_expires_at
+        auth_context = _auth_context_cache.get(connection_id)
+        if auth_context is None:
+            auth_context = await self._load_credentials(connection_id)
 
-        if self._is_token_expired(token_expires_at):
-            logger.debug(
-                f"Token is expired for connection {connection_id}, refreshing..."
-            )
-            if not connection.refresh_token:
-                raise TokenExpiredError(connection_id)
+        state = self._token_state(auth_context.expires_at)
+        if state == TokenState.FRESH:
+            return auth_context
 
-            decrypted_refresh = self._decrypt(connection.refresh_token)
-            access_token = await self._refresh_token(
-                connection_id, decrypted_refresh, client_id, client_secret
-            )
+        if state == TokenState.STALE:
+            self._schedule_refresh(connection_id, client_id, client_secret)
+            return auth_context
 
-        return AuthContext(
-            access_token=access_token,
-            expires_at=token_expires_at,
+        logger.debug("Token is expired for connection %s, refreshing...", connection_id)
+        return await self._refresh_with_lock(
+            connection_id, client_id, client_secret, self._connection_repository
         )
 
     async def store_credentials(
@@ -74,19 +86,13 @@ class CredentialsManager(ICredentialsManager):
         refresh_token: str | None,
         expires_in: int | None,
     ) -> None:
-        encrypted_access = self._encrypt(access_token)
-        encrypted_refresh = self._encrypt(refresh_token) if refresh_token else None
-
-        expires_at = None
-        if expires_in:
-            expires_at = datetime.now(timezone.utc) + timedelta(seconds=expires_in)
-
-        dto = UpdateTokensDTO(
-            access_token=encrypted_access,
-            refresh_token=encrypted_refresh,
-            token_expires_at=expires_at,
+        await self._persist_tokens(
+            self._connection_repository,
+            connection_id,
+            access_token,
+            refresh_token,
+            expires_in,
         )
-        await self._connection_repository.update_tokens(connection_id, dto)
 
     async def handle_token_error(self, connection_id: int, error_code: str) -> bool:
         if error_code == "401":
@@ -102,16 +108,111 @@ class CredentialsManager(ICredentialsManager):
         return True
 
     def _encrypt(self, value: str) -> str:
-        return self._fernet.encrypt(value.encode()).decode()
+        return self._fernet.encrypt(value.encode())
 
     def _decrypt(self, encrypted_value: str) -> str:
-        return self._fernet.decrypt(encrypted_value.encode()).decode()
+        return self._fernet.decrypt(encrypted_value).decode()
 
-    def _is_token_expired(self, expires_at: datetime | None) -> bool:
+    def _token_state(self, expires_at: datetime | None) -> TokenState:
         if expires_at is None:
-            return False
-        buffer = timedelta(seconds=self.TOKEN_EXPIRY_BUFFER_SECONDS)
-        return datetime.now(timezone.utc) >= (expires_at - buffer)
+            return TokenState.FRESH
+        remaining = (expires_at - datetime.now(timezone.utc)).total_seconds()
+        if remaining <= self.TOKEN_EXPIRY_BUFFER_SECONDS:
+            return TokenState.EXPIRED
+        if remaining <= self.TOKEN_STALE_WINDOW_SECONDS:
+            return TokenState.STALE
+        return TokenState.FRESH
+
+    async def _load_credentials(self, connection_id: int) -> AuthContext:
+        connection = await self._connection_repository.find_by_id(connection_id)
+
+        if connection is None:
+            raise ConnectionNotFoundError(connection_id)
+
+        if connection.access_token is None:
+            raise TokenExpiredError(connection_id)
+
+        auth_context = AuthContext(
+            access_token=self._decrypt(connection.access_token),
+            expires_at=connection.token_expires_at,
+        )
+        _auth_context_cache[connection_id] = auth_context
+        return auth_context
+
+    def _schedule_refresh(
+        self, connection_id: int, client_id: str, client_secret: str
+    ) -> None:
+        task = _background_refreshes.get(connection_id)
+        if task is not None and not task.done():
+            return
+        _background_refreshes[connection_id] = asyncio.create_task(
+            self._refresh_in_background(connection_id, client_id, client_secret)
+        )
+
+    async def _refresh_in_background(
+        self, connection_id: int, client_id: str, client_secret: str
+    ) -> None:
+        # The request-scoped connection may be busy, so persist on a pooled one
+        try:
+            async with self._connection_repository_scope() as repository:
+                await self._refresh_with_lock(
+                    connection_id, client_id, client_secret, repository
+                )
+        except Exception as e:
+            logger.warning(
+                "Background token refresh failed for connection %s: %s",
+                connection_id,
+                e,
+            )
+        finally:
+            _background_refreshes.pop(connection_id, None)
+
+    async def _refresh_with_lock(
+        self,
+        connection_id: int,
+        client_id: str,
+        client_secret: str,
+        repository: IdentityProviderConnectionRepository,
+    ) -> AuthContext:
+        # One refresh per connection at a time; the lock is dropped afterwards
+        # so only connections with a refresh in flight hold one
+        lock = _refresh_locks.setdefault(connection_id, asyncio.Lock())
+        try:
+            async with lock:
+                return await self._refresh_if_not_fresh(
+                    connection_id, client_id, client_secret, repository
+                )
+        finally:
+            if _refresh_locks.get(connection_id) is lock and not lock.locked():
+                del _refresh_locks[connection_id]
+
+    async def _refresh_if_not_fresh(
+        self,
+        connection_id: int,
+        client_id: str,
+        client_secret: str,
+        repository: IdentityProviderConnectionRepository,
+    ) -> AuthContext:
+        cached = _auth_context_cache.get(connection_id)
+        if (
+            cached is not None
+            and self._token_state(cached.expires_at) == TokenState.FRESH
+        ):
+            return cached
+
+        connection = await repository.find_by_id(connection_id)
+        if connection is None:
+            raise ConnectionNotFoundError(connection_id)
+        if not connection.refresh_token:
+            raise TokenExpiredError(connection_id)
+
+        return await self._refresh_token(
+            connection_id,
+            self._decrypt(connection.refresh_token),
+            client_id,
+            client_secret,
+            repository,
+        )
 
     async def _refresh_token(
         self,
@@ -119,40 +220,73 @@ class CredentialsManager(ICredentialsManager):
         refresh_token: str,
         client_id: str,
         client_secret: str,
-    ) -> str:
+        repository: IdentityProviderConnectionRepository,
+    ) -> AuthContext:
         if self._provider is None:
             raise TokenRefreshError("Provider not set for token refresh")
 
         try:
-            logger.debug(
-                f"Token is expired for connection {connection_id}, refreshing..."
-            )
             token_response = await self._provider.refresh_access_token(
                 refresh_token, client_id, client_secret
             )
-            await self.store_credentials(
+            expires_at = await self._persist_tokens(
+                repository,
                 connection_id,
                 token_response.access_token,
                 token_response.refresh_token,
                 token_response.expires_in,
             )
-            logger.info(f"Successfully refreshed token for connection {connection_id}")
-            return token_response.access_token
+            logger.info("Successfully refreshed token for connection %d", connection_id)
         except Exception as e:
-            logger.error(f"Token refresh failed for connection {connection_id}: {e}")
+            logger.error("Token refresh failed for connection %d: %s", connection_id, e)
             await self._mark_connection_error(
-                connection_id, "TOKEN_REFRESH_FAILED", str(e)
+                connection_id, "TOKEN_REFRESH_FAILED", str(e), repository
             )
             raise TokenRefreshError(str(e)) from e
 
+        auth_context = AuthContext(
+            access_token=token_response.access_token,
+            expires_at=expires_at,
+        )
+        _auth_context_cache[connection_id] = auth_context
+        return auth_context
+
+    async def _persist_tokens(
+        self,
+        repository: IdentityProviderConnectionRepository,
+        connection_id: int,
+        access_token: str,
+        refresh_token: str | None,
+        expires_in: int | None,
+    ) -> datetime | None:
+        encrypted_access = self._encrypt(access_token)
+        encrypted_refresh = self._encrypt(refresh_token) if refresh_token else None
+
+        expires_at = None
+        if expires_in:
+            expires_at = datetime.now(timezone.utc) + timedelta(seconds=expires_in)
+
+        dto = UpdateTokensDTO(
+            access_token=encrypted_access,
+            refresh_token=encrypted_refresh,
+            access_token_hash=hash_token(access_token),
+            refresh_token_hash=hash_token(refresh_token) if refresh_token else None,
+            token_expires_at=expires_at,
+        )
+        await repository.update_tokens(connection_id, dto)
+        invalidate_auth_context(connection_id)
+        return expires_at
+
     async def _mark_connection_error(
         self,
         connection_id: int,
         error_code: str,
         error_message: str,
+        repository: IdentityProviderConnectionRepository | None = None,
     ) -> None:
+        invalidate_auth_context(connection_id)
         dto = MarkConnectionErrorDTO(
             error_code=error_code,
             error_message=error_message,
         )
-        await self._connection_repository.mark_error(connection_id, dto)
+        await (repository or self._connection_repository).mark_error(connection_id, dto)
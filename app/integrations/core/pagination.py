@@ -1,5 +1,11 @@
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Any
+from collections.abc import AsyncIterator
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+_PAGES_DONE = object()
 
 
 class PaginationStrategy(ABC):
@@ -122,3 +128,28 @@ class NoPagination(PaginationStrategy):
 
     def has_more_pages(self, response: dict[str, Any]) -> bool:
         return False
+
+
+async def prefetch_pages(
+    pages: AsyncIterator[T], max_pending: int = 2
+) -> AsyncIterator[T]:
+    # Fetch upcoming pages in the background while the caller handles the current one
+    queue: asyncio.Queue = asyncio.Queue(maxsize=max_pending)
+
+    async def produce() -> None:
+        try:
+            async for page in pages:
+                await queue.put(page)
+        except Exception:
+            await queue.put(_PAGES_DONE)
+            raise
+        await queue.put(_PAGES_DONE)
+
+    producer = asyncio.create_task(produce())
+    try:
+        while (page := await queue.get()) is not _PAGES_DONE:
+            yield page
+        # Surfaces any provider error raised after the last page
+        await producer
+    finally:
+        producer.cancel()
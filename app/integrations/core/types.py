@@ -20,6 +20,12 @@ class SyncStatus(str, Enum):
     PARTIAL = "partial"
 
 
+class TokenState(str, Enum):
+    FRESH = "fresh"
+    STALE = "stale"
+    EXPIRED = "expired"
+
+
 class HttpMethod(str, Enum):
     GET = "GET"
     POST = "POST"
@@ -16,6 +16,7 @@ from app.integrations.providers.google_workspace.constants import (
     GOOGLE_USER_TOKENS_ENDPOINT,
     GOOGLE_USERS_ENDPOINT,
     GOOGLE_WORKSPACE_ADMIN_SCOPES,
+    GOOGLE_WORKSPACE_ADMIN_SCOPES_JOINED,
     GOOGLE_WORKSPACE_PROVIDER_SLUG,
 )
 from app.integrations.providers.google_workspace.paginators import (
@@ -46,6 +47,7 @@ __all__ = [
     "GOOGLE_USER_TOKENS_ENDPOINT",
     "GOOGLE_USERS_ENDPOINT",
     "GOOGLE_WORKSPACE_ADMIN_SCOPES",
+    "GOOGLE_WORKSPACE_ADMIN_SCOPES_JOINED",
     "GOOGLE_WORKSPACE_PROVIDER_SLUG",
     "get_paginator_for_step",
     "GoogleGroupMembersPaginator",
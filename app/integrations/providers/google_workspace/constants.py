@@ -22,6 +22,8 @@ GOOGLE_WORKSPACE_ADMIN_SCOPES = [
     "https://www.googleapis.com/auth/admin.directory.user.security",
 ]
 
+GOOGLE_WORKSPACE_ADMIN_SCOPES_JOINED = " ".join(GOOGLE_WORKSPACE_ADMIN_SCOPES)
+
 GOOGLE_SSO_SCOPES = [
     "openid",
     "email",
@@ -37,3 +39,9 @@ GOOGLE_RATE_LIMITS = {
 
 GOOGLE_DEFAULT_PAGE_SIZE = 100
 GOOGLE_MAX_PAGE_SIZE = 500
+
+# Per-endpoint maxResults ceilings; fewer pages means fewer rate-limited calls
+GOOGLE_USERS_PAGE_SIZE = GOOGLE_MAX_PAGE_SIZE
+GOOGLE_GROUPS_PAGE_SIZE = 200
+GOOGLE_GROUP_MEMBERS_PAGE_SIZE = 200
+GOOGLE_TOKEN_EVENTS_PAGE_SIZE = 1000
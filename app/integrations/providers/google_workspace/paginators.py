@@ -6,6 +6,10 @@ from app.integrations.core.pagination import (
 from app.integrations.core.types import SyncStep
 from app.integrations.providers.google_workspace.constants import (
     GOOGLE_DEFAULT_PAGE_SIZE,
+    GOOGLE_GROUP_MEMBERS_PAGE_SIZE,
+    GOOGLE_GROUPS_PAGE_SIZE,
+    GOOGLE_TOKEN_EVENTS_PAGE_SIZE,
+    GOOGLE_USERS_PAGE_SIZE,
 )
 
 
@@ -16,7 +20,7 @@ class GoogleUsersPaginator(CursorPagination):
             cursor_request_param="pageToken",
             items_key="users",
             max_results_param="maxResults",
-            default_page_size=GOOGLE_DEFAULT_PAGE_SIZE,
+            default_page_size=GOOGLE_USERS_PAGE_SIZE,
         )
 
 
@@ -27,7 +31,7 @@ class GoogleGroupsPaginator(CursorPagination):
             cursor_request_param="pageToken",
             items_key="groups",
             max_results_param="maxResults",
-            default_page_size=GOOGLE_DEFAULT_PAGE_SIZE,
+            default_page_size=GOOGLE_GROUPS_PAGE_SIZE,
         )
 
 
@@ -38,7 +42,7 @@ class GoogleGroupMembersPaginator(CursorPagination):
             cursor_request_param="pageToken",
             items_key="members",
             max_results_param="maxResults",
-            default_page_size=GOOGLE_DEFAULT_PAGE_SIZE,
+            default_page_size=GOOGLE_GROUP_MEMBERS_PAGE_SIZE,
         )
 
 
@@ -49,7 +53,7 @@ class GoogleTokenEventsPaginator(CursorPagination):
             cursor_request_param="pageToken",
             items_key="items",
             max_results_param="maxResults",
-            default_page_size=GOOGLE_DEFAULT_PAGE_SIZE,
+            default_page_size=GOOGLE_TOKEN_EVENTS_PAGE_SIZE,
         )
 
 
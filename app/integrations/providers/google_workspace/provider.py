@@ -150,7 +150,7 @@ class GoogleWorkspaceProvider(IWorkspaceProvider):
             async for raw_users in client.execute_paginated(
                 request, auth_context, paginator
             ):
-                logger.debug(f"Fetched batch of {len(raw_users)} users")
+                logger.debug("Fetched batch of %d users", len(raw_users))
                 yield adapt_google_users(raw_users)
         logger.debug("Finished fetching users from Google Workspace")
 
@@ -165,14 +165,14 @@ class GoogleWorkspaceProvider(IWorkspaceProvider):
             async for raw_groups in client.execute_paginated(
                 request, auth_context, paginator
             ):
-                logger.debug(f"Fetched batch of {len(raw_groups)} groups")
+                logger.debug("Fetched batch of %d groups", len(raw_groups))
                 yield adapt_google_groups(raw_groups)
         logger.debug("Finished fetching groups from Google Workspace")
 
     async def fetch_group_members(
         self, auth_context: AuthContext, group_id: str
     ) -> AsyncGenerator[list[UnifiedGroupMembership], None]:
-        logger.debug(f"Starting to fetch members for group: {group_id}")
+        logger.debug("Starting to fetch members for group: %s", group_id)
         request = self.get_request_definition(
             SyncStep.GROUP_MEMBERS, {"group_key": group_id}
         )
@@ -183,15 +183,17 @@ class GoogleWorkspaceProvider(IWorkspaceProvider):
                 request, auth_context, paginator
             ):
                 logger.debug(
-                    f"Fetched batch of {len(raw_members)} members for group {group_id}"
+                    "Fetched batch of %d members for group %s",
+                    len(raw_members),
+                    group_id,
                 )
                 yield adapt_google_members(raw_members, group_id)
-        logger.debug(f"Finished fetching members for group: {group_id}")
+        logger.debug("Finished fetching members for group: %s", group_id)
 
     async def fetch_token_events(
         self, auth_context: AuthContext, start_time: str | None = None
     ) -> AsyncGenerator[list[UnifiedTokenEvent], None]:
-        logger.debug(f"Starting to fetch token events, start_time: {start_time}")
+        logger.debug("Starting to fetch token events, start_time: %s", start_time)
         request = self.get_request_definition(
             SyncStep.TOKEN_EVENTS, {"start_time": start_time}
         )
@@ -201,7 +203,7 @@ class GoogleWorkspaceProvider(IWorkspaceProvider):
             async for raw_events in client.execute_paginated(
                 request, auth_context, paginator
             ):
-                logger.debug(f"Fetched batch of {len(raw_events)} token events")
+                logger.debug("Fetched batch of %d token events", len(raw_events))
                 yield adapt_google_token_events(raw_events)
         logger.debug("Finished fetching token events")
 
@@ -212,7 +214,7 @@ class GoogleWorkspaceProvider(IWorkspaceProvider):
         # Google Directory API tokens.list doesn't seem to explicitly support pagination in the simple sense or it's rarely large.
         # But we should respect if it does. Standard list usually has nextPageToken.
         
-        logger.debug(f"Starting to fetch tokens for user: {user_id}")
+        logger.debug("Starting to fetch tokens for user: %s", user_id)
         request = self.get_request_definition(
             SyncStep.USER_TOKENS, {"user_key": user_id}
         )
@@ -225,7 +227,7 @@ class GoogleWorkspaceProvider(IWorkspaceProvider):
                 request, auth_context, paginator
             ):
                 yield adapt_google_user_tokens(raw_tokens)
-        logger.debug(f"Finished fetching tokens for user: {user_id}")
+        logger.debug("Finished fetching tokens for user: %s", user_id)
 
     async def revoke_app_access(
         self, auth_context: AuthContext, user_id: str, client_id: str
@@ -235,7 +237,7 @@ class GoogleWorkspaceProvider(IWorkspaceProvider):
         )
 
         logger.debug(
-            f"Revoking app access for user: {user_id}, client_id: {client_id}"
+            "Revoking app access for user: %s, client_id: %s", user_id, client_id
         )
         url = GOOGLE_USER_TOKENS_ENDPOINT.format(user_key=user_id) + f"/{client_id}"
 
@@ -247,7 +249,7 @@ class GoogleWorkspaceProvider(IWorkspaceProvider):
         async with self._create_api_client(SyncStep.USER_TOKENS) as client:
             response = await client.execute(request, auth_context)
             success = response.is_success
-            logger.debug(f"Revoke app access result for user {user_id}: {success}")
+            logger.debug("Revoke app access result for user %s: %s", user_id, success)
             return success
 
     def _create_api_client(self, step: SyncStep) -> ApiClient:
@@ -258,7 +260,7 @@ class GoogleWorkspaceProvider(IWorkspaceProvider):
             self.provider_slug, step.value, rate_config
         )
 
-        logger.debug(f"Creating ApiClient for step: {step.value}")
+        logger.debug("Creating ApiClient for step: %s", step.value)
         return ApiClient(rate_limiter=rate_limiter)
 
 
@@ -13,10 +13,13 @@ class IdentityProviderConnection(BaseModel):
     status: str
     access_token: str | None = None
     refresh_token: str | None = None
+    access_token_hash: bytes | None = None
+    refresh_token_hash: bytes | None = None
     token_expires_at: datetime | None = None
     scopes_granted: list[str] = Field(default_factory=list)
     admin_email: str | None = None
     workspace_domain: str | None = None
+    last_event_cursor: datetime | None = None
 
     last_token_refresh_at: datetime | None = None
     token_refresh_count: int = 0
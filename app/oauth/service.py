@@ -6,7 +6,6 @@ from app.constants.auth_errors import AUTH_ERROR_MESSAGES, AuthErrorCode
 from app.oauth.base import OAuthProvider
 from app.oauth.registry import oauth_provider_registry
 from app.oauth.types import OAuthConfig, OAuthTokens, OAuthUserInfo
-from app.repositories.identity_provider_repository import IdentityProviderRepository
 from app.repositories.product_auth_config_repository import ProductAuthConfigRepository
 from app.utils.oauth_state import create_signed_state, verify_signed_state
 
@@ -30,29 +29,20 @@ class OAuthService:
 
     def __init__(
         self,
-        identity_provider_repository: IdentityProviderRepository,
         product_auth_config_repository: ProductAuthConfigRepository,
     ):
-        self._identity_provider_repository = identity_provider_repository
         self._product_auth_config_repository = product_auth_config_repository
 
     async def get_provider_config(
         self, identity_provider_slug: str
     ) -> tuple[OAuthProvider, OAuthConfig] | None:
         logger.debug(f"Fetching provider config for: {identity_provider_slug}")
-        identity_provider = await self._identity_provider_repository.find_by_slug(
-            identity_provider_slug
-        )
-        if identity_provider is None:
-            logger.warning(f"Identity provider not found: {identity_provider_slug}")
-            return None
-
         auth_config = await self._product_auth_config_repository.find_platform_config_by_identity_provider_slug(
             identity_provider_slug
         )
         if auth_config is None:
             logger.warning(
-                f"Auth config not found for identity provider: {identity_provider_slug}"
+                f"Identity provider or auth config not found: {identity_provider_slug}"
             )
             return None
 
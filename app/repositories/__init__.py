@@ -14,6 +14,7 @@ from app.repositories.product_auth_config_repository import (
 from app.repositories.role_repository import RoleRepository
 from app.repositories.user_repository import UserRepository
 from app.repositories.workspace_group_repository import WorkspaceGroupRepository
+from app.repositories.workspace_stats_repository import WorkspaceStatsRepository
 from app.repositories.workspace_user_repository import WorkspaceUserRepository
 
 __all__ = [
@@ -29,5 +30,6 @@ __all__ = [
     "RoleRepository",
     "UserRepository",
     "WorkspaceGroupRepository",
+    "WorkspaceStatsRepository",
     "WorkspaceUserRepository",
 ]
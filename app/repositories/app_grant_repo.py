@@ -1,9 +1,9 @@
-import json
 from datetime import datetime
 from typing import Any
 
+import orjson
+
 from app.dtos.app_grant_dtos import CreateAppGrantDTO
-from app.dtos.workspace_dtos import AuthorizationWithUserDTO
 from app.models.app_grant import AppGrant
 
 from .base_repository import BaseRepository
@@ -42,53 +42,69 @@ class AppGrantRepository(BaseRepository[AppGrant]):
             dto.granted_at,
             dto.revoked_at,
             dto.last_accessed_at,
-            json.dumps(dto.raw_data),
+            orjson.dumps(dto.raw_data).decode(),
         )
         data = dict(row)
         if isinstance(data.get('raw_data'), str):
-            data['raw_data'] = json.loads(data['raw_data'])
+            data['raw_data'] = orjson.loads(data['raw_data'])
         return AppGrant.model_validate(data)
 
-    async def count_active_by_organization(self, organization_id: int) -> int:
+    async def bulk_upsert(self, dtos: list[CreateAppGrantDTO]) -> int:
+        if not dtos:
+            return 0
+
         query = """
-            SELECT COUNT(*) 
-            FROM app_grant 
-            WHERE organization_id = $1 AND status = 'active'
+            INSERT INTO app_grant (
+                organization_id, connection_id, user_id, app_id,
+                status, scopes, granted_at, revoked_at, last_accessed_at, raw_data
+            )
+            SELECT
+                organization_id, connection_id, user_id, app_id,
+                status, scopes, granted_at, revoked_at, last_accessed_at, raw_data
+            FROM jsonb_to_recordset($1::jsonb) AS r(
+                organization_id bigint, connection_id bigint, user_id bigint,
+                app_id bigint, status text, scopes text[], granted_at timestamptz,
+                revoked_at timestamptz, last_accessed_at timestamptz, raw_data jsonb
+            )
+            ON CONFLICT (user_id, app_id)
+            DO UPDATE SET
+                status = EXCLUDED.status,
+                scopes = EXCLUDED.scopes,
+                granted_at = COALESCE(EXCLUDED.granted_at, app_grant.granted_at),
+                revoked_at = EXCLUDED.revoked_at,
+                last_accessed_at = COALESCE(EXCLUDED.last_accessed_at, app_grant.last_accessed_at),
+                raw_data = EXCLUDED.raw_data,
+                updated_at = NOW()
         """
-        return await self.conn.fetchval(query, organization_id)
+        # Stable key order keeps concurrent snapshot/stream upserts from deadlocking
+        ordered = sorted(dtos, key=lambda dto: (dto.user_id, dto.app_id))
+        payload = orjson.dumps([dto.model_dump() for dto in ordered]).decode()
+        result = await self.conn.execute(query, payload)
+        return int(result.split()[-1]) if result else 0
+
+    async def touch_last_accessed(
+        self,
+        organization_id: int,
+        entries: list[tuple[int, int, datetime | None]],
+    ) -> set[tuple[int, int]]:
+        if not entries:
+            return set()
 
-    async def find_by_app_with_users(
-        self, organization_id: int, app_id: int
-    ) -> list[AuthorizationWithUserDTO]:
-        
         query = """
-            SELECT 
-                g.user_id,
-                u.email,
-                u.full_name,
-                u.avatar_url,
-                g.scopes,
-                g.granted_at as authorized_at,
-                g.status
-            FROM app_grant g
-            JOIN identity_user u ON u.id = g.user_id
-            WHERE g.organization_id = $1 AND g.app_id = $2
-            ORDER BY g.granted_at DESC
+            UPDATE app_grant g
+            SET last_accessed_at = GREATEST(g.last_accessed_at, v.accessed_at),
+                updated_at = NOW()
+            FROM unnest($2::bigint[], $3::bigint[], $4::timestamptz[])
+                AS v(user_id, app_id, accessed_at)
+            WHERE g.organization_id = $1
+              AND g.user_id = v.user_id
+              AND g.app_id = v.app_id
+              AND g.status = 'active'
+            RETURNING g.user_id, g.app_id
         """
-        rows = await self.conn.fetch(query, organization_id, app_id)
-        
-        return [
-            AuthorizationWithUserDTO(
-                user_id=row["user_id"],
-                email=row["email"],
-                full_name=row["full_name"],
-                avatar_url=row["avatar_url"],
-                scopes=row["scopes"] if row["scopes"] else [],
-                authorized_at=row["authorized_at"],
-                status=row["status"]
-            )
-            for row in rows
-        ]
+        columns = list(zip(*sorted(entries, key=lambda entry: entry[:2])))
+        rows = await self.conn.fetch(query, organization_id, *columns)
+        return {(row["user_id"], row["app_id"]) for row in rows}
 
     async def find_by_app_and_user(self, app_id: int, user_id: int) -> AppGrant | None:
         query = "SELECT * FROM app_grant WHERE app_id = $1 AND user_id = $2"
@@ -97,5 +113,5 @@ class AppGrantRepository(BaseRepository[AppGrant]):
             return None
         data = dict(row)
         if isinstance(data.get('raw_data'), str):
-            data['raw_data'] = json.loads(data['raw_data'])
+            data['raw_data'] = orjson.loads(data['raw_data'])
         return AppGrant.model_validate(data)
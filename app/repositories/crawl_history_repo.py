@@ -1,7 +1,8 @@
 import json
+from datetime import datetime
 
 from app.dtos.crawl_history_dtos import CreateCrawlHistoryDTO, UpdateCrawlHistoryDTO
-from app.models.crawl_history import CrawlHistory
+from app.models.crawl_history import CrawlHistory, CrawlType
 
 from .base_repository import BaseRepository
 
@@ -78,6 +79,96 @@ class CrawlHistoryRepository(BaseRepository[CrawlHistory]):
             
         return CrawlHistory.model_validate(data)
 
+    async def create_many(
+        self, dtos: list[CreateCrawlHistoryDTO]
+    ) -> list[CrawlHistory]:
+        if not dtos:
+            return []
+
+        # Ids are drawn up front so the inserted rows can be returned in input order
+        query = """
+            WITH input AS (
+                SELECT *
+                FROM unnest(
+                    $1::bigint[], $2::bigint[], $3::text[], $4::text[],
+                    $5::timestamptz[], $6::text[], $7::text[]
+                ) WITH ORDINALITY AS t(
+                    organization_id, connection_id, crawl_type, status,
+                    started_at, stats_json, raw_debug_json, ord
+                )
+            ),
+            keyed AS (
+                SELECT nextval(pg_get_serial_sequence('crawl_history', 'id')) AS id, input.*
+                FROM input
+            ),
+            inserted AS (
+                INSERT INTO crawl_history (
+                    id, organization_id, connection_id, crawl_type, status,
+                    started_at, stats_json, raw_debug_json
+                )
+                SELECT
+                    id, organization_id, connection_id,
+                    crawl_type::crawl_type, status::crawl_status,
+                    started_at, stats_json::jsonb, raw_debug_json::jsonb
+                FROM keyed
+                RETURNING *
+            )
+            SELECT inserted.*
+            FROM inserted
+            JOIN keyed USING (id)
+            ORDER BY keyed.ord
+        """
+        rows = await self.conn.fetch(
+            query,
+            [dto.organization_id for dto in dtos],
+            [dto.connection_id for dto in dtos],
+            [dto.crawl_type.value for dto in dtos],
+            [dto.status.value for dto in dtos],
+            [dto.started_at for dto in dtos],
+            [json.dumps(dto.stats_json) for dto in dtos],
+            [json.dumps(dto.raw_debug_json) for dto in dtos],
+        )
+        return [self._to_model(row) for row in rows]
+
+    async def update_many(
+        self, updates: list[tuple[int, UpdateCrawlHistoryDTO]]
+    ) -> int:
+        if not updates:
+            return 0
+
+        # Unset fields arrive as NULL and keep the stored value
+        query = """
+            UPDATE crawl_history AS c
+            SET status = COALESCE(v.status::crawl_status, c.status),
+                finished_at = COALESCE(v.finished_at, c.finished_at),
+                error_message = COALESCE(v.error_message, c.error_message),
+                stats_json = COALESCE(v.stats_json::jsonb, c.stats_json),
+                raw_debug_json = COALESCE(v.raw_debug_json::jsonb, c.raw_debug_json)
+            FROM unnest(
+                $1::bigint[], $2::text[], $3::timestamptz[],
+                $4::text[], $5::text[], $6::text[]
+            ) AS v(id, status, finished_at, error_message, stats_json, raw_debug_json)
+            WHERE c.id = v.id
+        """
+        result = await self.conn.execute(
+            query,
+            [crawl_id for crawl_id, _ in updates],
+            [dto.status.value if dto.status else None for _, dto in updates],
+            [dto.finished_at for _, dto in updates],
+            [dto.error_message for _, dto in updates],
+            [
+                json.dumps(dto.stats_json) if dto.stats_json is not None else None
+                for _, dto in updates
+            ],
+            [
+                json.dumps(dto.raw_debug_json)
+                if dto.raw_debug_json is not None
+                else None
+                for _, dto in updates
+            ],
+        )
+        return int(result.split()[-1]) if result else 0
+
     async def find_last_successful_crawl(
         self, connection_id: int, crawl_type: str
     ) -> CrawlHistory | None:
@@ -102,6 +193,18 @@ class CrawlHistoryRepository(BaseRepository[CrawlHistory]):
             
         return CrawlHistory.model_validate(data)
 
+    async def find_last_successful_finished_at(
+        self, connection_id: int, crawl_type: CrawlType
+    ) -> datetime | None:
+        query = """
+            SELECT MAX(finished_at)
+            FROM crawl_history
+            WHERE connection_id = $1
+              AND crawl_type = $2
+              AND status = 'success'
+        """
+        return await self.conn.fetchval(query, connection_id, crawl_type.value)
+
     async def find_last_crawl(self, connection_id: int) -> CrawlHistory | None:
         query = """
             SELECT *
@@ -121,3 +224,11 @@ class CrawlHistoryRepository(BaseRepository[CrawlHistory]):
             data['raw_debug_json'] = json.loads(data['raw_debug_json'])
             
         return CrawlHistory.model_validate(data)
+
+    def _to_model(self, row) -> CrawlHistory:
+        data = dict(row)
+        if isinstance(data.get('stats_json'), str):
+            data['stats_json'] = json.loads(data['stats_json'])
+        if isinstance(data.get('raw_debug_json'), str):
+            data['raw_debug_json'] = json.loads(data['raw_debug_json'])
+        return CrawlHistory.model_validate(data)
@@ -1,3 +1,5 @@
+import json
+from datetime import datetime
 from typing import Any
 
 import asyncpg
@@ -9,6 +11,7 @@ from app.dtos.integration.connection_dtos import (
     UpdateIdentityProviderConnectionDTO,
     UpdateTokensDTO,
 )
+from app.dtos.workspace_dtos import ConnectionSettingsDTO
 from app.models.identity_provider_connection import IdentityProviderConnection
 
 
@@ -16,9 +19,9 @@ class IdentityProviderConnectionRepository:
 
     _SELECT_FIELDS = """
         id, organization_id, identity_provider_id, connected_by_user_id, status,
-        access_token, refresh_token, token_expires_at,
-        scopes_granted, admin_email, workspace_domain,
-        last_token_refresh_at, token_refresh_count,
+        access_token, refresh_token, access_token_hash, refresh_token_hash,
+        token_expires_at, scopes_granted, admin_email, workspace_domain,
+        last_event_cursor, last_token_refresh_at, token_refresh_count,
         error_code, error_message,
         created_at, updated_at, deleted_at
     """
@@ -36,6 +39,18 @@ class IdentityProviderConnectionRepository:
         row = await self._conn.fetchrow(query, *values)
         return self._map_to_model(row)
 
+    async def find_by_access_token_hash(
+        self, access_token_hash: bytes
+    ) -> IdentityProviderConnection | None:
+        query = f"""
+            SELECT {self._SELECT_FIELDS}
+            FROM identity_provider_connection
+            WHERE access_token_hash = :access_token_hash AND deleted_at IS NULL
+        """
+        query, values = bind_named(query, {"access_token_hash": access_token_hash})
+        row = await self._conn.fetchrow(query, *values)
+        return self._map_to_model(row)
+
     async def find_by_org_and_identity_provider(
         self, organization_id: int, identity_provider_id: int
     ) -> IdentityProviderConnection | None:
@@ -68,6 +83,36 @@ class IdentityProviderConnectionRepository:
         rows = await self._conn.fetch(query, *values)
         return [self._map_to_model(row) for row in rows if row]
 
+    async def find_settings_by_organization(
+        self, organization_id: int
+    ) -> ConnectionSettingsDTO | None:
+        # Narrow projection with the latest crawl joined in; sync flags are
+        # derived in SQL rather than from full connection and crawl rows
+        query = """
+            SELECT
+                c.id as connection_id, c.status, c.admin_email, c.workspace_domain,
+                lc.finished_at as last_sync_completed_at,
+                CAST(lc.status AS TEXT) as last_sync_status,
+                c.status = 'active' as can_sync,
+                COALESCE(lc.status = 'running', FALSE) as is_syncing
+            FROM identity_provider_connection c
+            LEFT JOIN LATERAL (
+                SELECT status, finished_at
+                FROM crawl_history
+                WHERE connection_id = c.id
+                ORDER BY started_at DESC
+                LIMIT 1
+            ) lc ON TRUE
+            WHERE c.organization_id = :organization_id AND c.deleted_at IS NULL
+            ORDER BY c.id
+            LIMIT 1
+        """
+        query, values = bind_named(query, {"organization_id": organization_id})
+        row = await self._conn.fetchrow(query, *values)
+        if not row:
+            return None
+        return ConnectionSettingsDTO.model_construct(**dict(row))
+
     async def find_active_connections(self) -> list[IdentityProviderConnection]:
         query = f"""
             SELECT {self._SELECT_FIELDS}
@@ -83,17 +128,15 @@ class IdentityProviderConnectionRepository:
         query = f"""
             INSERT INTO identity_provider_connection (
                 organization_id, identity_provider_id, connected_by_user_id, status,
-                access_token, refresh_token, token_expires_at,
-                scopes_granted, admin_email, workspace_domain
+                access_token, refresh_token, access_token_hash, refresh_token_hash,
+                token_expires_at, scopes_granted, admin_email, workspace_domain
             ) VALUES (
                 :organization_id, :identity_provider_id, :connected_by_user_id, :status,
-                :access_token, :refresh_token, :token_expires_at,
-                :scopes_granted, :admin_email, :workspace_domain
+                :access_token, :refresh_token, :access_token_hash, :refresh_token_hash,
+                :token_expires_at, :scopes_granted, :admin_email, :workspace_domain
             )
             RETURNING {self._SELECT_FIELDS}
         """
-        import json
-
         params = {
             "organization_id": dto.organization_id,
             "identity_provider_id": dto.identity_provider_id,
@@ -101,6 +144,8 @@ class IdentityProviderConnectionRepository:
             "status": dto.status,
             "access_token": dto.access_token,
             "refresh_token": dto.refresh_token,
+            "access_token_hash": dto.access_token_hash,
+            "refresh_token_hash": dto.refresh_token_hash,
             "token_expires_at": dto.token_expires_at,
             "scopes_granted": json.dumps(dto.scopes_granted),
             "admin_email": dto.admin_email,
@@ -143,20 +188,35 @@ class IdentityProviderConnectionRepository:
             UPDATE identity_provider_connection
             SET access_token = $1,
                 refresh_token = COALESCE($2, refresh_token),
-                token_expires_at = $3,
+                access_token_hash = $3,
+                refresh_token_hash = COALESCE($4, refresh_token_hash),
+                token_expires_at = $5,
                 last_token_refresh_at = NOW(),
                 token_refresh_count = token_refresh_count + 1,
                 updated_at = NOW()
-            WHERE id = $4
+            WHERE id = $6
         """
         await self._conn.execute(
             query,
             dto.access_token,
             dto.refresh_token,
+            dto.access_token_hash,
+            dto.refresh_token_hash,
             dto.token_expires_at,
             connection_id,
         )
 
+    async def update_last_event_cursor(
+        self, connection_id: int, cursor: datetime
+    ) -> None:
+        query = """
+            UPDATE identity_provider_connection
+            SET last_event_cursor = GREATEST(last_event_cursor, $1),
+                updated_at = NOW()
+            WHERE id = $2
+        """
+        await self._conn.execute(query, cursor, connection_id)
+
     async def mark_error(
         self,
         connection_id: int,
@@ -174,20 +234,35 @@ class IdentityProviderConnectionRepository:
             query, dto.status, dto.error_code, dto.error_message, connection_id
         )
 
-    async def soft_delete(self, connection_id: int) -> bool:
+    async def soft_delete(self, connection_id: int) -> int | None:
         query = """
             UPDATE identity_provider_connection
             SET deleted_at = NOW(), updated_at = NOW()
             WHERE id = $1 AND deleted_at IS NULL
+            RETURNING id
+        """
+        return await self._conn.fetchval(query, connection_id)
+
+    async def soft_delete_by_organization(self, organization_id: int) -> int | None:
+        # Oldest live connection for the organization, deleted in one statement
+        query = """
+            UPDATE identity_provider_connection
+            SET deleted_at = NOW(), updated_at = NOW()
+            WHERE id = (
+                SELECT id
+                FROM identity_provider_connection
+                WHERE organization_id = $1 AND deleted_at IS NULL
+                ORDER BY id
+                LIMIT 1
+            )
+              AND deleted_at IS NULL
+            RETURNING id
         """
-        result = await self._conn.execute(query, connection_id)
-        return result == "UPDATE 1"
+        return await self._conn.fetchval(query, organization_id)
 
     def _build_update_fields(
         self, dto: UpdateIdentityProviderConnectionDTO
     ) -> dict[str, Any]:
-        import json
-
         fields: dict[str, Any] = {}
         if dto.status is not None:
             fields["status"] = dto.status
@@ -195,6 +270,10 @@ class IdentityProviderConnectionRepository:
             fields["access_token"] = dto.access_token
         if dto.refresh_token is not None:
             fields["refresh_token"] = dto.refresh_token
+        if dto.access_token_hash is not None:
+            fields["access_token_hash"] = dto.access_token_hash
+        if dto.refresh_token_hash is not None:
+            fields["refresh_token_hash"] = dto.refresh_token_hash
         if dto.token_expires_at is not None:
             fields["token_expires_at"] = dto.token_expires_at
         if dto.scopes_granted is not None:
@@ -218,8 +297,6 @@ class IdentityProviderConnectionRepository:
 
         scopes = row["scopes_granted"]
         if isinstance(scopes, str):
-            import json
-
             scopes = json.loads(scopes)
 
         return IdentityProviderConnection(
@@ -230,10 +307,13 @@ class IdentityProviderConnectionRepository:
             status=row["status"],
             access_token=row["access_token"],
             refresh_token=row["refresh_token"],
+            access_token_hash=row["access_token_hash"],
+            refresh_token_hash=row["refresh_token_hash"],
             token_expires_at=row["token_expires_at"],
             scopes_granted=scopes or [],
             admin_email=row["admin_email"],
             workspace_domain=row["workspace_domain"],
+            last_event_cursor=row["last_event_cursor"],
 
             last_token_refresh_at=row["last_token_refresh_at"],
             token_refresh_count=row["token_refresh_count"],
@@ -2,6 +2,10 @@ import json
 
 import asyncpg
 
+from app.core.cache import (
+    identity_provider_by_id_cache,
+    identity_provider_by_slug_cache,
+)
 from app.database.query_builder import bind_named
 from app.models.identity_provider import IdentityProvider
 
@@ -17,6 +21,10 @@ class IdentityProviderRepository:
         self._conn = conn
 
     async def find_by_slug(self, slug: str) -> IdentityProvider | None:
+        cached = identity_provider_by_slug_cache.get(slug)
+        if cached is not None:
+            return cached
+
         query = f"""
             SELECT {self._SELECT_FIELDS}
             FROM identity_provider
@@ -24,9 +32,16 @@ class IdentityProviderRepository:
         """
         query, values = bind_named(query, {"slug": slug})
         row = await self._conn.fetchrow(query, *values)
-        return self._map_to_model(row)
+        identity_provider = self._map_to_model(row)
+        if identity_provider is not None:
+            identity_provider_by_slug_cache[slug] = identity_provider
+        return identity_provider
 
     async def find_by_id(self, identity_provider_id: int) -> IdentityProvider | None:
+        cached = identity_provider_by_id_cache.get(identity_provider_id)
+        if cached is not None:
+            return cached
+
         query = f"""
             SELECT {self._SELECT_FIELDS}
             FROM identity_provider
@@ -36,7 +51,10 @@ class IdentityProviderRepository:
             query, {"identity_provider_id": identity_provider_id}
         )
         row = await self._conn.fetchrow(query, *values)
-        return self._map_to_model(row)
+        identity_provider = self._map_to_model(row)
+        if identity_provider is not None:
+            identity_provider_by_id_cache[identity_provider_id] = identity_provider
+        return identity_provider
 
     def _map_to_model(self, row: asyncpg.Record | None) -> IdentityProvider | None:
         if row is None:
@@ -1,12 +1,20 @@
-import json
+from dataclasses import fields
+from operator import itemgetter
 from typing import Any
 
+import orjson
+
 from app.dtos.oauth_app_dtos import CreateOAuthAppDTO, OAuthAppWithStatsDTO
+from app.dtos.workspace_dtos import AppWithAuthorizationsDTO
 from app.models.oauth_app import OAuthApp
 
 from .base_repository import BaseRepository
 
 
+# Reads a row's values in DTO field order so each DTO is built positionally
+_app_with_stats_values = itemgetter(*(f.name for f in fields(OAuthAppWithStatsDTO)))
+
+
 class OAuthAppRepository(BaseRepository[OAuthApp]):
     def __init__(self, conn):
         super().__init__(conn, OAuthApp)
@@ -20,8 +28,7 @@ class OAuthAppRepository(BaseRepository[OAuthApp]):
             
         data = dict(row)
         if isinstance(data.get('raw_data'), str):
-            import json
-            data['raw_data'] = json.loads(data['raw_data'])
+            data['raw_data'] = orjson.loads(data['raw_data'])
         return OAuthApp.model_validate(data)
 
     async def upsert(self, dto: CreateOAuthAppDTO) -> OAuthApp:
@@ -52,11 +59,11 @@ class OAuthAppRepository(BaseRepository[OAuthApp]):
             dto.is_trusted,
             dto.scopes_summary,
             dto.image_url,
-            json.dumps(dto.raw_data),
+            orjson.dumps(dto.raw_data).decode(),
         )
         data = dict(row)
         if isinstance(data.get('raw_data'), str):
-            data['raw_data'] = json.loads(data['raw_data'])
+            data['raw_data'] = orjson.loads(data['raw_data'])
         
         result_app = OAuthApp.model_validate(data)
         # import logging
@@ -64,9 +71,44 @@ class OAuthAppRepository(BaseRepository[OAuthApp]):
         # logger.info(f"Upserted app: {result_app.id} - {result_app.name} ({result_app.client_id})")
         return result_app
 
+    async def bulk_upsert(self, dtos: list[CreateOAuthAppDTO]) -> dict[str, int]:
+        if not dtos:
+            return {}
+
+        query = """
+            INSERT INTO oauth_app (
+                organization_id, connection_id, client_id, name,
+                risk_score, is_system_app, is_trusted, scopes_summary,
+                image_url, raw_data
+            )
+            SELECT
+                organization_id, connection_id, client_id, name,
+                risk_score, is_system_app, is_trusted, scopes_summary,
+                image_url, raw_data
+            FROM jsonb_to_recordset($1::jsonb) AS r(
+                organization_id bigint, connection_id bigint, client_id text,
+                name text, risk_score integer, is_system_app boolean,
+                is_trusted boolean, scopes_summary text[], image_url text,
+                raw_data jsonb
+            )
+            ON CONFLICT (connection_id, client_id)
+            DO UPDATE SET
+                name = EXCLUDED.name,
+                scopes_summary = EXCLUDED.scopes_summary,
+                image_url = EXCLUDED.image_url,
+                raw_data = EXCLUDED.raw_data,
+                updated_at = NOW()
+            RETURNING client_id, id
+        """
+        # Stable key order keeps concurrent snapshot/stream upserts from deadlocking
+        ordered = sorted(dtos, key=lambda dto: (dto.connection_id, dto.client_id))
+        payload = orjson.dumps([dto.model_dump() for dto in ordered]).decode()
+        rows = await self.conn.fetch(query, payload)
+        return {row["client_id"]: row["id"] for row in rows}
+
     async def find_paginated_with_stats(
         self, organization_id: int, limit: int, offset: int, search: str | None = None
-    ) -> list[OAuthAppWithStatsDTO]:
+    ) -> tuple[list[OAuthAppWithStatsDTO], int]:
         # Returns raw dicts to be mapped to OAuthAppWithStatsDTO by service
         # Using LEFT JOIN on app_grant to count active users
         params = [organization_id, limit, offset]
@@ -75,11 +117,16 @@ class OAuthAppRepository(BaseRepository[OAuthApp]):
             search_clause = "AND name ILIKE $4"
             params.append(f"%{search}%")
 
+        # COUNT(*) OVER () runs after GROUP BY, so it counts matching apps
         query = f"""
             SELECT 
-                a.*,
+                a.id, a.organization_id, a.connection_id, a.client_id, a.name,
+                a.risk_score, a.is_system_app, a.is_trusted,
+                COALESCE(a.scopes_summary, '{{}}') as scopes_summary,
+                a.image_url, a.created_at, a.updated_at,
                 COUNT(g.id) FILTER (WHERE g.status = 'active') as active_grants_count,
-                MAX(g.last_accessed_at) as last_activity_at
+                MAX(g.last_accessed_at) as last_activity_at,
+                COUNT(*) OVER () as total_count
             FROM oauth_app a
             LEFT JOIN app_grant g ON a.id = g.app_id
             WHERE a.organization_id = $1
@@ -89,11 +136,63 @@ class OAuthAppRepository(BaseRepository[OAuthApp]):
             LIMIT $2 OFFSET $3
         """
         rows = await self.conn.fetch(query, *params)
-        return [
-            OAuthAppWithStatsDTO(**dict(row))
-            for row in rows
-        ]
+        total = rows[0]["total_count"] if rows else 0
+        return [OAuthAppWithStatsDTO(*_app_with_stats_values(row)) for row in rows], total
 
-    async def count_by_organization(self, organization_id: int) -> int:
+    async def find_with_authorizations(
+        self, organization_id: int, app_id: int
+    ) -> AppWithAuthorizationsDTO | None:
+        query = """
+            SELECT
+                a.id, a.name, a.client_id, a.risk_score, a.is_system_app,
+                a.is_trusted, a.scopes_summary,
+                COUNT(g.id) FILTER (WHERE g.status = 'active') as active_grants_count,
+                MAX(g.last_accessed_at) as last_activity_at,
+                COALESCE(
+                    json_agg(
+                        json_build_object(
+                            'user_id', g.user_id,
+                            'email', u.email,
+                            'full_name', u.full_name,
+                            'avatar_url', u.avatar_url,
+                            'scopes', COALESCE(g.scopes, '{}'),
+                            'authorized_at', g.granted_at,
+                            'status', g.status
+                        )
+                        ORDER BY g.granted_at DESC
+                    ) FILTER (WHERE g.id IS NOT NULL),
+                    '[]'
+                ) as authorizations
+            FROM oauth_app a
+            LEFT JOIN (
+                app_grant g JOIN identity_user u ON u.id = g.user_id
+            ) ON g.app_id = a.id AND g.organization_id = a.organization_id
+            WHERE a.id = $1 AND a.organization_id = $2
+            GROUP BY a.id
+        """
+        row = await self.conn.fetchrow(query, app_id, organization_id)
+        if not row:
+            return None
+
+        return AppWithAuthorizationsDTO(
+            id=row["id"],
+            name=row["name"],
+            client_id=row["client_id"],
+            status="active" if row["is_trusted"] else "review",
+            risk_score=row["risk_score"],
+            is_system_app=row["is_system_app"],
+            is_trusted=row["is_trusted"],
+            all_scopes=row["scopes_summary"] or [],
+            active_grants_count=row["active_grants_count"],
+            last_activity_at=row["last_activity_at"],
+            authorizations=orjson.loads(row["authorizations"]),
+        )
+
+    async def count_by_organization(
+        self, organization_id: int, search: str | None = None
+    ) -> int:
         query = "SELECT COUNT(*) FROM oauth_app WHERE organization_id = $1"
+        if search:
+            query += " AND name ILIKE $2"
+            return await self.conn.fetchval(query, organization_id, f"%{search}%")
         return await self.conn.fetchval(query, organization_id)
@@ -1,6 +1,9 @@
-import json
+from collections.abc import AsyncIterator
+from datetime import datetime
 from typing import Any
 
+import orjson
+
 from app.dtos.oauth_event_dtos import CreateOAuthEventDTO, OAuthEventResponseDTO
 from app.models.oauth_event import OAuthEvent
 
@@ -28,11 +31,11 @@ class OAuthEventRepository(BaseRepository[OAuthEvent]):
             dto.app_id,
             dto.event_type,
             dto.event_time,
-            json.dumps(dto.raw_data),
+            orjson.dumps(dto.raw_data).decode(),
         )
         data = dict(row)
         if isinstance(data.get('raw_data'), str):
-            data['raw_data'] = json.loads(data['raw_data'])
+            data['raw_data'] = orjson.loads(data['raw_data'])
         return OAuthEvent.model_validate(data)
 
     async def exists(
@@ -62,17 +65,87 @@ class OAuthEventRepository(BaseRepository[OAuthEvent]):
             event_time
         )
 
+    async def find_existing_keys(
+        self,
+        organization_id: int,
+        keys: list[tuple[int, int, str, datetime]],
+    ) -> set[tuple[int, int, str, datetime]]:
+        if not keys:
+            return set()
+
+        query = """
+            SELECT e.user_id, e.app_id, e.event_type, e.event_time
+            FROM oauth_event e
+            JOIN unnest($2::bigint[], $3::bigint[], $4::text[], $5::timestamptz[])
+                AS k(user_id, app_id, event_type, event_time)
+              ON e.user_id = k.user_id
+             AND e.app_id = k.app_id
+             AND e.event_type = k.event_type
+             AND e.event_time = k.event_time
+            WHERE e.organization_id = $1
+        """
+        columns = list(zip(*keys))
+        rows = await self.conn.fetch(query, organization_id, *columns)
+        return {
+            (row["user_id"], row["app_id"], row["event_type"], row["event_time"])
+            for row in rows
+        }
+
+    async def bulk_create(self, dtos: list[CreateOAuthEventDTO]) -> int:
+        if not dtos:
+            return 0
+
+        query = """
+            INSERT INTO oauth_event (
+                organization_id, connection_id, user_id, app_id,
+                event_type, event_time, raw_data
+            )
+            SELECT * FROM unnest(
+                $1::bigint[], $2::bigint[], $3::bigint[], $4::bigint[],
+                $5::varchar[], $6::timestamptz[], $7::jsonb[]
+            )
+        """
+        columns = list(
+            zip(
+                *(
+                    (
+                        dto.organization_id,
+                        dto.connection_id,
+                        dto.user_id,
+                        dto.app_id,
+                        dto.event_type,
+                        dto.event_time,
+                        orjson.dumps(dto.raw_data).decode(),
+                    )
+                    for dto in dtos
+                )
+            )
+        )
+        result = await self.conn.execute(query, *columns)
+        return int(result.split()[-1]) if result else 0
+
     async def find_paginated_by_app(
-        self, organization_id: int, app_id: int, limit: int, offset: int, user_id: int | None = None
-    ) -> list[OAuthEventResponseDTO]:
+        self,
+        organization_id: int,
+        app_id: int,
+        limit: int,
+        offset: int,
+        user_id: int | None = None,
+        after: tuple[datetime, int] | None = None,
+    ) -> tuple[list[OAuthEventResponseDTO], int | None]:
         # Returns raw dicts for DTO mapping
-        # Joining with workspace_user to get actor details
-        base_query = """
+        # Joining with workspace_user to get actor details.
+        # A window total would stop the keyset scan from ending at LIMIT, so
+        # cursor pages leave the total to the caller (None)
+        total_column = "NULL" if after is not None else "COUNT(*) OVER ()"
+        base_query = f"""
             SELECT 
-                e.*,
+                e.id, e.organization_id, e.user_id, e.app_id,
+                e.event_type, e.event_time,
                 u.email as actor_email,
                 u.full_name as actor_name,
-                u.avatar_url as actor_avatar_url
+                u.avatar_url as actor_avatar_url,
+                {total_column} as total_count
             FROM oauth_event e
             LEFT JOIN identity_user u ON e.user_id = u.id
             WHERE e.organization_id = $1 AND e.app_id = $2
@@ -82,12 +155,49 @@ class OAuthEventRepository(BaseRepository[OAuthEvent]):
         if user_id is not None:
             base_query += f" AND e.user_id = ${len(args) + 1}"
             args.append(user_id)
-            
-        base_query += f" ORDER BY e.event_time DESC LIMIT ${len(args) + 1} OFFSET ${len(args) + 2}"
-        args.extend([limit, offset])
+
+        if after is not None:
+            base_query += f" AND (e.event_time, e.id) < (${len(args) + 1}, ${len(args) + 2})"
+            args.extend(after)
+            base_query += f" ORDER BY e.event_time DESC, e.id DESC LIMIT ${len(args) + 1}"
+            args.append(limit)
+        else:
+            base_query += f" ORDER BY e.event_time DESC, e.id DESC LIMIT ${len(args) + 1} OFFSET ${len(args) + 2}"
+            args.extend([limit, offset])
 
         rows = await self.conn.fetch(base_query, *args)
-        return [OAuthEventResponseDTO(**dict(row)) for row in rows]
+        total = None if after is not None else (rows[0]["total_count"] if rows else 0)
+        # Rows come typed from asyncpg; model_construct skips re-validation
+        return [OAuthEventResponseDTO.model_construct(**dict(row)) for row in rows], total
+
+    async def iter_by_app(
+        self,
+        organization_id: int,
+        app_id: int,
+        user_id: int | None = None,
+        prefetch: int = 1000,
+    ) -> AsyncIterator[OAuthEventResponseDTO]:
+        # Server-side cursor keeps memory flat for full-timeline exports;
+        # must be consumed inside a transaction on this connection
+        query = """
+            SELECT 
+                e.id, e.organization_id, e.user_id, e.app_id,
+                e.event_type, e.event_time,
+                u.email as actor_email,
+                u.full_name as actor_name,
+                u.avatar_url as actor_avatar_url
+            FROM oauth_event e
+            LEFT JOIN identity_user u ON e.user_id = u.id
+            WHERE e.organization_id = $1 AND e.app_id = $2
+        """
+        args = [organization_id, app_id]
+        if user_id is not None:
+            query += " AND e.user_id = $3"
+            args.append(user_id)
+        query += " ORDER BY e.event_time DESC, e.id DESC"
+
+        async for row in self.conn.cursor(query, *args, prefetch=prefetch):
+            yield OAuthEventResponseDTO.model_construct(**dict(row))
 
     async def count_by_app(self, organization_id: int, app_id: int, user_id: int | None = None) -> int:
         query = "SELECT COUNT(*) FROM oauth_event WHERE organization_id = $1 AND app_id = $2"
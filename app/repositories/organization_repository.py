@@ -45,13 +45,14 @@ class OrganizationRepository:
         row = await self._conn.fetchrow(query, *values)
         return self._map_to_model(row)
 
-    async def create(self, dto: CreateOrganizationDTO) -> Organization:
+    async def create(self, dto: CreateOrganizationDTO) -> Organization | None:
         query = f"""
             INSERT INTO organization (
                 name, slug, domain, plan_id, status
             ) VALUES (
                 :name, :slug, :domain, :plan_id, :status
             )
+            ON CONFLICT (slug) DO NOTHING
             RETURNING {self._SELECT_FIELDS}
         """
         params = {
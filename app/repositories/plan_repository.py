@@ -1,5 +1,6 @@
 import asyncpg
 
+from app.core.cache import plan_by_id_cache, plan_by_name_cache
 from app.database.query_builder import bind_named
 from app.models.plan import Plan
 
@@ -15,6 +16,10 @@ class PlanRepository:
         self._conn = conn
 
     async def find_by_name(self, name: str) -> Plan | None:
+        cached = plan_by_name_cache.get(name)
+        if cached is not None:
+            return cached
+
         query = f"""
             SELECT {self._SELECT_FIELDS}
             FROM plan
@@ -22,9 +27,16 @@ class PlanRepository:
         """
         query, values = bind_named(query, {"name": name})
         row = await self._conn.fetchrow(query, *values)
-        return self._map_to_model(row)
+        plan = self._map_to_model(row)
+        if plan is not None:
+            plan_by_name_cache[name] = plan
+        return plan
 
     async def find_by_id(self, plan_id: int) -> Plan | None:
+        cached = plan_by_id_cache.get(plan_id)
+        if cached is not None:
+            return cached
+
         query = f"""
             SELECT {self._SELECT_FIELDS}
             FROM plan
@@ -32,7 +44,10 @@ class PlanRepository:
         """
         query, values = bind_named(query, {"plan_id": plan_id})
         row = await self._conn.fetchrow(query, *values)
-        return self._map_to_model(row)
+        plan = self._map_to_model(row)
+        if plan is not None:
+            plan_by_id_cache[plan_id] = plan
+        return plan
 
     def _map_to_model(self, row: asyncpg.Record | None) -> Plan | None:
         if row is None:
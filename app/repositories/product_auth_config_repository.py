@@ -2,6 +2,7 @@ import json
 
 import asyncpg
 
+from app.core.cache import auth_config_by_identity_provider_cache
 from app.database.query_builder import bind_named
 from app.models.product_auth_config import ProductAuthConfig
 
@@ -20,6 +21,10 @@ class ProductAuthConfigRepository:
     async def find_by_identity_provider_id(
         self, identity_provider_id: int
     ) -> ProductAuthConfig | None:
+        cached = auth_config_by_identity_provider_cache.get(identity_provider_id)
+        if cached is not None:
+            return cached
+
         query = f"""
             SELECT {self._SELECT_FIELDS}
             FROM product_auth_config
@@ -30,7 +35,10 @@ class ProductAuthConfigRepository:
             query, {"identity_provider_id": identity_provider_id}
         )
         row = await self._conn.fetchrow(query, *values)
-        return self._map_to_model(row)
+        auth_config = self._map_to_model(row)
+        if auth_config is not None:
+            auth_config_by_identity_provider_cache[identity_provider_id] = auth_config
+        return auth_config
 
     async def find_by_product_id(self, product_id: int) -> ProductAuthConfig | None:
         query = f"""
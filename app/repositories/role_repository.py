@@ -1,5 +1,6 @@
 import asyncpg
 
+from app.core.cache import role_by_id_cache, role_by_name_cache
 from app.database.query_builder import bind_named
 from app.models.role import Role
 
@@ -14,6 +15,10 @@ class RoleRepository:
         self._conn = conn
 
     async def find_by_name(self, name: str) -> Role | None:
+        cached = role_by_name_cache.get(name)
+        if cached is not None:
+            return cached
+
         query = f"""
             SELECT {self._SELECT_FIELDS}
             FROM role
@@ -21,9 +26,16 @@ class RoleRepository:
         """
         query, values = bind_named(query, {"name": name})
         row = await self._conn.fetchrow(query, *values)
-        return self._map_to_model(row)
+        role = self._map_to_model(row)
+        if role is not None:
+            role_by_name_cache[name] = role
+        return role
 
     async def find_by_id(self, role_id: int) -> Role | None:
+        cached = role_by_id_cache.get(role_id)
+        if cached is not None:
+            return cached
+
         query = f"""
             SELECT {self._SELECT_FIELDS}
             FROM role
@@ -31,7 +43,10 @@ class RoleRepository:
         """
         query, values = bind_named(query, {"role_id": role_id})
         row = await self._conn.fetchrow(query, *values)
-        return self._map_to_model(row)
+        role = self._map_to_model(row)
+        if role is not None:
+            role_by_id_cache[role_id] = role
+        return role
 
     def _map_to_model(self, row: asyncpg.Record | None) -> Role | None:
         if row is None:
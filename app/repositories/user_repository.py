@@ -1,9 +1,61 @@
 import asyncpg
 
 from app.database.query_builder import bind_named
-from app.dtos.user_dtos import CreateUserDTO, UpdateUserDTO
+from app.dtos.user_dtos import (
+    CreateUserDTO,
+    UpdateUserDTO,
+    UserAuthBundleDTO,
+    UserWithOrganizationDTO,
+)
+from app.models.organization import Organization
+from app.models.plan import Plan
+from app.models.role import Role
 from app.models.user import User
 
+_AUTH_BUNDLE_QUERY = """
+    SELECT
+        u.id, u.organization_id, u.role_id, u.email, u.full_name, u.avatar_url,
+        u.provider_id, u.email_verified, u.status, u.invited_by_user_id,
+        u.invited_at, u.joined_at, u.last_login_at, u.created_at, u.updated_at,
+        u.deleted_at,
+        o.id AS org_id, o.name AS org_name, o.slug AS org_slug,
+        o.domain AS org_domain, o.logo_url AS org_logo_url,
+        o.plan_id AS org_plan_id, o.status AS org_status,
+        o.created_at AS org_created_at, o.updated_at AS org_updated_at,
+        o.deleted_at AS org_deleted_at,
+        r.id AS role_id_, r.name AS role_name,
+        r.display_name AS role_display_name, r.description AS role_description,
+        r.created_at AS role_created_at, r.updated_at AS role_updated_at,
+        p.id AS plan_id, p.name AS plan_name,
+        p.display_name AS plan_display_name, p.description AS plan_description,
+        p.max_users AS plan_max_users, p.max_apps AS plan_max_apps,
+        p.price_monthly_cents AS plan_price_monthly_cents,
+        p.price_yearly_cents AS plan_price_yearly_cents,
+        p.is_active AS plan_is_active,
+        p.created_at AS plan_created_at, p.updated_at AS plan_updated_at
+    FROM "user" u
+    LEFT JOIN organization o ON o.id = u.organization_id AND o.deleted_at IS NULL
+    LEFT JOIN role r ON r.id = u.role_id
+    LEFT JOIN plan p ON p.id = o.plan_id
+    WHERE u.id = $1 AND u.deleted_at IS NULL
+"""
+
+_USER_WITH_ORGANIZATION_QUERY = """
+    SELECT
+        u.id, u.organization_id, u.role_id, u.email, u.full_name, u.avatar_url,
+        u.provider_id, u.email_verified, u.status, u.invited_by_user_id,
+        u.invited_at, u.joined_at, u.last_login_at, u.created_at, u.updated_at,
+        u.deleted_at,
+        o.id AS org_id, o.name AS org_name, o.slug AS org_slug,
+        o.domain AS org_domain, o.logo_url AS org_logo_url,
+        o.plan_id AS org_plan_id, o.status AS org_status,
+        o.created_at AS org_created_at, o.updated_at AS org_updated_at,
+        o.deleted_at AS org_deleted_at
+    FROM "user" u
+    LEFT JOIN organization o ON o.id = u.organization_id AND o.deleted_at IS NULL
+    WHERE u.id = $1 AND u.deleted_at IS NULL
+"""
+
 
 class UserRepository:
 
@@ -36,6 +88,32 @@ class UserRepository:
         row = await self._conn.fetchrow(query, *values)
         return self._map_to_model(row)
 
+    async def find_by_provider_or_email(
+        self, provider_id: str, email: str
+    ) -> tuple[User | None, User | None]:
+        query = f"""
+            SELECT {self._SELECT_FIELDS}
+            FROM "user"
+            WHERE (provider_id = :provider_id OR LOWER(email) = LOWER(:email))
+              AND deleted_at IS NULL
+            ORDER BY (provider_id = :provider_id) DESC
+            LIMIT 2
+        """
+        query, values = bind_named(
+            query, {"provider_id": provider_id, "email": email}
+        )
+        rows = await self._conn.fetch(query, *values)
+
+        by_provider: User | None = None
+        by_email: User | None = None
+        for row in rows:
+            user = self._map_to_model(row)
+            if user.provider_id == provider_id:
+                by_provider = user
+            elif by_email is None:
+                by_email = user
+        return by_provider, by_email
+
     async def find_by_id(self, user_id: int) -> User | None:
         query = f"""
             SELECT {self._SELECT_FIELDS}
@@ -46,6 +124,58 @@ class UserRepository:
         row = await self._conn.fetchrow(query, *values)
         return self._map_to_model(row)
 
+    async def find_with_organization(
+        self, user_id: int
+    ) -> UserWithOrganizationDTO | None:
+        row = await self._conn.fetchrow(_USER_WITH_ORGANIZATION_QUERY, user_id)
+        if row is None:
+            return None
+        return UserWithOrganizationDTO(
+            user=self._map_to_model(row),
+            organization=self._map_joined_organization(row),
+        )
+
+    async def find_auth_bundle(self, user_id: int) -> UserAuthBundleDTO | None:
+        row = await self._conn.fetchrow(_AUTH_BUNDLE_QUERY, user_id)
+        if row is None:
+            return None
+
+        organization = self._map_joined_organization(row)
+
+        role = None
+        if row["role_id_"] is not None:
+            role = Role(
+                id=row["role_id_"],
+                name=row["role_name"],
+                display_name=row["role_display_name"],
+                description=row["role_description"],
+                created_at=row["role_created_at"],
+                updated_at=row["role_updated_at"],
+            )
+
+        plan = None
+        if row["plan_id"] is not None:
+            plan = Plan(
+                id=row["plan_id"],
+                name=row["plan_name"],
+                display_name=row["plan_display_name"],
+                description=row["plan_description"],
+                max_users=row["plan_max_users"],
+                max_apps=row["plan_max_apps"],
+                price_monthly_cents=row["plan_price_monthly_cents"],
+                price_yearly_cents=row["plan_price_yearly_cents"],
+                is_active=row["plan_is_active"],
+                created_at=row["plan_created_at"],
+                updated_at=row["plan_updated_at"],
+            )
+
+        return UserAuthBundleDTO(
+            user=self._map_to_model(row),
+            organization=organization,
+            role=role,
+            plan=plan,
+        )
+
     async def create(self, dto: CreateUserDTO) -> User:
         query = f"""
             INSERT INTO "user" (
@@ -109,6 +239,22 @@ class UserRepository:
             fields["last_login_at"] = dto.last_login_at
         return fields
 
+    def _map_joined_organization(self, row: asyncpg.Record) -> Organization | None:
+        if row["org_id"] is None:
+            return None
+        return Organization(
+            id=row["org_id"],
+            name=row["org_name"],
+            slug=row["org_slug"],
+            domain=row["org_domain"],
+            logo_url=row["org_logo_url"],
+            plan_id=row["org_plan_id"],
+            status=row["org_status"],
+            created_at=row["org_created_at"],
+            updated_at=row["org_updated_at"],
+            deleted_at=row["org_deleted_at"],
+        )
+
     def _map_to_model(self, row: asyncpg.Record | None) -> User | None:
         if row is None:
             return None
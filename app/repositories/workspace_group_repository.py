@@ -1,6 +1,9 @@
+from dataclasses import fields
+from operator import itemgetter
 from typing import Any
 
 import asyncpg
+import orjson
 
 from app.database.query_builder import bind_named
 from app.dtos.integration.workspace_dtos import (
@@ -18,6 +21,11 @@ from app.models.group_membership import GroupMembership
 from app.models.workspace_group import WorkspaceGroup
 
 
+_group_with_member_count_values = itemgetter(
+    *(f.name for f in fields(WorkspaceGroupWithMemberCountDTO))
+)
+
+
 class WorkspaceGroupRepository:
 
     _SELECT_FIELDS = """
@@ -26,6 +34,19 @@ class WorkspaceGroupRepository:
         created_at, updated_at
     """
 
+    COPY_UPSERT_MIN_ROWS = 500
+
+    _STAGE_COLUMNS = [
+        "organization_id",
+        "connection_id",
+        "provider_group_id",
+        "email",
+        "name",
+        "description",
+        "direct_members_count",
+        "raw_data",
+    ]
+
     def __init__(self, conn: asyncpg.Connection):
         self._conn = conn
 
@@ -81,8 +102,6 @@ class WorkspaceGroupRepository:
         return [self._map_to_model(row) for row in rows if row]
 
     async def upsert(self, dto: CreateWorkspaceGroupDTO) -> WorkspaceGroup:
-        import json
-
         query = f"""
             INSERT INTO identity_user_group (
                 organization_id, connection_id, provider_group_id, email,
@@ -109,12 +128,96 @@ class WorkspaceGroupRepository:
             "name": dto.name,
             "description": dto.description,
             "direct_members_count": dto.direct_members_count,
-            "raw_data": json.dumps(dto.raw_data),
+            "raw_data": orjson.dumps(dto.raw_data).decode(),
         }
         query, values = bind_named(query, params)
         row = await self._conn.fetchrow(query, *values)
         return self._map_to_model(row)
 
+    async def bulk_upsert(self, dtos: list[CreateWorkspaceGroupDTO]) -> int:
+        if not dtos:
+            return 0
+
+        records = self._to_stage_records(dtos)
+        query = """
+            INSERT INTO identity_user_group (
+                organization_id, connection_id, provider_group_id, email,
+                name, description, direct_members_count, raw_data, last_synced_at
+            )
+            SELECT * FROM unnest(
+                $1::bigint[], $2::bigint[], $3::varchar[], $4::varchar[],
+                $5::varchar[], $6::text[], $7::integer[], $8::jsonb[]
+            ), NOW()
+            ON CONFLICT (organization_id, provider_group_id) DO UPDATE SET
+                email = EXCLUDED.email,
+                name = EXCLUDED.name,
+                description = EXCLUDED.description,
+                direct_members_count = EXCLUDED.direct_members_count,
+                raw_data = EXCLUDED.raw_data,
+                last_synced_at = NOW(),
+                updated_at = NOW()
+        """
+
+        columns = list(zip(*records))
+        result = await self._conn.execute(query, *columns)
+        return int(result.split()[-1]) if result else 0
+
+    async def copy_upsert(self, dtos: list[CreateWorkspaceGroupDTO]) -> int:
+        if len(dtos) < self.COPY_UPSERT_MIN_ROWS:
+            return await self.bulk_upsert(dtos)
+
+        create_stage_query = """
+            CREATE TEMP TABLE identity_user_group_stage (
+                organization_id BIGINT, connection_id BIGINT,
+                provider_group_id VARCHAR(255), email VARCHAR(255),
+                name VARCHAR(255), description TEXT,
+                direct_members_count INTEGER, raw_data JSONB
+            ) ON COMMIT DROP
+        """
+        merge_query = """
+            INSERT INTO identity_user_group (
+                organization_id, connection_id, provider_group_id, email,
+                name, description, direct_members_count, raw_data, last_synced_at
+            )
+            SELECT
+                organization_id, connection_id, provider_group_id, email,
+                name, description, direct_members_count, raw_data, NOW()
+            FROM identity_user_group_stage
+            ON CONFLICT (organization_id, provider_group_id) DO UPDATE SET
+                email = EXCLUDED.email,
+                name = EXCLUDED.name,
+                description = EXCLUDED.description,
+                direct_members_count = EXCLUDED.direct_members_count,
+                raw_data = EXCLUDED.raw_data,
+                last_synced_at = NOW(),
+                updated_at = NOW()
+        """
+
+        async with self._conn.transaction():
+            await self._conn.execute(create_stage_query)
+            await self._conn.copy_records_to_table(
+                "identity_user_group_stage",
+                records=self._to_stage_records(dtos),
+                columns=self._STAGE_COLUMNS,
+            )
+            result = await self._conn.execute(merge_query)
+        return int(result.split()[-1]) if result else 0
+
+    def _to_stage_records(self, dtos: list[CreateWorkspaceGroupDTO]) -> list[tuple]:
+        return [
+            (
+                dto.organization_id,
+                dto.connection_id,
+                dto.provider_group_id,
+                dto.email,
+                dto.name,
+                dto.description,
+                dto.direct_members_count,
+                orjson.dumps(dto.raw_data).decode(),
+            )
+            for dto in dtos
+        ]
+
     async def upsert_membership(self, dto: CreateGroupMembershipDTO) -> GroupMembership:
         query = """
             INSERT INTO group_membership (identity_user_id, identity_user_group_id, role)
@@ -149,9 +252,7 @@ class WorkspaceGroupRepository:
 
         raw_data = row["raw_data"]
         if isinstance(raw_data, str):
-            import json
-
-            raw_data = json.loads(raw_data)
+            raw_data = orjson.loads(raw_data)
 
         return WorkspaceGroup(
             id=row["id"],
@@ -195,9 +296,6 @@ class WorkspaceGroupRepository:
                 count_query,
                 {"organization_id": organization_id},
             )
-        count_row = await self._conn.fetchrow(count_query, *count_values)
-        total = count_row["total"] if count_row else 0
-
         if search_pattern:
             query = """
                 SELECT id, email, name, description, direct_members_count
@@ -233,28 +331,20 @@ class WorkspaceGroupRepository:
                 },
             )
         rows = await self._conn.fetch(query, *values)
+        # A short page (or an empty first page) pins the total without a COUNT
+        if rows and len(rows) < params.page_size:
+            total = offset + len(rows)
+        elif not rows and params.page == 1:
+            total = 0
+        else:
+            count_row = await self._conn.fetchrow(count_query, *count_values)
+            total = count_row["total"] if count_row else 0
         groups = [
-            WorkspaceGroupWithMemberCountDTO(
-                id=row["id"],
-                email=row["email"],
-                name=row["name"],
-                description=row["description"],
-                direct_members_count=row["direct_members_count"],
-            )
+            WorkspaceGroupWithMemberCountDTO(*_group_with_member_count_values(row))
             for row in rows
         ]
         return groups, total
 
-    async def count_by_organization(self, organization_id: int) -> int:
-        query = """
-            SELECT COUNT(*) as count
-            FROM identity_user_group
-            WHERE organization_id = :organization_id
-        """
-        query, values = bind_named(query, {"organization_id": organization_id})
-        row = await self._conn.fetchrow(query, *values)
-        return row["count"] if row else 0
-
     async def find_with_members(
         self, organization_id: int, group_id: int
     ) -> GroupWithMembersDTO | None:
@@ -0,0 +1,28 @@
+import asyncpg
+
+from app.database.query_builder import bind_named
+from app.dtos.workspace_dtos import WorkspaceStatsDTO
+
+
+class WorkspaceStatsRepository:
+
+    def __init__(self, conn: asyncpg.Connection):
+        self._conn = conn
+
+    async def find_by_organization(self, organization_id: int) -> WorkspaceStatsDTO:
+        # All dashboard counts in one round trip
+        query = """
+            SELECT
+                (SELECT COUNT(*) FROM identity_user
+                 WHERE organization_id = :organization_id) as total_users,
+                (SELECT COUNT(*) FROM identity_user_group
+                 WHERE organization_id = :organization_id) as total_groups,
+                (SELECT COUNT(*) FROM oauth_app
+                 WHERE organization_id = :organization_id) as total_apps,
+                (SELECT COUNT(*) FROM app_grant
+                 WHERE organization_id = :organization_id
+                   AND status = 'active') as active_authorizations
+        """
+        query, values = bind_named(query, {"organization_id": organization_id})
+        row = await self._conn.fetchrow(query, *values)
+        return WorkspaceStatsDTO(**dict(row), last_sync_at=None)
@@ -1,14 +1,18 @@
+from collections.abc import AsyncIterator
+from dataclasses import fields
+from operator import itemgetter
 from typing import Any
 
 import asyncpg
+import orjson
 
 from app.database.query_builder import bind_named
 from app.dtos.integration.workspace_dtos import (
     CreateWorkspaceUserDTO,
     UpdateWorkspaceUserDTO,
+    WorkspaceUserRefDTO,
 )
 from app.dtos.workspace_dtos import (
-    AuthorizationWithAppDTO,
     PaginationParamsDTO,
     UserWithAuthorizationsDTO,
     WorkspaceUserWithAppCountDTO,
@@ -16,6 +20,11 @@ from app.dtos.workspace_dtos import (
 from app.models.workspace_user import WorkspaceUser
 
 
+_user_with_app_count_values = itemgetter(
+    *(f.name for f in fields(WorkspaceUserWithAppCountDTO))
+)
+
+
 class WorkspaceUserRepository:
 
     _SELECT_FIELDS = """
@@ -25,6 +34,24 @@ class WorkspaceUserRepository:
         created_at, updated_at
     """
 
+    COPY_UPSERT_MIN_ROWS = 500
+
+    _STAGE_COLUMNS = [
+        "organization_id",
+        "connection_id",
+        "provider_user_id",
+        "email",
+        "full_name",
+        "given_name",
+        "family_name",
+        "is_admin",
+        "is_delegated_admin",
+        "status",
+        "org_unit_path",
+        "avatar_url",
+        "raw_data",
+    ]
+
     def __init__(self, conn: asyncpg.Connection):
         self._conn = conn
 
@@ -69,6 +96,29 @@ class WorkspaceUserRepository:
         row = await self._conn.fetchrow(query, *values)
         return self._map_to_model(row)
 
+    async def find_by_emails(
+        self, organization_id: int, emails: set[str]
+    ) -> dict[str, WorkspaceUser]:
+        if not emails:
+            return {}
+
+        query = f"""
+            SELECT {self._SELECT_FIELDS}
+            FROM identity_user
+            WHERE organization_id = :organization_id 
+              AND LOWER(email) = ANY(:emails)
+        """
+        query, values = bind_named(
+            query,
+            {
+                "organization_id": organization_id,
+                "emails": [email.lower() for email in emails],
+            },
+        )
+        rows = await self._conn.fetch(query, *values)
+        users = (self._map_to_model(row) for row in rows if row)
+        return {user.email.lower(): user for user in users}
+
     async def find_by_organization(self, organization_id: int) -> list[WorkspaceUser]:
         query = f"""
             SELECT {self._SELECT_FIELDS}
@@ -92,8 +142,6 @@ class WorkspaceUserRepository:
         return [self._map_to_model(row) for row in rows if row]
 
     async def upsert(self, dto: CreateWorkspaceUserDTO) -> WorkspaceUser:
-        import json
-
         query = f"""
             INSERT INTO identity_user (
                 organization_id, connection_id, provider_user_id, email,
@@ -132,15 +180,13 @@ class WorkspaceUserRepository:
             "status": dto.status,
             "org_unit_path": dto.org_unit_path,
             "avatar_url": dto.avatar_url,
-            "raw_data": json.dumps(dto.raw_data),
+            "raw_data": orjson.dumps(dto.raw_data).decode(),
         }
         query, values = bind_named(query, params)
         row = await self._conn.fetchrow(query, *values)
         return self._map_to_model(row)
 
     async def bulk_upsert(self, dtos: list[CreateWorkspaceUserDTO]) -> int:
-        import json
-
         if not dtos:
             return 0
 
@@ -160,7 +206,7 @@ class WorkspaceUserRepository:
                     dto.status,
                     dto.org_unit_path,
                     dto.avatar_url,
-                    json.dumps(dto.raw_data),
+                    orjson.dumps(dto.raw_data).decode(),
                 )
             )
 
@@ -195,15 +241,82 @@ class WorkspaceUserRepository:
         count = int(result.split()[-1]) if result else 0
         return count
 
+    async def copy_upsert(self, dtos: list[CreateWorkspaceUserDTO]) -> int:
+        if len(dtos) < self.COPY_UPSERT_MIN_ROWS:
+            return await self.bulk_upsert(dtos)
+
+        records = [
+            (
+                dto.organization_id,
+                dto.connection_id,
+                dto.provider_user_id,
+                dto.email,
+                dto.full_name,
+                dto.given_name,
+                dto.family_name,
+                dto.is_admin,
+                dto.is_delegated_admin,
+                dto.status,
+                dto.org_unit_path,
+                dto.avatar_url,
+                orjson.dumps(dto.raw_data).decode(),
+            )
+            for dto in dtos
+        ]
+
+        create_stage_query = """
+            CREATE TEMP TABLE identity_user_stage (
+                organization_id BIGINT, connection_id BIGINT,
+                provider_user_id VARCHAR(255), email VARCHAR(255),
+                full_name VARCHAR(255), given_name VARCHAR(255),
+                family_name VARCHAR(255), is_admin BOOLEAN,
+                is_delegated_admin BOOLEAN, status VARCHAR(50),
+                org_unit_path VARCHAR(500), avatar_url TEXT, raw_data JSONB
+            ) ON COMMIT DROP
+        """
+        merge_query = """
+            INSERT INTO identity_user (
+                organization_id, connection_id, provider_user_id, email,
+                full_name, given_name, family_name, is_admin, is_delegated_admin,
+                status, org_unit_path, avatar_url, raw_data, last_synced_at
+            )
+            SELECT
+                organization_id, connection_id, provider_user_id, email,
+                full_name, given_name, family_name, is_admin, is_delegated_admin,
+                status, org_unit_path, avatar_url, raw_data, NOW()
+            FROM identity_user_stage
+            ON CONFLICT (organization_id, provider_user_id) DO UPDATE SET
+                email = EXCLUDED.email,
+                full_name = EXCLUDED.full_name,
+                given_name = EXCLUDED.given_name,
+                family_name = EXCLUDED.family_name,
+                is_admin = EXCLUDED.is_admin,
+                is_delegated_admin = EXCLUDED.is_delegated_admin,
+                status = EXCLUDED.status,
+                org_unit_path = EXCLUDED.org_unit_path,
+                avatar_url = EXCLUDED.avatar_url,
+                raw_data = EXCLUDED.raw_data,
+                last_synced_at = NOW(),
+                updated_at = NOW()
+        """
+
+        async with self._conn.transaction():
+            await self._conn.execute(create_stage_query)
+            await self._conn.copy_records_to_table(
+                "identity_user_stage",
+                records=records,
+                columns=self._STAGE_COLUMNS,
+            )
+            result = await self._conn.execute(merge_query)
+        return int(result.split()[-1]) if result else 0
+
     def _map_to_model(self, row: asyncpg.Record | None) -> WorkspaceUser | None:
         if row is None:
             return None
 
         raw_data = row["raw_data"]
         if isinstance(raw_data, str):
-            import json
-
-            raw_data = json.loads(raw_data)
+            raw_data = orjson.loads(raw_data)
 
         return WorkspaceUser(
             id=row["id"],
@@ -252,9 +365,6 @@ class WorkspaceUserRepository:
                 count_query,
                 {"organization_id": organization_id},
             )
-        count_row = await self._conn.fetchrow(count_query, *count_values)
-        total = count_row["total"] if count_row else 0
-
         if search_pattern:
             query = """
                 SELECT 
@@ -300,32 +410,20 @@ class WorkspaceUserRepository:
                 },
             )
         rows = await self._conn.fetch(query, *values)
+        # A short page (or an empty first page) pins the total without a COUNT
+        if rows and len(rows) < params.page_size:
+            total = offset + len(rows)
+        elif not rows and params.page == 1:
+            total = 0
+        else:
+            count_row = await self._conn.fetchrow(count_query, *count_values)
+            total = count_row["total"] if count_row else 0
         users = [
-            WorkspaceUserWithAppCountDTO(
-                id=row["id"],
-                email=row["email"],
-                full_name=row["full_name"],
-                avatar_url=row["avatar_url"],
-                is_admin=row["is_admin"],
-                is_delegated_admin=row["is_delegated_admin"],
-                status=row["status"],
-                authorized_apps_count=row["authorized_apps_count"],
-            )
+            WorkspaceUserWithAppCountDTO(*_user_with_app_count_values(row))
             for row in rows
         ]
         return users, total
 
-    async def count_by_organization(self, organization_id: int) -> int:
-        query = """
-            SELECT COUNT(*) as count
-            FROM identity_user
-            WHERE organization_id = :organization_id
-        """
-        query, values = bind_named(query, {"organization_id": organization_id})
-        row = await self._conn.fetchrow(query, *values)
-        return row["count"] if row else 0
-
-
     async def find_all_active_by_connection(self, connection_id: int) -> list[WorkspaceUser]:
         query = f"""
             SELECT {self._SELECT_FIELDS}
@@ -336,53 +434,71 @@ class WorkspaceUserRepository:
         rows = await self._conn.fetch(query, *values)
         return [self._map_to_model(row) for row in rows if row]
 
+    async def iter_active_by_connection(
+        self, connection_id: int, page_size: int = 1000
+    ) -> AsyncIterator[list[WorkspaceUserRefDTO]]:
+        query = """
+            SELECT id, provider_user_id
+            FROM identity_user
+            WHERE connection_id = $1 AND status = 'active' AND id > $2
+            ORDER BY id
+            LIMIT $3
+        """
+        last_id = 0
+        while True:
+            rows = await self._conn.fetch(query, connection_id, last_id, page_size)
+            if not rows:
+                return
+            yield [
+                WorkspaceUserRefDTO(id=row["id"], provider_user_id=row["provider_user_id"])
+                for row in rows
+            ]
+            if len(rows) < page_size:
+                return
+            last_id = rows[-1]["id"]
+
     async def find_with_authorizations(
         self, organization_id: int, user_id: int
     ) -> UserWithAuthorizationsDTO | None:
-        user_query = """
-            SELECT id, email, full_name, avatar_url, is_admin, status, org_unit_path
-            FROM identity_user
-            WHERE id = :user_id AND organization_id = :organization_id
+        query = """
+            SELECT
+                u.id, u.email, u.full_name, u.avatar_url, u.is_admin, u.status,
+                u.org_unit_path,
+                COALESCE(
+                    json_agg(
+                        json_build_object(
+                            'app_id', oa.id,
+                            'app_name', oa.name,
+                            'client_id', oa.client_id,
+                            'scopes', COALESCE(g.scopes, '{}'),
+                            'authorized_at', g.granted_at,
+                            'status', g.status
+                        )
+                        ORDER BY g.granted_at DESC NULLS LAST
+                    ) FILTER (WHERE g.id IS NOT NULL),
+                    '[]'
+                ) as authorizations
+            FROM identity_user u
+            LEFT JOIN (
+                app_grant g JOIN oauth_app oa ON oa.id = g.app_id
+            ) ON g.user_id = u.id
+            WHERE u.id = :user_id AND u.organization_id = :organization_id
+            GROUP BY u.id
         """
-        user_query, user_values = bind_named(
-            user_query, {"user_id": user_id, "organization_id": organization_id}
+        query, values = bind_named(
+            query, {"user_id": user_id, "organization_id": organization_id}
         )
-        user_row = await self._conn.fetchrow(user_query, *user_values)
-        if not user_row:
+        row = await self._conn.fetchrow(query, *values)
+        if not row:
             return None
 
-        auth_query = """
-            SELECT 
-                oa.id as app_id, oa.name as app_name, oa.client_id,
-                g.scopes, g.granted_at as authorized_at, g.status
-            FROM app_grant g
-            JOIN oauth_app oa ON oa.id = g.app_id
-            WHERE g.user_id = :user_id
-            ORDER BY g.granted_at DESC NULLS LAST
-        """
-        auth_query, auth_values = bind_named(auth_query, {"user_id": user_id})
-        auth_rows = await self._conn.fetch(auth_query, *auth_values)
-
-        authorizations = []
-        for row in auth_rows:
-            authorizations.append(
-                AuthorizationWithAppDTO(
-                    app_id=row["app_id"],
-                    app_name=row["app_name"],
-                    client_id=row["client_id"],
-                    scopes=row["scopes"] or [],
-                    authorized_at=row["authorized_at"],
-                    status=row["status"],
-                )
-            )
-
         return UserWithAuthorizationsDTO(
-            id=user_row["id"],
-            email=user_row["email"],
-            full_name=user_row["full_name"],
-            avatar_url=user_row["avatar_url"],
-            is_admin=user_row["is_admin"],
-            status=user_row["status"],
-            org_unit_path=user_row["org_unit_path"],
-            authorizations=authorizations,
+            id=row["id"],
+            email=row["email"],
+            full_name=row["full_name"],
+            avatar_url=row["avatar_url"],
+            is_admin=row["is_admin"],
+            status=row["status"],
+            org_unit_path=row["org_unit_path"],
+            authorizations=orjson.loads(row["authorizations"]),
         )
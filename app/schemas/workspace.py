@@ -137,6 +137,11 @@ class ConnectionSettingsResponse(BaseModel):
     is_syncing: bool
 
 
+class WorkspaceDashboardResponse(BaseModel):
+    stats: WorkspaceStatsResponse
+    settings: ConnectionSettingsResponse
+
+
 class PaginationParams(BaseModel):
     page: int = Field(1, ge=1)
     page_size: int = Field(25, ge=1, le=100)
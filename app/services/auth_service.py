@@ -3,6 +3,7 @@ from dataclasses import dataclass
 
 from app.constants.auth_errors import AUTH_ERROR_MESSAGES, AuthErrorCode
 from app.constants.enums import UserStatus
+from app.core.cache import user_response_cache
 from app.core.security import token_service
 from app.core.settings import settings
 from app.oauth.service import OAuthService
@@ -29,7 +30,7 @@ from app.services.user_authentication_service import (
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AuthServiceResult:
     success: bool
     data: (
@@ -70,7 +71,7 @@ class AuthService:
         self._user_authentication_service = user_authentication_service
 
     async def get_google_auth_url(self, redirect_uri: str) -> AuthServiceResult:
-        if redirect_uri not in settings.allowed_redirect_uri_list:
+        if redirect_uri not in settings.allowed_redirect_uri_set:
             logger.warning("Invalid redirect URI: %s", redirect_uri)
             return AuthServiceResult(
                 success=False,
@@ -233,69 +234,71 @@ class AuthService:
         )
 
     async def get_current_user(self, user_id: int) -> AuthServiceResult:
-        user = await self._user_repository.find_by_id(user_id)
-        if user is None:
+        cached_response = user_response_cache.get(user_id)
+        if cached_response is not None:
+            return AuthServiceResult(success=True, data=cached_response)
+
+        bundle = await self._user_repository.find_auth_bundle(user_id)
+        if bundle is None:
             logger.warning("User not found: %s", user_id)
             return AuthServiceResult(
                 success=False,
                 error_code=AuthErrorCode.USER_NOT_FOUND,
             )
 
-        organization = await self._organization_repository.find_by_id(
-            user.organization_id
-        )
+        user = bundle.user
+        organization = bundle.organization
         if organization is None:
             return AuthServiceResult(
                 success=False,
                 error_code=AuthErrorCode.ORGANIZATION_NOT_FOUND,
             )
 
-        role = await self._role_repository.find_by_id(user.role_id)
+        role = bundle.role
         if role is None:
             return AuthServiceResult(
                 success=False,
                 error_code=AuthErrorCode.ROLE_NOT_FOUND,
             )
 
-        plan = await self._plan_repository.find_by_id(organization.plan_id)
+        plan = bundle.plan
         if plan is None:
             return AuthServiceResult(
                 success=False,
                 error_code=AuthErrorCode.PLAN_NOT_FOUND,
             )
 
-        return AuthServiceResult(
-            success=True,
-            data=UserResponse(
-                id=user.id,
-                email=user.email,
-                full_name=user.full_name,
-                avatar_url=user.avatar_url,
-                email_verified=user.email_verified,
-                status=user.status,
-                last_login_at=user.last_login_at,
-                role=RoleResponse(
-                    id=role.id,
-                    name=role.name,
-                    display_name=role.display_name,
-                ),
-                organization=OrganizationResponse(
-                    id=organization.id,
-                    name=organization.name,
-                    slug=organization.slug,
-                    domain=organization.domain,
-                    logo_url=organization.logo_url,
-                    status=organization.status,
-                    plan=PlanResponse(
-                        id=plan.id,
-                        name=plan.name,
-                        display_name=plan.display_name,
-                        max_users=plan.max_users,
-                        max_apps=plan.max_apps,
-                    ),
+        user_response = UserResponse.model_construct(
+            id=user.id,
+            email=user.email,
+            full_name=user.full_name,
+            avatar_url=user.avatar_url,
+            email_verified=user.email_verified,
+            status=user.status,
+            last_login_at=user.last_login_at,
+            role=RoleResponse.model_construct(
+                id=role.id,
+                name=role.name,
+                display_name=role.display_name,
+            ),
+            organization=OrganizationResponse.model_construct(
+                id=organization.id,
+                name=organization.name,
+                slug=organization.slug,
+                domain=organization.domain,
+                logo_url=organization.logo_url,
+                status=organization.status,
+                plan=PlanResponse.model_construct(
+                    id=plan.id,
+                    name=plan.name,
+                    display_name=plan.display_name,
+                    max_users=plan.max_users,
+                    max_apps=plan.max_apps,
                 ),
             ),
         )
+        user_response_cache[user_id] = user_response
+        return AuthServiceResult(success=True, data=user_response)
 
     async def logout(self, refresh_token: str) -> AuthServiceResult:
         logger.info("User logout requested")
@@ -0,0 +1,91 @@
+import asyncio
+import logging
+from collections.abc import Callable
+from contextlib import AbstractAsyncContextManager
+
+from app.dtos.crawl_history_dtos import CreateCrawlHistoryDTO, UpdateCrawlHistoryDTO
+from app.models.crawl_history import CrawlHistory
+from app.repositories.crawl_history_repo import CrawlHistoryRepository
+
+logger = logging.getLogger(__name__)
+
+
+class CrawlHistoryWriter:
+    FLUSH_DELAY_SECONDS = 0.01
+    MAX_BATCH_SIZE = 64
+
+    def __init__(
+        self,
+        repository_scope: Callable[
+            [], AbstractAsyncContextManager[CrawlHistoryRepository]
+        ],
+    ):
+        self._repository_scope = repository_scope
+        self._pending_creates: list[
+            tuple[CreateCrawlHistoryDTO, asyncio.Future[CrawlHistory]]
+        ] = []
+        self._pending_updates: list[
+            tuple[int, UpdateCrawlHistoryDTO, asyncio.Future[None]]
+        ] = []
+        self._flush_task: asyncio.Task | None = None
+
+    def create(self, dto: CreateCrawlHistoryDTO) -> asyncio.Future[CrawlHistory]:
+        future = asyncio.get_running_loop().create_future()
+        self._pending_creates.append((dto, future))
+        self._ensure_flushing()
+        return future
+
+    def update(
+        self, crawl_id: int, dto: UpdateCrawlHistoryDTO
+    ) -> asyncio.Future[None]:
+        future = asyncio.get_running_loop().create_future()
+        self._pending_updates.append((crawl_id, dto, future))
+        self._ensure_flushing()
+        return future
+
+    async def close(self) -> None:
+        # Drain queued writes before the pool is closed
+        while self._flush_task is not None and not self._flush_task.done():
+            await self._flush_task
+
+    def _ensure_flushing(self) -> None:
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush())
+
+    async def _flush(self) -> None:
+        # Short delay lets writes from concurrently finishing jobs share a batch
+        await asyncio.sleep(self.FLUSH_DELAY_SECONDS)
+        while self._pending_creates or self._pending_updates:
+            creates = self._pending_creates[: self.MAX_BATCH_SIZE]
+            del self._pending_creates[: self.MAX_BATCH_SIZE]
+            updates = self._pending_updates[: self.MAX_BATCH_SIZE]
+            del self._pending_updates[: self.MAX_BATCH_SIZE]
+
+            try:
+                async with self._repository_scope() as repository:
+                    if creates:
+                        crawls = await repository.create_many(
+                            [dto for dto, _ in creates]
+                        )
+                        for (_, future), crawl in zip(creates, crawls):
+                            if not future.done():
+                                future.set_result(crawl)
+                    if updates:
+                        await repository.update_many(
+                            [(crawl_id, dto) for crawl_id, dto, _ in updates]
+                        )
+                        for _, _, future in updates:
+                            if not future.done():
+                                future.set_result(None)
+            except Exception as e:
+                logger.exception(
+                    "Failed to write crawl history (%d creates, %d updates)",
+                    len(creates),
+                    len(updates),
+                )
+                for _, future in creates:
+                    if not future.done():
+                        future.set_exception(e)
+                for _, _, future in updates:
+                    if not future.done():
+                        future.set_exception(e)
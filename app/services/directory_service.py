@@ -6,6 +6,7 @@ from app.dtos.integration.workspace_dtos import (
     CreateWorkspaceGroupDTO,
     CreateWorkspaceUserDTO,
 )
+from app.integrations.core.pagination import prefetch_pages
 from app.integrations.core.types import AuthContext
 from app.integrations.providers.google_workspace.provider import (
     google_workspace_provider,
@@ -32,14 +33,15 @@ class DirectoryService:
         """
         Syncs users from the provider to the local database.
         """
-        logger.info(f"Starting User Sync for connection {connection.id}")
+        logger.info("Starting User Sync for connection %s", connection.id)
         provider = google_workspace_provider
         total_users = 0
+        pending_dtos: list[CreateWorkspaceUserDTO] = []
 
-        async for users in provider.fetch_users(auth_context):
-            dtos = []
+        # Next page downloads while the current batch is being written
+        async for users in prefetch_pages(provider.fetch_users(auth_context)):
             for user in users:
-                dtos.append(
+                pending_dtos.append(
                     CreateWorkspaceUserDTO(
                         organization_id=connection.organization_id,
                         connection_id=connection.id,
@@ -56,29 +58,36 @@ class DirectoryService:
                         raw_data=user.raw_data,
                     )
                 )
-            
-            if dtos:
-                count = await self._user_repo.bulk_upsert(dtos)
-                total_users += count
-                logger.debug(f"Upserted batch of {count} users")
 
-        logger.info(f"User Sync completed. Processed {total_users} users.")
+            if len(pending_dtos) >= self._user_repo.COPY_UPSERT_MIN_ROWS:
+                total_users += await self._flush_users(pending_dtos)
+                pending_dtos = []
+
+        if pending_dtos:
+            total_users += await self._flush_users(pending_dtos)
+
+        logger.info("User Sync completed. Processed %d users.", total_users)
         return total_users
 
+    async def _flush_users(self, dtos: list[CreateWorkspaceUserDTO]) -> int:
+        count = await self._user_repo.copy_upsert(dtos)
+        logger.debug("Upserted batch of %d users", count)
+        return count
+
     async def sync_groups_for_connection(
         self, connection: IdentityProviderConnection, auth_context: AuthContext
     ) -> int:
         """
         Syncs groups from the provider to the local database.
         """
-        logger.info(f"Starting Group Sync for connection {connection.id}")
+        logger.info("Starting Group Sync for connection %s", connection.id)
         provider = google_workspace_provider
         total_groups = 0
+        pending_dtos: list[CreateWorkspaceGroupDTO] = []
 
-        async for groups in provider.fetch_groups(auth_context):
-            dtos = []
+        async for groups in prefetch_pages(provider.fetch_groups(auth_context)):
             for group in groups:
-                dtos.append(
+                pending_dtos.append(
                     CreateWorkspaceGroupDTO(
                         organization_id=connection.organization_id,
                         connection_id=connection.id,
@@ -90,10 +99,17 @@ class DirectoryService:
                     )
                 )
 
-            if dtos:
-                count = await self._group_repo.bulk_upsert(dtos)
-                total_groups += count
-                logger.debug(f"Upserted batch of {count} groups")
-        
-        logger.info(f"Group Sync completed. Processed {total_groups} groups.")
+            if len(pending_dtos) >= self._group_repo.COPY_UPSERT_MIN_ROWS:
+                total_groups += await self._flush_groups(pending_dtos)
+                pending_dtos = []
+
+        if pending_dtos:
+            total_groups += await self._flush_groups(pending_dtos)
+
+        logger.info("Group Sync completed. Processed %d groups.", total_groups)
         return total_groups
+
+    async def _flush_groups(self, dtos: list[CreateWorkspaceGroupDTO]) -> int:
+        count = await self._group_repo.copy_upsert(dtos)
+        logger.debug("Upserted batch of %d groups", count)
+        return count
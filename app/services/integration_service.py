@@ -1,8 +1,9 @@
 import logging
-from datetime import datetime, timedelta, timezone
+import time
+from datetime import datetime, timezone
 from urllib.parse import urlencode
 
-from cryptography.fernet import Fernet
+from rfernet import Fernet
 
 from app.constants.enums import ConnectionStatus
 from app.dtos.integration.connection_dtos import (
@@ -14,8 +15,9 @@ from app.integrations.core.exceptions import (
     ConnectionNotFoundError,
     ProviderNotFoundError,
 )
+from app.integrations.core.credentials import invalidate_auth_context
 from app.integrations.providers.google_workspace.constants import (
-    GOOGLE_WORKSPACE_ADMIN_SCOPES,
+    GOOGLE_WORKSPACE_ADMIN_SCOPES_JOINED,
     GOOGLE_WORKSPACE_PROVIDER_SLUG,
 )
 from app.models.identity_provider_connection import IdentityProviderConnection
@@ -28,6 +30,7 @@ from app.repositories.identity_provider_repository import IdentityProviderReposi
 from app.repositories.product_auth_config_repository import (
     ProductAuthConfigRepository,
 )
+from app.utils.crypto import hash_token
 
 logger = logging.getLogger(__name__)
 
@@ -38,12 +41,13 @@ class IntegrationService:
         identity_provider_repository: IdentityProviderRepository,
         product_auth_config_repository: ProductAuthConfigRepository,
         connection_repository: IdentityProviderConnectionRepository,
-        encryption_key: str,
+        fernet: Fernet,
     ):
         self._identity_provider_repo = identity_provider_repository
         self._auth_config_repo = product_auth_config_repository
         self._connection_repo = connection_repository
-        self._fernet = Fernet(encryption_key.encode())
+        self._fernet = fernet
+        self._fernet_encrypt = self._fernet.encrypt
 
     async def get_connect_url(
         self,
@@ -70,13 +74,11 @@ class IntegrationService:
             )
             raise ProviderNotFoundError(identity_provider_slug)
 
-        scopes = self._get_admin_scopes(identity_provider_slug)
-
         params = {
             "client_id": auth_config.client_id,
             "redirect_uri": redirect_uri,
             "response_type": "code",
-            "scope": " ".join(scopes),
+            "scope": self._get_admin_scopes_str(identity_provider_slug),
             "state": state,
             "access_type": "offline",
             "prompt": "consent",
@@ -133,6 +135,14 @@ class IntegrationService:
             auth_config, code, identity_provider_slug, redirect_uri
         )
 
+        # A replayed callback carries tokens that are already stored
+        duplicate = await self._connection_repo.find_by_access_token_hash(
+            hash_token(tokens.access_token)
+        )
+        if duplicate and duplicate.organization_id == organization_id:
+            logger.info("Callback tokens already stored on connection: %d", duplicate.id)
+            return duplicate
+
         if existing:
             logger.info("Updating existing connection: %d", existing.id)
             return await self._update_existing_connection(
@@ -166,19 +176,19 @@ class IntegrationService:
 
     async def disconnect(self, connection_id: int) -> bool:
         logger.info("Disconnecting connection: %d", connection_id)
-        connection = await self._connection_repo.find_by_id(connection_id)
-        if not connection:
+        deleted_id = await self._connection_repo.soft_delete(connection_id)
+        if deleted_id is None:
             logger.warning("Connection not found for disconnect: %d", connection_id)
             raise ConnectionNotFoundError(connection_id)
 
-        result = await self._connection_repo.soft_delete(connection_id)
-        logger.info("Connection %d disconnected: %s", connection_id, result)
-        return result
+        invalidate_auth_context(connection_id)
+        logger.info("Connection %d disconnected", connection_id)
+        return True
 
-    def _get_admin_scopes(self, identity_provider_slug: str) -> list[str]:
+    def _get_admin_scopes_str(self, identity_provider_slug: str) -> str:
         if identity_provider_slug == GOOGLE_WORKSPACE_PROVIDER_SLUG:
-            return GOOGLE_WORKSPACE_ADMIN_SCOPES
-        return []
+            return GOOGLE_WORKSPACE_ADMIN_SCOPES_JOINED
+        return ""
 
     async def _exchange_code_for_tokens(
         self,
@@ -216,26 +226,29 @@ class IntegrationService:
         tokens: OAuthTokens,
         user_email: str,
     ) -> IdentityProviderConnection:
-        expires_at = None
-        if tokens.expires_in:
-            expires_at = datetime.now(timezone.utc) + timedelta(
-                seconds=tokens.expires_in
-            )
+        expires_at = self._compute_expires_at(tokens.expires_in)
+
+        encrypted_access = self._encrypt(tokens.access_token)
+        encrypted_refresh = (
+            self._encrypt(tokens.refresh_token) if tokens.refresh_token else None
+        )
+        _, sep, domain = user_email.rpartition("@")
 
         dto = CreateIdentityProviderConnectionDTO(
             organization_id=organization_id,
             identity_provider_id=identity_provider_id,
             connected_by_user_id=user_id,
             status=ConnectionStatus.ACTIVE.value,
-
-            access_token=self._encrypt(tokens.access_token),
-            refresh_token=(
-                self._encrypt(tokens.refresh_token) if tokens.refresh_token else None
+            access_token=encrypted_access,
+            refresh_token=encrypted_refresh,
+            access_token_hash=hash_token(tokens.access_token),
+            refresh_token_hash=(
+                hash_token(tokens.refresh_token) if tokens.refresh_token else None
             ),
             token_expires_at=expires_at,
             scopes_granted=tokens.scope.split(" ") if tokens.scope else [],
             admin_email=user_email,
-            workspace_domain=user_email.split("@")[1] if "@" in user_email else None,
+            workspace_domain=domain if sep else None,
         )
 
         return await self._connection_repo.create(dto)
@@ -246,17 +259,20 @@ class IntegrationService:
         tokens: OAuthTokens,
         user_email: str,
     ) -> IdentityProviderConnection:
-        expires_at = None
-        if tokens.expires_in:
-            expires_at = datetime.now(timezone.utc) + timedelta(
-                seconds=tokens.expires_in
-            )
+        expires_at = self._compute_expires_at(tokens.expires_in)
+
+        encrypted_access = self._encrypt(tokens.access_token)
+        encrypted_refresh = (
+            self._encrypt(tokens.refresh_token) if tokens.refresh_token else None
+        )
 
         dto = UpdateIdentityProviderConnectionDTO(
             status=ConnectionStatus.ACTIVE.value,
-            access_token=self._encrypt(tokens.access_token),
-            refresh_token=(
-                self._encrypt(tokens.refresh_token) if tokens.refresh_token else None
+            access_token=encrypted_access,
+            refresh_token=encrypted_refresh,
+            access_token_hash=hash_token(tokens.access_token),
+            refresh_token_hash=(
+                hash_token(tokens.refresh_token) if tokens.refresh_token else None
             ),
             token_expires_at=expires_at,
             scopes_granted=tokens.scope.split(" ") if tokens.scope else None,
@@ -264,10 +280,17 @@ class IntegrationService:
             error_message=None,
         )
 
-        return await self._connection_repo.update(connection_id, dto)
+        connection = await self._connection_repo.update(connection_id, dto)
+        invalidate_auth_context(connection_id)
+        return connection
+
+    def _compute_expires_at(self, expires_in: int | None) -> datetime | None:
+        if not expires_in:
+            return None
+        return datetime.fromtimestamp(time.time() + expires_in, tz=timezone.utc)
 
     def _encrypt(self, value: str) -> str:
-        return self._fernet.encrypt(value.encode()).decode()
+        return self._fernet_encrypt(value.encode())
 
     def _decrypt(self, encrypted_value: str) -> str:
-        return self._fernet.decrypt(encrypted_value.encode()).decode()
+        return self._fernet.decrypt(encrypted_value).decode()
@@ -1,9 +1,14 @@
+import asyncio
+import contextlib
 import logging
 from datetime import datetime, timezone
 from typing import Any
 
+from app.core.settings import settings
 from app.dtos.app_grant_dtos import CreateAppGrantDTO
+from app.dtos.integration.workspace_dtos import WorkspaceUserRefDTO
 from app.dtos.oauth_app_dtos import CreateOAuthAppDTO
+from app.integrations.core.exceptions import SyncError
 from app.integrations.core.types import AuthContext, UnifiedToken
 from app.integrations.providers.google_workspace.provider import (
     GOOGLE_WORKSPACE_PROVIDER_SLUG,
@@ -18,6 +23,9 @@ logger = logging.getLogger(__name__)
 
 
 class SnapshotService:
+    UPSERT_BATCH_SIZE = 500
+    PIPELINE_QUEUE_SIZE = 8
+
     def __init__(
         self,
         user_repository: WorkspaceUserRepository,
@@ -30,60 +38,171 @@ class SnapshotService:
 
     async def sync_tokens_for_connection(
         self, connection: IdentityProviderConnection, auth_context: AuthContext
-    ) -> int:
+    ) -> tuple[int, int]:
         """
         Phase 1: Snapshot
         Iterates all users in the connection and fetches their current tokens.
+        Returns the number of grants processed and of users whose fetch failed.
         """
-        logger.info(f"Starting Snapshot Sync (Tokens) for connection {connection.id}")
-        provider = google_workspace_provider  # In real DI, we might select based on connection provider
-        
-        # 1. Get all users
-        # Note: In a real large-scale system, we should iterate via cursor, 
-        # but for now we fetch all active users to snapshot them.
-        users = await self._user_repo.find_all_active_by_connection(connection.id)
-        total_tokens = 0
-
-        for user in users:
-            async for tokens in provider.fetch_user_tokens(
+        logger.info("Starting Snapshot Sync (Tokens) for connection %d", connection.id)
+
+        # 1. Walk active users page by page (keyset pagination keeps memory flat)
+        semaphore = asyncio.Semaphore(settings.snapshot_concurrency)
+        queue: asyncio.Queue[list[tuple[int, UnifiedToken]] | None] = asyncio.Queue(
+            maxsize=self.PIPELINE_QUEUE_SIZE
+        )
+        # Producer and consumer share the request's asyncpg connection, which
+        # cannot run two queries at once
+        db_lock = asyncio.Lock()
+
+        # 2. Overlap provider fetches with DB writes through a bounded queue
+        producer = asyncio.create_task(
+            self._produce_tokens(connection, auth_context, queue, db_lock, semaphore)
+        )
+        try:
+            await self._consume_tokens(connection, queue, db_lock)
+        except BaseException:
+            producer.cancel()
+            # Reap the producer so the consumer's error is the one that surfaces
+            with contextlib.suppress(asyncio.CancelledError, Exception):
+                await producer
+            raise
+        total_tokens, failed_users = await producer
+
+        logger.info(
+            "Snapshot Sync completed. Processed %d grants, %d users failed.",
+            total_tokens,
+            failed_users,
+        )
+        return total_tokens, failed_users
+
+    async def _produce_tokens(
+        self,
+        connection: IdentityProviderConnection,
+        auth_context: AuthContext,
+        queue: asyncio.Queue[list[tuple[int, UnifiedToken]] | None],
+        db_lock: asyncio.Lock,
+        semaphore: asyncio.Semaphore,
+    ) -> tuple[int, int]:
+        produced = 0
+        seen_users = 0
+        failed_users = 0
+        user_pages = self._user_repo.iter_active_by_connection(
+            connection.id, page_size=settings.snapshot_concurrency * 4
+        )
+        try:
+            while True:
+                async with db_lock:
+                    users = await anext(user_pages, None)
+                if users is None:
+                    break
+
+                results = await asyncio.gather(
+                    *(
+                        self._fetch_user_tokens(auth_context, user, semaphore)
+                        for user in users
+                    ),
+                    return_exceptions=True,
+                )
+                seen_users += len(users)
+                batch: list[tuple[int, UnifiedToken]] = []
+                for user, result in zip(users, results):
+                    if isinstance(result, BaseException):
+                        logger.error("Failed to fetch tokens for user %d: %s", user.id, result)
+                        failed_users += 1
+                        continue
+                    batch.extend(result)
+                if batch:
+                    produced += len(batch)
+                    await queue.put(batch)
+
+            # A run where no user succeeded (e.g. revoked access) is not a snapshot
+            if seen_users and failed_users == seen_users:
+                raise SyncError(
+                    "tokens", f"token fetch failed for all {seen_users} users"
+                )
+        except Exception:
+            await queue.put(None)
+            raise
+        await queue.put(None)
+        return produced, failed_users
+
+    async def _fetch_user_tokens(
+        self,
+        auth_context: AuthContext,
+        user: WorkspaceUserRefDTO,
+        semaphore: asyncio.Semaphore,
+    ) -> list[tuple[int, UnifiedToken]]:
+        # In real DI, we might select the provider based on the connection
+        async with semaphore:
+            collected: list[tuple[int, UnifiedToken]] = []
+            async for tokens in google_workspace_provider.fetch_user_tokens(
                 auth_context, user.provider_user_id
             ):
-                for token in tokens:
-                    logger.info(f"Processing token for user {user.id}: {token.client_id} - {token.app_name}")
-                    await self._process_token(connection, user.id, token)
-                    total_tokens += 1
-        
-        logger.info(f"Snapshot Sync completed. Processed {total_tokens} grants.")
-        return total_tokens
-
-    async def _process_token(
+                collected.extend((user.id, token) for token in tokens)
+            return collected
+
+    async def _consume_tokens(
         self,
         connection: IdentityProviderConnection,
-        user_id: int,
-        token: UnifiedToken,
-    ):
-        # 1. Ensure App exists
-        app_dto = CreateOAuthAppDTO(
-            organization_id=connection.organization_id,
-            connection_id=connection.id,
-            client_id=token.client_id,
-            name=token.app_name,
-            is_system_app=token.is_system_app,
-            scopes_summary=token.scopes,
-            raw_data=token.raw_data,
-        )
-        app = await self._app_repo.upsert(app_dto)
+        queue: asyncio.Queue[list[tuple[int, UnifiedToken]] | None],
+        db_lock: asyncio.Lock,
+    ) -> None:
+        pending: list[tuple[int, UnifiedToken]] = []
+        while (batch := await queue.get()) is not None:
+            if logger.isEnabledFor(logging.DEBUG):
+                for user_id, token in batch:
+                    logger.debug(
+                        "Processing token for user %d: %s - %s",
+                        user_id,
+                        token.client_id,
+                        token.app_name,
+                    )
+            pending.extend(batch)
+            if len(pending) >= self.UPSERT_BATCH_SIZE:
+                async with db_lock:
+                    await self._flush_tokens(connection, pending)
+                pending = []
 
-        # 2. Upsert Grant (Active)
+        async with db_lock:
+            await self._flush_tokens(connection, pending)
+
+    async def _flush_tokens(
+        self,
+        connection: IdentityProviderConnection,
+        pending: list[tuple[int, UnifiedToken]],
+    ) -> None:
+        if not pending:
+            return
+
+        # 1. Ensure Apps exist (one row per client_id, last token wins)
+        app_dtos: dict[str, CreateOAuthAppDTO] = {}
+        for _, token in pending:
+            app_dtos[token.client_id] = CreateOAuthAppDTO(
+                organization_id=connection.organization_id,
+                connection_id=connection.id,
+                client_id=token.client_id,
+                name=token.app_name,
+                is_system_app=token.is_system_app,
+                scopes_summary=token.scopes,
+                raw_data=token.raw_data,
+            )
+        app_ids = await self._app_repo.bulk_upsert(list(app_dtos.values()))
+
+        # 2. Upsert Grants (Active)
         # If it was revoked, this "Snapshot" proves it's active again (User re-authorized)
-        grant_dto = CreateAppGrantDTO(
-            organization_id=connection.organization_id,
-            connection_id=connection.id,
-            user_id=user_id,
-            app_id=app.id,
-            status="active",
-            scopes=token.scopes,
-            last_accessed_at=datetime.now(timezone.utc), # We verify it exists now
-            raw_data=token.raw_data,
-        )
-        await self._grant_repo.upsert(grant_dto)
+        now = datetime.now(timezone.utc)
+        grant_dtos: dict[tuple[int, int], CreateAppGrantDTO] = {}
+        for user_id, token in pending:
+            app_id = app_ids[token.client_id]
+            grant_dtos[(user_id, app_id)] = CreateAppGrantDTO(
+                organization_id=connection.organization_id,
+                connection_id=connection.id,
+                user_id=user_id,
+                app_id=app_id,
+                status="active",
+                scopes=token.scopes,
+                last_accessed_at=now, # We verify it exists now
+                raw_data=token.raw_data,
+            )
+        await self._grant_repo.bulk_upsert(list(grant_dtos.values()))
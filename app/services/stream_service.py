@@ -5,12 +5,16 @@ from typing import Any
 from app.dtos.app_grant_dtos import CreateAppGrantDTO
 from app.dtos.oauth_app_dtos import CreateOAuthAppDTO
 from app.dtos.oauth_event_dtos import CreateOAuthEventDTO
+from app.integrations.core.pagination import prefetch_pages
 from app.integrations.core.types import AuthContext, UnifiedTokenEvent
 from app.integrations.providers.google_workspace.provider import (
     google_workspace_provider,
 )
 from app.models.identity_provider_connection import IdentityProviderConnection
 from app.repositories.app_grant_repo import AppGrantRepository
+from app.repositories.identity_provider_connection_repository import (
+    IdentityProviderConnectionRepository,
+)
 from app.repositories.oauth_app_repo import OAuthAppRepository
 from app.repositories.oauth_event_repo import OAuthEventRepository
 from app.repositories.workspace_user_repository import WorkspaceUserRepository
@@ -25,11 +29,13 @@ class StreamService:
         app_repo: OAuthAppRepository,
         grant_repo: AppGrantRepository,
         event_repo: OAuthEventRepository,
+        connection_repo: IdentityProviderConnectionRepository,
     ):
         self._user_repo = user_repository
         self._app_repo = app_repo
         self._grant_repo = grant_repo
         self._event_repo = event_repo
+        self._connection_repo = connection_repo
 
     async def sync_events_for_connection(
         self, 
@@ -41,69 +47,160 @@ class StreamService:
         Phase 2: Stream
         Polls activity logs for Authorize, Revoke, and Activity events.
         """
-        logger.info(f"Starting Stream Sync (Events) for connection {connection.id} from {start_time}")
+        logger.info(
+            "Starting Stream Sync (Events) for connection %d from %s",
+            connection.id,
+            start_time,
+        )
         provider = google_workspace_provider
         total_events = 0
+        latest_event_time: datetime | None = None
+        # Fallback time for undated events; one value keeps their dedupe keys
+        # stable across every page of this sync
+        sync_now = datetime.now(timezone.utc)
+
+        async for events in prefetch_pages(
+            provider.fetch_token_events(auth_context, start_time)
+        ):
+            await self._process_event_page(connection, events, sync_now)
+            total_events += len(events)
+            page_latest = max(
+                (event.event_time for event in events if event.event_time),
+                default=None,
+            )
+            if page_latest and (latest_event_time is None or page_latest > latest_event_time):
+                latest_event_time = page_latest
 
-        async for events in provider.fetch_token_events(auth_context, start_time):
-            for event in events:
-                await self._process_event(connection, event)
-                total_events += 1
+        # Activities arrive newest-first, so only advance the watermark once every page is stored
+        if latest_event_time is not None:
+            await self._connection_repo.update_last_event_cursor(
+                connection.id, latest_event_time
+            )
         
         return total_events
 
-    async def _process_event(
+    async def _process_event_page(
         self,
         connection: IdentityProviderConnection,
-        event: UnifiedTokenEvent,
+        events: list[UnifiedTokenEvent],
+        sync_now: datetime,
     ):
-        # 1. Resolve User
+        # 1. Resolve Users
         # Note: Event provides email, we need to find internal ID.
-        user = await self._user_repo.find_by_email(connection.organization_id, event.user_email)
-        if not user:
-            logger.warning(f"Skipping event for unknown user: {event.user_email}")
-            return
-
-        # 2. Ensure App exists
-        app_dto = CreateOAuthAppDTO(
-            organization_id=connection.organization_id,
-            connection_id=connection.id,
-            client_id=event.client_id,
-            name=event.app_name or "Unknown App",
-            is_system_app=False, # We can't determine this easily from event alone usually, unless we check allowlist
-            scopes_summary=event.scopes,
-            raw_data=event.raw_data,
+        users = await self._user_repo.find_by_emails(
+            connection.organization_id, {event.user_email for event in events}
         )
-        app = await self._app_repo.upsert(app_dto)
+        resolved: list[tuple[int, UnifiedTokenEvent]] = []
+        unknown_emails: set[str] = set()
+        for event in events:
+            user = users.get(event.user_email.lower())
+            if not user:
+                unknown_emails.add(event.user_email)
+                continue
+            resolved.append((user.id, event))
 
-        # 3. Log Event (Immutable Timeline)
-        # Check for duplicates before creating
-        event_time = event.event_time or datetime.now(timezone.utc)
-        
-        exists = await self._event_repo.exists(
-            organization_id=connection.organization_id,
-            user_id=user.id,
-            app_id=app.id,
-            event_type=event.event_type,
-            event_time=event_time
-        )
+        if unknown_emails:
+            logger.warning("Skipping events for unknown users: %s", sorted(unknown_emails))
 
-        if not exists:
-            event_dto = CreateOAuthEventDTO(
+        if not resolved:
+            return
+
+        # 2. Ensure Apps exist
+        app_dtos: dict[str, CreateOAuthAppDTO] = {}
+        for _, event in resolved:
+            app_dtos[event.client_id] = CreateOAuthAppDTO(
                 organization_id=connection.organization_id,
                 connection_id=connection.id,
-                user_id=user.id,
-                app_id=app.id,
-                event_type=event.event_type,
-                event_time=event_time,
+                client_id=event.client_id,
+                name=event.app_name or "Unknown App",
+                is_system_app=False, # We can't determine this easily from event alone usually, unless we check allowlist
+                scopes_summary=event.scopes,
                 raw_data=event.raw_data,
             )
-            await self._event_repo.create(event_dto)
-        else:
-            logger.info(f"Skipping duplicate event: {event.event_type} for user {user.id} app {app.id} at {event_time}")
+        app_ids = await self._app_repo.bulk_upsert(list(app_dtos.values()))
+
+        # 3. Log Events (Immutable Timeline)
+        # Check the whole page for duplicates in one query before creating
+        keyed_events = [
+            (
+                (
+                    user_id,
+                    app_ids[event.client_id],
+                    event.event_type,
+                    event.event_time or sync_now,
+                ),
+                event,
+            )
+            for user_id, event in resolved
+        ]
+        seen = await self._event_repo.find_existing_keys(
+            connection.organization_id, [key for key, _ in keyed_events]
+        )
+
+        event_dtos: list[CreateOAuthEventDTO] = []
+        for key, event in keyed_events:
+            user_id, app_id, event_type, event_time = key
+            if key in seen:
+                logger.info(
+                    "Skipping duplicate event: %s for user %d app %d at %s",
+                    event_type,
+                    user_id,
+                    app_id,
+                    event_time,
+                )
+                continue
+            seen.add(key)
+            event_dtos.append(
+                CreateOAuthEventDTO(
+                    organization_id=connection.organization_id,
+                    connection_id=connection.id,
+                    user_id=user_id,
+                    app_id=app_id,
+                    event_type=event_type,
+                    event_time=event_time,
+                    raw_data=event.raw_data,
+                )
+            )
+        await self._event_repo.bulk_create(event_dtos)
 
         # 4. Update Current State (AppGrant)
         # "Hybrid Sync": Events also update the 'now' state.
+        grant_dtos: dict[tuple[int, int], CreateAppGrantDTO] = {}
+        state_changing: set[tuple[int, int]] = set()
+        for user_id, event in resolved:
+            app_id = app_ids[event.client_id]
+            grant_dto = self._build_grant_dto(connection, user_id, app_id, event)
+            previous = grant_dtos.get((user_id, app_id))
+            if previous is not None:
+                # Fold repeated (user, app) events the same way sequential upserts would
+                grant_dto.granted_at = grant_dto.granted_at or previous.granted_at
+                grant_dto.last_accessed_at = (
+                    grant_dto.last_accessed_at or previous.last_accessed_at
+                )
+            grant_dtos[(user_id, app_id)] = grant_dto
+            if event.event_type != "activity":
+                state_changing.add((user_id, app_id))
+
+        # Activity on an already-active grant only moves last_accessed_at
+        touched = await self._grant_repo.touch_last_accessed(
+            connection.organization_id,
+            [
+                (user_id, app_id, dto.last_accessed_at)
+                for (user_id, app_id), dto in grant_dtos.items()
+                if (user_id, app_id) not in state_changing
+            ],
+        )
+        await self._grant_repo.bulk_upsert(
+            [dto for key, dto in grant_dtos.items() if key not in touched]
+        )
+
+    def _build_grant_dto(
+        self,
+        connection: IdentityProviderConnection,
+        user_id: int,
+        app_id: int,
+        event: UnifiedTokenEvent,
+    ) -> CreateAppGrantDTO:
         status = "active"
         revoked_at = None
         
@@ -115,11 +212,11 @@ class StreamService:
         if event.event_type == "authorize":
             granted_at = event.event_time
 
-        grant_dto = CreateAppGrantDTO(
+        return CreateAppGrantDTO(
             organization_id=connection.organization_id,
             connection_id=connection.id,
-            user_id=user.id,
-            app_id=app.id,
+            user_id=user_id,
+            app_id=app_id,
             status=status,
             scopes=event.scopes,
             granted_at=granted_at,
@@ -127,4 +224,3 @@ class StreamService:
             revoked_at=revoked_at,
             raw_data=event.raw_data,
         )
-        await self._grant_repo.upsert(grant_dto)
@@ -1,15 +1,18 @@
+import asyncio
 import logging
 import traceback
+from collections.abc import Awaitable, Callable
+from contextlib import AbstractAsyncContextManager
 from datetime import datetime, timedelta, timezone
 
-from app.core.settings import settings
+from app.core.cache import invalidate_workspace_stats
 from app.dtos.crawl_history_dtos import CreateCrawlHistoryDTO, UpdateCrawlHistoryDTO
 from app.integrations.core.credentials import CredentialsManager
 from app.integrations.core.types import AuthContext
 from app.integrations.providers.google_workspace.provider import (
     GOOGLE_WORKSPACE_PROVIDER_SLUG,
 )
-from app.models.crawl_history import CrawlStatus, CrawlType
+from app.models.crawl_history import CrawlHistory, CrawlStatus, CrawlType
 from app.repositories.crawl_history_repo import CrawlHistoryRepository
 from app.repositories.identity_provider_connection_repository import (
     IdentityProviderConnectionRepository,
@@ -17,6 +20,7 @@ from app.repositories.identity_provider_connection_repository import (
 from app.repositories.identity_provider_repository import IdentityProviderRepository
 from app.integrations.providers.factory import get_provider_by_slug
 from app.repositories.product_auth_config_repository import ProductAuthConfigRepository
+from app.services.crawl_history_writer import CrawlHistoryWriter
 from app.services.directory_service import DirectoryService
 from app.services.snapshot_service import SnapshotService
 from app.services.stream_service import StreamService
@@ -35,6 +39,8 @@ class SyncManager:
         directory_service: DirectoryService,
         snapshot_service: SnapshotService,
         stream_service: StreamService,
+        crawl_history_writer: CrawlHistoryWriter,
+        isolated_scope: Callable[[], AbstractAsyncContextManager["SyncManager"]],
     ):
         self._connection_repo = connection_repo
         self._identity_provider_repo = identity_provider_repo
@@ -44,6 +50,8 @@ class SyncManager:
         self._directory_service = directory_service
         self._snapshot_service = snapshot_service
         self._stream_service = stream_service
+        self._crawl_writer = crawl_history_writer
+        self._isolated_scope = isolated_scope
 
     async def run_full_sync(self, connection_id: int):
         """
@@ -51,32 +59,78 @@ class SyncManager:
         Ideally this separates Users, Groups, and Tokens into different jobs.
         For now, we focus on the APP RISK part (Snapshot + Stream).
         """
+        connection = await self._connection_repo.find_by_id(connection_id)
+        if not connection:
+            logger.error("Connection %d not found.", connection_id)
+            return
+
+        # Users and Groups are independent; Snapshot and Stream only need Users.
+        # Side branches run on their own pooled connection, since asyncpg
+        # connections cannot serve concurrent queries. Each job resolves its
+        # own credentials so a refresh mid-pipeline is picked up.
+        groups_task = asyncio.create_task(
+            self._run_isolated(SyncManager.run_groups_sync, connection_id)
+        )
         await self.run_users_sync(connection_id)
-        await self.run_groups_sync(connection_id)
+
+        stream_task = asyncio.create_task(
+            self._run_isolated(SyncManager.run_stream_sync, connection_id)
+        )
         await self.run_snapshot_sync(connection_id)
-        await self.run_stream_sync(connection_id)
+        await asyncio.gather(groups_task, stream_task)
+        invalidate_workspace_stats(connection.organization_id)
 
-    async def run_users_sync(self, connection_id: int):
-        await self._run_job(connection_id, CrawlType.USERS, self._users_job)
+    async def run_users_sync(
+        self, connection_id: int, auth_context: AuthContext | None = None
+    ):
+        await self._run_job(
+            connection_id, CrawlType.USERS, self._users_job, auth_context
+        )
 
-    async def run_groups_sync(self, connection_id: int):
-        await self._run_job(connection_id, CrawlType.GROUPS, self._groups_job)
+    async def run_groups_sync(
+        self, connection_id: int, auth_context: AuthContext | None = None
+    ):
+        await self._run_job(
+            connection_id, CrawlType.GROUPS, self._groups_job, auth_context
+        )
 
 
-    async def run_snapshot_sync(self, connection_id: int):
-        await self._run_job(connection_id, CrawlType.TOKENS, self._snapshot_job)
+    async def run_snapshot_sync(
+        self, connection_id: int, auth_context: AuthContext | None = None
+    ):
+        await self._run_job(
+            connection_id, CrawlType.TOKENS, self._snapshot_job, auth_context
+        )
 
-    async def run_stream_sync(self, connection_id: int):
-        await self._run_job(connection_id, CrawlType.EVENTS, self._stream_job)
+    async def run_stream_sync(
+        self, connection_id: int, auth_context: AuthContext | None = None
+    ):
+        await self._run_job(
+            connection_id, CrawlType.EVENTS, self._stream_job, auth_context
+        )
 
-    async def _run_job(self, connection_id: int, type: CrawlType, job_func):
+    async def _run_isolated(
+        self,
+        job: Callable[["SyncManager", int], Awaitable[None]],
+        connection_id: int,
+    ) -> None:
+        async with self._isolated_scope() as sync_manager:
+            await job(sync_manager, connection_id)
+
+    async def _run_job(
+        self,
+        connection_id: int,
+        type: CrawlType,
+        job_func,
+        auth_context: AuthContext | None = None,
+    ):
         connection = await self._connection_repo.find_by_id(connection_id)
         if not connection:
-            logger.error(f"Connection {connection_id} not found.")
+            logger.error("Connection %d not found.", connection_id)
             return
 
-        # Create Crawl Record
-        crawl = await self._crawl_repo.create(
+        # Crawl bookkeeping is batched by the shared writer, concurrently with the job
+        crawl_future = self._crawl_writer.create(
             CreateCrawlHistoryDTO(
                 organization_id=connection.organization_id,
                 connection_id=connection.id,
@@ -88,34 +142,55 @@ class SyncManager:
 
         try:
             # Prepare Context
-            auth_context = await self._get_auth_context(connection)
+            if auth_context is None:
+                auth_context = await self._get_auth_context(connection)
             
             # Execute Logic
             stats = await job_func(connection, auth_context)
             
             # Success
-            await self._crawl_repo.update(
-                crawl.id,
-                UpdateCrawlHistoryDTO(
-                    status=CrawlStatus.SUCCESS,
-                    finished_at=datetime.now(timezone.utc),
-                    stats_json=stats,
-                ),
+            update_dto = UpdateCrawlHistoryDTO(
+                status=CrawlStatus.SUCCESS,
+                finished_at=datetime.now(timezone.utc),
+                stats_json=stats,
             )
-        
+
+        except asyncio.CancelledError:
+            # Close the row before propagating so it does not stay RUNNING
+            await asyncio.shield(
+                self._close_crawl(
+                    crawl_future,
+                    UpdateCrawlHistoryDTO(
+                        status=CrawlStatus.ERROR,
+                        finished_at=datetime.now(timezone.utc),
+                        error_message="Sync cancelled",
+                    ),
+                )
+            )
+            raise
+
         except Exception as e:
-            logger.error(f"Sync failed for {connection_id}: {e}")
-            logger.error(traceback.format_exc())
-            await self._crawl_repo.update(
-                crawl.id,
-                UpdateCrawlHistoryDTO(
-                    status=CrawlStatus.ERROR,
-                    finished_at=datetime.now(timezone.utc),
-                    error_message=str(e),
-                    raw_debug_json={"traceback": traceback.format_exc()},
-                ),
+            tb_str = traceback.format_exc()
+            logger.error("Sync failed for %d: %s\n%s", connection_id, e, tb_str)
+            update_dto = UpdateCrawlHistoryDTO(
+                status=CrawlStatus.ERROR,
+                finished_at=datetime.now(timezone.utc),
+                error_message=str(e),
+                raw_debug_json={"traceback": tb_str},
             )
 
+        await self._close_crawl(crawl_future, update_dto)
+
+    async def _close_crawl(
+        self, crawl_future: asyncio.Future[CrawlHistory], dto: UpdateCrawlHistoryDTO
+    ) -> None:
+        crawl = await crawl_future
+        try:
+            await self._crawl_writer.update(crawl.id, dto)
+        except Exception:
+            # The shared batch failed; retry this row alone on the job's connection
+            await self._crawl_repo.update(crawl.id, dto)
+
     async def _users_job(self, connection, auth_context) -> dict:
         count = await self._directory_service.sync_users_for_connection(
             connection, auth_context
@@ -129,24 +204,24 @@ class SyncManager:
         return {"processed_groups": count}
 
     async def _snapshot_job(self, connection, auth_context) -> dict:
-        count = await self._snapshot_service.sync_tokens_for_connection(connection, auth_context)
-        return {"processed_tokens": count}
+        count, failed_users = await self._snapshot_service.sync_tokens_for_connection(
+            connection, auth_context
+        )
+        return {"processed_tokens": count, "failed_users": failed_users}
 
     async def _stream_job(self, connection, auth_context) -> dict:
-        # Determine start_time (cursor)
-        last_sync = await self._crawl_repo.find_last_successful_crawl(
-            connection.id, CrawlType.EVENTS
-        )
-        
-        start_time = None
-        logger.info(f"Last sync for connection {connection.id} was {last_sync}")
-        if last_sync and last_sync.finished_at:
-             # Add buffer or use exact timestamp? Typically exact or slightly overlapping is safer.
-             # Using exact finished_at of last sync as start time, or if provider supports state, use that.
-             # For Google Workspace, startTime is RFC3339.
-             start_time = last_sync.finished_at.isoformat()
+        # Resume from the stored event watermark, else from the last successful
+        # stream run; full lookback only on the first run
+        last_synced_at = connection.last_event_cursor
+        if last_synced_at is None:
+            last_synced_at = await self._crawl_repo.find_last_successful_finished_at(
+                connection.id, CrawlType.EVENTS
+            )
+        if last_synced_at:
+            start_time = last_synced_at.isoformat()
         else:
-             start_time = (datetime.now(timezone.utc) - timedelta(days=180)).isoformat() # Default lookback
+            start_time = (datetime.now(timezone.utc) - timedelta(days=180)).isoformat() # Default lookback
+        logger.info("Stream cursor for connection %d is %s", connection.id, start_time)
                 
         count = await self._stream_service.sync_events_for_connection(connection, auth_context, start_time)
         return {"processed_events": count}
@@ -1,7 +1,10 @@
 import logging
+import secrets
+from collections.abc import Callable
+from contextlib import AbstractAsyncContextManager
 from dataclasses import dataclass
-from datetime import datetime
-from uuid import uuid4
+from datetime import datetime, timezone
+from typing import Any
 
 from app.constants.auth_errors import AUTH_ERROR_MESSAGES, AuthErrorCode
 from app.constants.enums import (
@@ -10,10 +13,13 @@ from app.constants.enums import (
     RoleName,
     UserStatus,
 )
+from app.core.cache import invalidate_user_response
 from app.core.security import token_service
 from app.core.settings import settings
 from app.dtos.organization_dtos import CreateOrganizationDTO
 from app.dtos.user_dtos import CreateUserDTO, UpdateUserDTO
+from app.models.organization import Organization
+from app.models.user import User
 from app.oauth.types import OAuthUserInfo
 from app.repositories.organization_repository import OrganizationRepository
 from app.repositories.plan_repository import PlanRepository
@@ -30,7 +36,13 @@ from app.utils.slug_generator import generate_org_name_from_domain, generate_org
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+class _SignupAborted(Exception):
+    def __init__(self, error_code: AuthErrorCode):
+        super().__init__(error_code.value)
+        self.error_code = error_code
+
+
+@dataclass(slots=True, frozen=True)
 class AuthResult:
     success: bool
     data: AuthSuccessResponse | None = None
@@ -44,15 +56,18 @@ class AuthResult:
 
 
 class UserAuthenticationService:
+    SLUG_MAX_ATTEMPTS = 5
 
     def __init__(
         self,
+        transaction: Callable[[], AbstractAsyncContextManager[Any]],
         user_repository: UserRepository,
         organization_repository: OrganizationRepository,
         plan_repository: PlanRepository,
         role_repository: RoleRepository,
         domain_validator_service: DomainValidatorService,
     ):
+        self._transaction = transaction
         self._user_repository = user_repository
         self._organization_repository = organization_repository
         self._plan_repository = plan_repository
@@ -67,14 +82,15 @@ class UserAuthenticationService:
                 error_code=AuthErrorCode.INVALID_EMAIL_DOMAIN,
             )
 
-        existing_user = await self._user_repository.find_by_provider_id(
-            user_info.provider_user_id
+        existing_user, invited_user = (
+            await self._user_repository.find_by_provider_or_email(
+                user_info.provider_user_id, user_info.email
+            )
         )
         if existing_user:
             logger.info("Existing user found by provider ID: %s", user_info.email)
             return await self._process_existing_user(existing_user.id, user_info)
 
-        invited_user = await self._user_repository.find_by_email(user_info.email)
         if invited_user:
             logger.info("Invited user found by email: %s", user_info.email)
             return await self._process_invited_user(invited_user.id, user_info)
@@ -85,9 +101,10 @@ class UserAuthenticationService:
     async def _process_existing_user(
         self, user_id: int, user_info: OAuthUserInfo
     ) -> AuthResult:
-        user = await self._user_repository.find_by_id(user_id)
-        if user is None:
+        user_with_org = await self._user_repository.find_with_organization(user_id)
+        if user_with_org is None:
             return AuthResult(success=False, error_code=AuthErrorCode.USER_NOT_FOUND)
+        user = user_with_org.user
 
         if user.status == UserStatus.SUSPENDED.value:
             logger.warning("User suspended: %s", user.email)
@@ -97,9 +114,7 @@ class UserAuthenticationService:
             logger.warning("User deactivated: %s", user.email)
             return AuthResult(success=False, error_code=AuthErrorCode.USER_DEACTIVATED)
 
-        organization = await self._organization_repository.find_by_id(
-            user.organization_id
-        )
+        organization = user_with_org.organization
         if organization is None:
             return AuthResult(
                 success=False, error_code=AuthErrorCode.ORGANIZATION_NOT_FOUND
@@ -111,28 +126,33 @@ class UserAuthenticationService:
                 success=False, error_code=AuthErrorCode.ORGANIZATION_SUSPENDED
             )
 
+        now = datetime.now(timezone.utc)
         update_dto = UpdateUserDTO(
             full_name=user_info.full_name,
             avatar_url=user_info.avatar_url,
             email_verified=user_info.email_verified,
-            last_login_at=datetime.utcnow(),
+            last_login_at=now,
         )
         if user.status == UserStatus.PENDING_INVITATION.value:
             update_dto.status = UserStatus.ACTIVE.value
-            update_dto.joined_at = datetime.utcnow()
+            update_dto.joined_at = now
 
         updated_user = await self._user_repository.update(user_id, update_dto)
         if updated_user is None:
             return AuthResult(success=False, error_code=AuthErrorCode.UPDATE_FAILED)
+        invalidate_user_response(user_id)
 
-        return await self._build_auth_response(updated_user.id, is_new_user=False)
+        return await self._build_auth_response(
+            updated_user, organization, is_new_user=False
+        )
 
     async def _process_invited_user(
         self, user_id: int, user_info: OAuthUserInfo
     ) -> AuthResult:
-        user = await self._user_repository.find_by_id(user_id)
-        if user is None:
+        user_with_org = await self._user_repository.find_with_organization(user_id)
+        if user_with_org is None:
             return AuthResult(success=False, error_code=AuthErrorCode.USER_NOT_FOUND)
+        user = user_with_org.user
 
         if user.status != UserStatus.PENDING_INVITATION.value:
             logger.warning("Invalid user state for invited user: %s", user.email)
@@ -140,9 +160,7 @@ class UserAuthenticationService:
                 success=False, error_code=AuthErrorCode.INVALID_USER_STATE
             )
 
-        organization = await self._organization_repository.find_by_id(
-            user.organization_id
-        )
+        organization = user_with_org.organization
         if organization is None:
             return AuthResult(
                 success=False, error_code=AuthErrorCode.ORGANIZATION_NOT_FOUND
@@ -157,7 +175,7 @@ class UserAuthenticationService:
             )
             return AuthResult(success=False, error_code=AuthErrorCode.DOMAIN_MISMATCH)
 
-        now = datetime.utcnow()
+        now = datetime.now(timezone.utc)
         update_dto = UpdateUserDTO(
             provider_id=user_info.provider_user_id,
             full_name=user_info.full_name,
@@ -171,9 +189,12 @@ class UserAuthenticationService:
         updated_user = await self._user_repository.update(user_id, update_dto)
         if updated_user is None:
             return AuthResult(success=False, error_code=AuthErrorCode.UPDATE_FAILED)
+        invalidate_user_response(user_id)
 
         logger.info("Invited user activated: %s", user_info.email)
-        return await self._build_auth_response(updated_user.id, is_new_user=False)
+        return await self._build_auth_response(
+            updated_user, organization, is_new_user=False
+        )
 
     async def _process_new_signup(self, user_info: OAuthUserInfo) -> AuthResult:
         domain = self._domain_validator_service.extract_domain(user_info.email)
@@ -193,21 +214,31 @@ class UserAuthenticationService:
         if owner_role is None:
             return AuthResult(success=False, error_code=AuthErrorCode.ROLE_NOT_FOUND)
 
-        org_slug = await self._generate_unique_slug(domain)
-        org_dto = CreateOrganizationDTO(
-            name=generate_org_name_from_domain(domain),
-            slug=org_slug,
-            domain=domain,
-            plan_id=free_plan.id,
-            status=OrganizationStatus.ACTIVE.value,
+        try:
+            async with self._transaction():
+                created_user, organization = await self._create_owner_account(
+                    user_info, domain, free_plan.id, owner_role.id
+                )
+        except _SignupAborted as exc:
+            return AuthResult(success=False, error_code=exc.error_code)
+
+        logger.info("User created: %s", user_info.email)
+        return await self._build_auth_response(
+            created_user, organization, is_new_user=True
         )
-        organization = await self._organization_repository.create(org_dto)
+
+    async def _create_owner_account(
+        self, user_info: OAuthUserInfo, domain: str, plan_id: int, role_id: int
+    ) -> tuple[User, Organization]:
+        organization = await self._create_organization(domain, plan_id)
+        if organization is None:
+            raise _SignupAborted(AuthErrorCode.ORGANIZATION_CREATION_FAILED)
         logger.info("Organization created: %s", organization.name)
 
-        now = datetime.utcnow()
+        now = datetime.now(timezone.utc)
         user_dto = CreateUserDTO(
             organization_id=organization.id,
-            role_id=owner_role.id,
+            role_id=role_id,
             email=user_info.email,
             full_name=user_info.full_name,
             avatar_url=user_info.avatar_url,
@@ -219,32 +250,30 @@ class UserAuthenticationService:
         )
         created_user = await self._user_repository.create(user_dto)
         if created_user is None:
-            return AuthResult(
-                success=False, error_code=AuthErrorCode.USER_CREATION_FAILED
-            )
-
-        logger.info("User created: %s", user_info.email)
-        return await self._build_auth_response(created_user.id, is_new_user=True)
-
-    async def _generate_unique_slug(self, domain: str) -> str:
-        slug = generate_org_slug(domain)
-        while await self._organization_repository.find_by_slug(slug):
-            slug = generate_org_slug(domain)
-        return slug
-
-    async def _build_auth_response(self, user_id: int, is_new_user: bool) -> AuthResult:
-        user = await self._user_repository.find_by_id(user_id)
-        if user is None:
-            return AuthResult(success=False, error_code=AuthErrorCode.USER_NOT_FOUND)
-
-        organization = await self._organization_repository.find_by_id(
-            user.organization_id
-        )
-        if organization is None:
-            return AuthResult(
-                success=False, error_code=AuthErrorCode.ORGANIZATION_NOT_FOUND
+            raise _SignupAborted(AuthErrorCode.USER_CREATION_FAILED)
+        return created_user, organization
+
+    async def _create_organization(
+        self, domain: str, plan_id: int
+    ) -> Organization | None:
+        name = generate_org_name_from_domain(domain)
+        for _ in range(self.SLUG_MAX_ATTEMPTS):
+            org_dto = CreateOrganizationDTO(
+                name=name,
+                slug=generate_org_slug(domain),
+                domain=domain,
+                plan_id=plan_id,
+                status=OrganizationStatus.ACTIVE.value,
             )
+            organization = await self._organization_repository.create(org_dto)
+            if organization is not None:
+                return organization
+            logger.warning("Organization slug collision for domain: %s", domain)
+        return None
 
+    async def _build_auth_response(
+        self, user: User, organization: Organization, is_new_user: bool
+    ) -> AuthResult:
         role = await self._role_repository.find_by_id(user.role_id)
         if role is None:
             return AuthResult(success=False, error_code=AuthErrorCode.ROLE_NOT_FOUND)
@@ -260,15 +289,15 @@ class UserAuthenticationService:
             email=user.email,
         )
         refresh_token = token_service.create_refresh_token(
-            user_id=user.id, jti=str(uuid4())
+            user_id=user.id, jti=secrets.token_urlsafe(16)
         )
 
-        response = AuthSuccessResponse(
+        response = AuthSuccessResponse.model_construct(
             access_token=access_token,
             refresh_token=refresh_token,
             token_type="Bearer",
             expires_in=settings.access_token_expire_seconds,
-            user=UserResponse(
+            user=UserResponse.model_construct(
                 id=user.id,
                 email=user.email,
                 full_name=user.full_name,
@@ -276,19 +305,19 @@ class UserAuthenticationService:
                 email_verified=user.email_verified,
                 status=user.status,
                 last_login_at=user.last_login_at,
-                role=RoleResponse(
+                role=RoleResponse.model_construct(
                     id=role.id,
                     name=role.name,
                     display_name=role.display_name,
                 ),
-                organization=OrganizationResponse(
+                organization=OrganizationResponse.model_construct(
                     id=organization.id,
                     name=organization.name,
                     slug=organization.slug,
                     domain=organization.domain,
                     logo_url=organization.logo_url,
                     status=organization.status,
-                    plan=PlanResponse(
+                    plan=PlanResponse.model_construct(
                         id=plan.id,
                         name=plan.name,
                         display_name=plan.display_name,
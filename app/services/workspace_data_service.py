@@ -1,5 +1,10 @@
+import asyncio
 import logging
+from collections.abc import AsyncIterator, Callable
+from contextlib import AbstractAsyncContextManager
 
+from app.core.cache import invalidate_workspace_stats, workspace_stats_cache
+from app.integrations.core.credentials import invalidate_auth_context
 from app.dtos.workspace_dtos import (
     ConnectionSettingsDTO,
     GroupWithMembersDTO,
@@ -20,10 +25,14 @@ from app.repositories.identity_provider_connection_repository import (
     IdentityProviderConnectionRepository,
 )
 from app.repositories.workspace_group_repository import WorkspaceGroupRepository
+from app.repositories.workspace_stats_repository import WorkspaceStatsRepository
 from app.repositories.workspace_user_repository import WorkspaceUserRepository
+from app.utils.pagination import decode_cursor, encode_cursor
 
 logger = logging.getLogger(__name__)
 
+_stats_locks: dict[int, asyncio.Lock] = {}
+
 
 class WorkspaceDataService:
     def __init__(
@@ -35,6 +44,10 @@ class WorkspaceDataService:
         app_grant_repo: AppGrantRepository,
         oauth_event_repo: OAuthEventRepository,
         crawl_history_repo: CrawlHistoryRepository,
+        workspace_stats_repo: WorkspaceStatsRepository,
+        oauth_event_repo_scope: Callable[
+            [], AbstractAsyncContextManager[OAuthEventRepository]
+        ],
     ):
         self._connection_repo = connection_repository
         self._user_repo = workspace_user_repository
@@ -43,31 +56,29 @@ class WorkspaceDataService:
         self._grant_repo = app_grant_repo
         self._event_repo = oauth_event_repo
         self._crawl_history_repo = crawl_history_repo
+        self._stats_repo = workspace_stats_repo
+        self._event_repo_scope = oauth_event_repo_scope
 
     async def get_workspace_stats(self, organization_id: int) -> WorkspaceStatsDTO:
-        total_users = await self._user_repo.count_by_organization(organization_id)
-        total_groups = await self._group_repo.count_by_organization(organization_id)
-        total_apps = await self._app_repo.count_by_organization(organization_id)
-        active_authorizations = await self._grant_repo.count_active_by_organization(
-            organization_id
-        )
-
-        connections = await self._connection_repo.find_by_organization(organization_id)
-        last_sync_at = None
-        if connections:
-            active_connection = next(
-                (c for c in connections if c.status == "active"), None
-            )
-            if active_connection:
-                last_sync_at = None
-
-        return WorkspaceStatsDTO(
-            total_users=total_users,
-            total_groups=total_groups,
-            total_apps=total_apps,
-            active_authorizations=active_authorizations,
-            last_sync_at=last_sync_at,
-        )
+        cached = workspace_stats_cache.get(organization_id)
+        if cached is not None:
+            return cached
+
+        # One computation per organization at a time; waiters reuse its result.
+        # The lock is dropped afterwards so only in-flight organizations hold one
+        lock = _stats_locks.setdefault(organization_id, asyncio.Lock())
+        try:
+            async with lock:
+                cached = workspace_stats_cache.get(organization_id)
+                if cached is not None:
+                    return cached
+
+                stats = await self._stats_repo.find_by_organization(organization_id)
+                workspace_stats_cache[organization_id] = stats
+                return stats
+        finally:
+            if _stats_locks.get(organization_id) is lock and not lock.locked():
+                del _stats_locks[organization_id]
 
     async def get_users_paginated(
         self, organization_id: int, params: PaginationParamsDTO
@@ -96,56 +107,62 @@ class WorkspaceDataService:
     async def get_apps_paginated(
         self, organization_id: int, params: PaginationParamsDTO
     ) -> tuple[list[OAuthAppWithStatsDTO], int]:
-        dtos = await self._app_repo.find_paginated_with_stats(
+        dtos, total = await self._app_repo.find_paginated_with_stats(
             organization_id, params.page_size, (params.page - 1) * params.page_size, params.search
         )
-        total = await self._app_repo.count_by_organization(organization_id)
-        
+        # The windowed total is only missing when the page lies past the end
+        if not dtos and params.page > 1:
+            total = await self._app_repo.count_by_organization(
+                organization_id, params.search
+            )
+
         return dtos, total
 
     async def get_app_with_authorizations(
         self, organization_id: int, app_id: int
     ) -> AppWithAuthorizationsDTO | None:
-        app = await self._app_repo.find_by_id(app_id)
-        if not app or app.organization_id != organization_id:
-            return None
-            
-        authorizations = await self._grant_repo.find_by_app_with_users(organization_id, app_id)
-        
-        return AppWithAuthorizationsDTO(
-            id=app.id,
-            name=app.name,
-            client_id=app.client_id,
-            status="active" if app.is_trusted else "review",
-            risk_score=app.risk_score,
-            is_system_app=app.is_system_app,
-            is_trusted=app.is_trusted,
-            all_scopes=app.scopes_summary,
-            active_grants_count=len(authorizations), # Approximate count from loaded auths
-            last_activity_at=None,
-            authorizations=authorizations
-        )
+        return await self._app_repo.find_with_authorizations(organization_id, app_id)
 
     async def get_app_timeline(
         self, organization_id: int, app_id: int, params: PaginationParamsDTO, user_id: int | None = None
-    ) -> tuple[list[OAuthEventResponseDTO], int]:
-        dtos = await self._event_repo.find_paginated_by_app(
+    ) -> tuple[list[OAuthEventResponseDTO], int, str | None]:
+        # A valid cursor seeks past the previous page; otherwise fall back to OFFSET
+        after = decode_cursor(params.cursor) if params.cursor else None
+        dtos, total = await self._event_repo.find_paginated_by_app(
             organization_id, 
             app_id, 
             params.page_size, 
             (params.page - 1) * params.page_size,
-            user_id
+            user_id,
+            after,
         )
-        total = await self._event_repo.count_by_app(organization_id, app_id, user_id)
-        
-        return dtos, total
+        if total is None or (not dtos and params.page > 1):
+            total = await self._event_repo.count_by_app(organization_id, app_id, user_id)
+
+        next_cursor = None
+        if len(dtos) == params.page_size:
+            next_cursor = encode_cursor(dtos[-1].event_time, dtos[-1].id)
+
+        return dtos, total, next_cursor
+
+    async def stream_app_timeline(
+        self, organization_id: int, app_id: int, user_id: int | None = None
+    ) -> AsyncIterator[OAuthEventResponseDTO]:
+        # Runs on its own pooled connection: the request connection is
+        # released before a streaming response body is sent
+        async with self._event_repo_scope() as event_repo:
+            async for event in event_repo.iter_by_app(
+                organization_id, app_id, user_id
+            ):
+                yield event
 
     async def get_connection_settings(
         self, organization_id: int
     ) -> ConnectionSettingsDTO:
-        connections = await self._connection_repo.find_by_organization(organization_id)
-
-        if not connections:
+        settings = await self._connection_repo.find_settings_by_organization(
+            organization_id
+        )
+        if settings is None:
             return ConnectionSettingsDTO(
                 connection_id=None,
                 status=None,
@@ -156,37 +173,28 @@ class WorkspaceDataService:
                 can_sync=False,
                 is_syncing=False,
             )
+        return settings
 
-        connection = connections[0]
-        is_syncing = False
-        can_sync = connection.status == "active"
-
-        last_crawl = await self._crawl_history_repo.find_last_crawl(connection.id)
-        last_sync_completed_at = last_crawl.finished_at if last_crawl else None
-        last_sync_status = last_crawl.status.value if last_crawl else None
-        is_syncing = last_crawl.status.value == "running" if last_crawl else False
-
-        return ConnectionSettingsDTO(
-            connection_id=connection.id,
-            status=connection.status,
-            admin_email=connection.admin_email,
-            workspace_domain=connection.workspace_domain,
-            last_sync_completed_at=last_sync_completed_at,
-            last_sync_status=last_sync_status,
-            can_sync=can_sync,
-            is_syncing=is_syncing,
-        )
+    async def get_dashboard_bundle(
+        self, organization_id: int
+    ) -> tuple[WorkspaceStatsDTO, ConnectionSettingsDTO]:
+        # Both read on the request connection, which serves one query at a time
+        stats = await self.get_workspace_stats(organization_id)
+        settings = await self.get_connection_settings(organization_id)
+        return stats, settings
 
     async def disconnect_workspace(self, organization_id: int) -> bool:
-        connections = await self._connection_repo.find_by_organization(organization_id)
-        if not connections:
+        connection_id = await self._connection_repo.soft_delete_by_organization(
+            organization_id
+        )
+        if connection_id is None:
             return False
 
-        connection = connections[0]
-        await self._connection_repo.soft_delete(connection.id)
+        invalidate_auth_context(connection_id)
+        invalidate_workspace_stats(organization_id)
         logger.info(
             "Workspace disconnected for organization_id=%d connection_id=%d",
             organization_id,
-            connection.id,
+            connection_id,
         )
         return True
@@ -1,5 +1,20 @@
+import base64
+import functools
+import hashlib
 import secrets
 
+from rfernet import Fernet
+
 
 def generate_oauth_state() -> str:
-    return secrets.token_urlsafe(32)
+    # 33 bytes is a multiple of 3, so the urlsafe encoding has no padding to strip
+    return base64.urlsafe_b64encode(secrets.token_bytes(33)).decode("ascii")
+
+
+def hash_token(value: str) -> bytes:
+    return hashlib.sha256(value.encode()).digest()
+
+
+@functools.lru_cache(maxsize=4)
+def get_fernet(encryption_key: str) -> Fernet:
+    return Fernet(encryption_key)
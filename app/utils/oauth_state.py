@@ -1,23 +1,25 @@
 import base64
 import hashlib
 import hmac
-import json
 import secrets
 import time
 from typing import Any
 
+import orjson
+
 from app.core.settings import settings
 
 STATE_EXPIRY_SECONDS = 600  # 10 minutes
 
 
-def _get_signing_key() -> bytes:
-    return settings.jwt_secret_key.encode()
+# Keyed once at import; each signature copies the prepared HMAC state
+_HMAC_PROTOTYPE = hmac.new(settings.jwt_secret_key.encode(), None, hashlib.sha256)
 
 
-def _sign_data(data: str) -> str:
-    signature = hmac.new(_get_signing_key(), data.encode(), hashlib.sha256).hexdigest()
-    return signature
+def _sign_data(data: bytes) -> str:
+    mac = _HMAC_PROTOTYPE.copy()
+    mac.update(data)
+    return mac.hexdigest()
 
 
 def create_signed_state(
@@ -31,10 +33,9 @@ def create_signed_state(
         "frontend_redirect_uri": frontend_redirect_uri,
         "exp": int(time.time()) + STATE_EXPIRY_SECONDS,
     }
-    payload_json = json.dumps(payload, separators=(",", ":"))
-    payload_b64 = base64.urlsafe_b64encode(payload_json.encode()).decode()
+    payload_b64 = base64.urlsafe_b64encode(orjson.dumps(payload))
     signature = _sign_data(payload_b64)
-    return f"{payload_b64}.{signature}"
+    return f"{payload_b64.decode()}.{signature}"
 
 
 def verify_signed_state(state: str) -> dict[str, Any] | None:
@@ -43,14 +44,14 @@ def verify_signed_state(state: str) -> dict[str, Any] | None:
         if len(parts) != 2:
             return None
 
-        payload_b64, signature = parts
+        payload_b64 = parts[0].encode()
+        signature = parts[1]
 
         expected_signature = _sign_data(payload_b64)
         if not hmac.compare_digest(signature, expected_signature):
             return None
 
-        payload_json = base64.urlsafe_b64decode(payload_b64.encode()).decode()
-        payload = json.loads(payload_json)
+        payload = orjson.loads(base64.urlsafe_b64decode(payload_b64))
 
         if payload.get("exp", 0) < int(time.time()):
             return None
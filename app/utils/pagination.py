@@ -0,0 +1,17 @@
+import base64
+import binascii
+from datetime import datetime
+
+
+def encode_cursor(position: datetime, row_id: int) -> str:
+    raw = f"{position.isoformat()}|{row_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode()
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int] | None:
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+        position, _, row_id = raw.rpartition("|")
+        return datetime.fromisoformat(position), int(row_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        return None
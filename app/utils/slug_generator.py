@@ -1,14 +1,17 @@
 import re
 import secrets
 
+_SLUG_INVALID_CHARS = re.compile(r"[^a-z0-9]+")
+_NAME_SEPARATORS = str.maketrans("-_", "  ")
+
 
 def generate_org_slug(domain: str) -> str:
-    base = domain.split(".")[0]
-    base = re.sub(r"[^a-z0-9]+", "-", base.lower()).strip("-")
+    base = domain.split(".", 1)[0]
+    base = _SLUG_INVALID_CHARS.sub("-", base.lower()).strip("-")
     suffix = secrets.token_hex(2)
     return f"{base}-{suffix}"
 
 
 def generate_org_name_from_domain(domain: str) -> str:
-    base = domain.split(".")[0]
-    return base.replace("-", " ").replace("_", " ").title()
+    base = domain.split(".", 1)[0]
+    return base.translate(_NAME_SEPARATORS).title()
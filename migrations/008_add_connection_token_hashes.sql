@@ -0,0 +1,21 @@
+-- ============================================
+-- Connection token hashes for indexed lookups
+-- ============================================
+
+ALTER TABLE identity_provider_connection
+    ADD COLUMN IF NOT EXISTS access_token_hash BYTEA,
+    ADD COLUMN IF NOT EXISTS refresh_token_hash BYTEA;
+
+CREATE UNIQUE INDEX IF NOT EXISTS uq_idp_connection_access_token_hash
+    ON identity_provider_connection(access_token_hash)
+    WHERE deleted_at IS NULL;
+
+CREATE UNIQUE INDEX IF NOT EXISTS uq_idp_connection_refresh_token_hash
+    ON identity_provider_connection(refresh_token_hash)
+    WHERE deleted_at IS NULL;
+
+
+-- Record this migration
+INSERT INTO schema_migrations (version, name) 
+VALUES ('008', 'add_connection_token_hashes')
+ON CONFLICT (version) DO NOTHING;
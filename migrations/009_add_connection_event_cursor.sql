@@ -0,0 +1,12 @@
+-- ============================================
+-- Stream polling watermark per connection
+-- ============================================
+
+ALTER TABLE identity_provider_connection
+    ADD COLUMN IF NOT EXISTS last_event_cursor TIMESTAMPTZ;
+
+
+-- Record this migration
+INSERT INTO schema_migrations (version, name) 
+VALUES ('009', 'add_connection_event_cursor')
+ON CONFLICT (version) DO NOTHING;
@@ -0,0 +1,13 @@
+-- ============================================
+-- Case-insensitive email lookup for sign-in
+-- ============================================
+
+CREATE INDEX IF NOT EXISTS idx_user_email_lower
+    ON "user"(LOWER(email))
+    WHERE deleted_at IS NULL;
+
+
+-- Record this migration
+INSERT INTO schema_migrations (version, name) 
+VALUES ('010', 'add_user_email_lower_index')
+ON CONFLICT (version) DO NOTHING;
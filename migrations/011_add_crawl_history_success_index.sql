@@ -0,0 +1,12 @@
+-- ============================================
+-- Last successful crawl lookup per connection and type
+-- ============================================
+
+CREATE INDEX IF NOT EXISTS idx_crawl_history_last_success
+    ON crawl_history(connection_id, crawl_type, status, finished_at DESC);
+
+
+-- Record this migration
+INSERT INTO schema_migrations (version, name) 
+VALUES ('011', 'add_crawl_history_success_index')
+ON CONFLICT (version) DO NOTHING;
@@ -0,0 +1,12 @@
+-- ============================================
+-- Keyset pagination for app event timelines
+-- ============================================
+
+CREATE INDEX IF NOT EXISTS idx_oauth_event_app_timeline
+    ON oauth_event(organization_id, app_id, event_time DESC, id DESC);
+
+
+-- Record this migration
+INSERT INTO schema_migrations (version, name) 
+VALUES ('012', 'add_oauth_event_timeline_index')
+ON CONFLICT (version) DO NOTHING;
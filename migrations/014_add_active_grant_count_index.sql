@@ -0,0 +1,13 @@
+-- ============================================
+-- Active grant count per organization
+-- ============================================
+
+CREATE INDEX IF NOT EXISTS idx_app_grant_org_active
+    ON app_grant(organization_id)
+    WHERE status = 'active';
+
+
+-- Record this migration
+INSERT INTO schema_migrations (version, name)
+VALUES ('014', 'add_active_grant_count_index')
+ON CONFLICT (version) DO NOTHING;
@@ -1,20 +1,27 @@
-from fastapi.testclient import TestClient
-from app.main import app
+def main() -> None:
+    # Imported here so that importing this module doesn't load the app or httpx
+    from fastapi.testclient import TestClient
 
-client = TestClient(app)
+    from app.main import app
 
-print("Attempting to fetch /health...")
-try:
-    response = client.get("/health")
-    print(f"/health status: {response.status_code}")
-    print(f"/health content: {response.json()}")
-except Exception as e:
-    print(f"CRASH on /health: {e}")
+    client = TestClient(app)
 
-print("Attempting to fetch /docs...")
-try:
-    response = client.get("/docs")
-    print(f"/docs status: {response.status_code}")
-    # Don't print content as it is HTML
-except Exception as e:
-    print(f"CRASH on /docs: {e}")
+    print("Attempting to fetch /health...")
+    try:
+        response = client.get("/health")
+        print(f"/health status: {response.status_code}")
+        print(f"/health content: {response.json()}")
+    except Exception as e:
+        print(f"CRASH on /health: {e}")
+
+    print("Attempting to fetch /docs...")
+    try:
+        response = client.get("/docs")
+        print(f"/docs status: {response.status_code}")
+        # Don't print content as it is HTML
+    except Exception as e:
+        print(f"CRASH on /docs: {e}")
+
+
+if __name__ == "__main__":
+    main()